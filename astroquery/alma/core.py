@@ -4,10 +4,10 @@ import os.path
 import keyring
 import numpy as np
 import re
-import tarfile
 import string
 import requests
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pkg_resources import resource_filename
 from bs4 import BeautifulSoup
 import pyvo
@@ -24,8 +24,9 @@ from pyvo.dal.sia2 import SIA_PARAMETERS_DESC
 
 from ..exceptions import LoginError
 from ..utils import commons
+from ..utils.archives import iter_extract
 from ..utils.process_asyncs import async_to_sync
-from ..query import QueryWithLogin
+from ..query import QueryWithLogin, conf as query_conf
 from .tapsql import _gen_pos_sql, _gen_str_sql, _gen_numeric_sql,\
     _gen_band_list_sql, _gen_datetime_sql, _gen_pol_sql, _gen_pub_sql,\
     _gen_science_sql, _gen_spec_res_sql, ALMA_DATE_FORMAT
@@ -713,9 +714,9 @@ class AlmaClass(QueryWithLogin):
         else:
             auth = None
 
-        downloaded_files = []
         if savedir is None:
             savedir = self.cache_location
+        downloads = []
         for file_link in unique(files):
             log.debug("Downloading {0} to {1}".format(file_link, savedir))
             try:
@@ -742,8 +743,43 @@ class AlmaClass(QueryWithLogin):
             if savedir is not None:
                 filename = os.path.join(savedir,
                                         filename)
+            downloads.append((file_link, filename))
 
-            try:
+        results = self._download_files(downloads,
+                                       timeout=self.TIMEOUT,
+                                       auth=auth,
+                                       cache=cache,
+                                       method='GET',
+                                       continuation=continuation,
+                                       return_exceptions=True)
+
+        downloaded_files = []
+        for (file_link, filename), result in zip(downloads, results):
+            if not isinstance(result, Exception):
+                downloaded_files.append(filename)
+                continue
+
+            ex = result
+            if not isinstance(ex, requests.HTTPError):
+                raise ex
+            if ex.response.status_code == 401:
+                if skip_unauthorized:
+                    log.info("Access denied to {url}.  Skipping to"
+                             " next file".format(url=file_link))
+                    continue
+                else:
+                    raise(ex)
+            elif ex.response.status_code == 403:
+                log.error("Access denied to {url}".format(url=file_link))
+                if 'dataPortal' in file_link and 'sso' not in file_link:
+                    log.error("The URL may be incorrect.  Try using "
+                              "{0} instead of {1}"
+                              .format(file_link.replace('dataPortal/',
+                                                        'dataPortal/sso/'),
+                                      file_link))
+                raise ex
+            elif ex.response.status_code == 500:
+                # empirically, this works the second time most of the time...
                 self._download_file(file_link,
                                     filename,
                                     timeout=self.TIMEOUT,
@@ -754,37 +790,8 @@ class AlmaClass(QueryWithLogin):
                                     continuation=continuation)
 
                 downloaded_files.append(filename)
-            except requests.HTTPError as ex:
-                if ex.response.status_code == 401:
-                    if skip_unauthorized:
-                        log.info("Access denied to {url}.  Skipping to"
-                                 " next file".format(url=file_link))
-                        continue
-                    else:
-                        raise(ex)
-                elif ex.response.status_code == 403:
-                    log.error("Access denied to {url}".format(url=file_link))
-                    if 'dataPortal' in file_link and 'sso' not in file_link:
-                        log.error("The URL may be incorrect.  Try using "
-                                  "{0} instead of {1}"
-                                  .format(file_link.replace('dataPortal/',
-                                                            'dataPortal/sso/'),
-                                          file_link))
-                    raise ex
-                elif ex.response.status_code == 500:
-                    # empirically, this works the second time most of the time...
-                    self._download_file(file_link,
-                                        filename,
-                                        timeout=self.TIMEOUT,
-                                        auth=auth,
-                                        cache=cache,
-                                        method='GET',
-                                        head_safe=False,
-                                        continuation=continuation)
-
-                    downloaded_files.append(filename)
-                else:
-                    raise ex
+            else:
+                raise ex
         return downloaded_files
 
     def _parse_result(self, response, verbose=False):
@@ -1012,7 +1019,8 @@ class AlmaClass(QueryWithLogin):
         """
         Given a list of successfully downloaded tarballs, extract files
         with names matching a specified regular expression.  The default
-        is to extract all FITS files
+        is to extract all FITS files.  The tarballs are extracted
+        concurrently, each of them in a single pass.
 
         NOTE: alma now supports direct listing and downloads of tarballs. See
         ``get_data_info`` and ``download_and_extract_files``
@@ -1043,19 +1051,29 @@ class AlmaClass(QueryWithLogin):
 
         fitsre = re.compile(regex)
 
-        filelist = []
-
-        for fn in downloaded_files:
-            tf = tarfile.open(fn)
-            for member in tf.getmembers():
-                if fitsre.match(member.name):
-                    if verbose:
-                        log.info("Extracting {0} to {1}".format(member.name,
-                                                                path))
-                    tf.extract(member, path)
-                    filelist.append(os.path.join(path, member.name))
-
-        return filelist
+        def extract_tarball(fn):
+            # the tarball is read once, only the matching members are written
+            filelist = []
+            for name, local_path in iter_extract(fn, path, select=fitsre):
+                if verbose:
+                    log.info("Extracted {0} to {1}".format(name, path))
+                filelist.append(local_path)
+            return filelist
+
+        downloaded_files = list(downloaded_files)
+        if not downloaded_files:
+            return []
+        max_workers = min(query_conf.max_workers, len(downloaded_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(extract_tarball, fn)
+                       for fn in downloaded_files]
+            try:
+                return [local_path for future in futures
+                        for local_path in future.result()]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def download_and_extract_files(self, urls, delete=True, regex=r'.*\.fits$',
                                    include_asdm=False, path='cache_path',
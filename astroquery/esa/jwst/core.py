@@ -30,6 +30,7 @@ from astroquery.ipac.ned import Ned
 from astroquery.query import BaseQuery
 from astroquery.simbad import Simbad
 from astroquery.utils import commons
+from astroquery.utils.archives import extract
 from astroquery.utils.tap import TapPlus
 from astroquery.vizier import Vizier
 from . import conf
@@ -658,6 +659,22 @@ class JwstClass(BaseQuery):
         """
         return self.__jwsttap.logout(verbose)
 
+    @property
+    def instrumentation(self):
+        """The astroquery.instrumentation.Instrumentation of the requests
+        sent to JWST TAP, to which exporters can be added
+        """
+        return self.__jwsttap.instrumentation
+
+    def stats(self):
+        """Returns the summary of the requests sent to JWST TAP
+
+        Returns
+        -------
+        An astropy.table.Table
+        """
+        return self.__jwsttap.stats()
+
     def set_token(self, token):
         """Links a MAST token to the logged user
 
@@ -1041,12 +1058,9 @@ class JwstClass(BaseQuery):
                         files.append(os.path.join(r, file))
 
     def __extract_file(self, output_file_full_path, output_dir, files):
-        if tarfile.is_tarfile(output_file_full_path):
-            with tarfile.open(output_file_full_path) as tar_ref:
-                tar_ref.extractall(path=output_dir)
-        elif zipfile.is_zipfile(output_file_full_path):
-            with zipfile.ZipFile(output_file_full_path, 'r') as zip_ref:
-                zip_ref.extractall(output_dir)
+        if (tarfile.is_tarfile(output_file_full_path)
+                or zipfile.is_zipfile(output_file_full_path)):
+            extract(output_file_full_path, output_dir)
         elif not JwstClass.is_gz_file(output_file_full_path):
             # single file: return it
             files.append(output_file_full_path)
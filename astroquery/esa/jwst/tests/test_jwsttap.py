@@ -226,6 +226,13 @@ class TestTap:
         tap.list_async_jobs(verbose=True)
         dummyTapHandler.check_call('list_async_jobs', parameters)
 
+    def test_stats(self):
+        tapplus = TapPlus("http://test:1111/tap")
+        tap = JwstClass(tap_plus_handler=tapplus, show_messages=False)
+        # the requests are sent by the TapPlus handler
+        assert tap.instrumentation is tapplus.instrumentation
+        assert len(tap.stats()) == 0
+
     def test_query_region(self):
         connHandler = DummyConnHandler()
         tapplus = TapPlus("http://test:1111/tap", connhandler=connHandler)
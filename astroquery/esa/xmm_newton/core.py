@@ -18,7 +18,6 @@ from ...query import BaseQuery, QueryWithLogin
 import shutil
 import cgi
 from pathlib import Path
-import tarfile
 import os
 import configparser
 
@@ -26,6 +25,7 @@ from astropy.io import fits
 from . import conf
 from astroquery import log
 from astropy.coordinates import SkyCoord
+from ...utils.archives import iter_extract
 from ...exceptions import LoginError
 
 __all__ = ['XMMNewton', 'XMMNewtonClass']
@@ -352,6 +352,23 @@ class XMMNewtonClass(BaseQuery):
         ret["Z"] = filename[28:]
         return ret
 
+    def _parse_pps_member(self, member_name):
+        """Parses the name of a member of a PPS tarfile
+
+        Returns
+        -------
+        The dictionary of the fields of the file's name (see
+        `_parse_filename`) when the member is a product of the pps directory,
+        None otherwise
+        """
+        paths = os.path.split(member_name)
+        if os.path.split(paths[0])[1] != "pps":
+            return None
+        fname_info = self._parse_filename(paths[1])
+        if fname_info["X"] != "P":
+            return None
+        return fname_info
+
     def get_epic_spectra(self, filename, source_number, *,
                          instrument=[], path="", verbose=False):
         """Extracts in path (when set) the EPIC sources spectral products from a
@@ -405,64 +422,59 @@ class XMMNewtonClass(BaseQuery):
                     instrument.remove(inst)
         if path != "" and os.path.exists(path):
             _path = path
+
+        def select(member_name):
+            fname_info = self._parse_pps_member(member_name)
+            return (fname_info is not None
+                    and fname_info["I"] in instrument
+                    and fname_info["T"] in _product_type
+                    and int(fname_info["X-"], 16) == source_number)
+
         try:
-            with tarfile.open(filename, "r") as tar:
-                ret = {}
-                for member in tar.getmembers():
-                    paths = os.path.split(member.name)
-                    fname = paths[1]
-                    paths = os.path.split(paths[0])
-                    if paths[1] != "pps":
-                        continue
-                    fname_info = self._parse_filename(fname)
-                    if fname_info["X"] != "P":
-                        continue
-                    if not fname_info["I"] in instrument:
-                        continue
-                    if not fname_info["T"] in _product_type:
-                        continue
-                    if int(fname_info["X-"], 16) != source_number:
-                        continue
-                    tar.extract(member, _path)
-                    key = fname_info["I"]
-                    path_inst_name = os.path.abspath(os.path.join(_path, member.name))
-                    if fname_info["T"] == "BGSPEC":
-                        key = fname_info["I"] + "_bkg"
-                    elif fname_info["T"] == "SRCARF":
-                        key = fname_info["I"] + "_arf"
-                    else:
-                        with fits.open(path_inst_name) as hdul:
-                            for ext in hdul:
-                                if ext.name != "SPECTRUM":
-                                    continue
-                                rmf_fname = ext.header["RESPFILE"]
-                                if fname_info["I"] == "M1" or fname_info["I"] == "M2":
-                                    inst = "MOS/" + str(ext.header["SPECDELT"]) + "eV/"
-                                elif fname_info["I"] == "PN":
-                                    inst = "PN/"
-                                    file_name, file_ext = os.path.splitext(rmf_fname)
-                                    rmf_fname = file_name + "_v18.0" + file_ext
-
-                                link = self._rmf_ftp + inst + rmf_fname
-
-                                if verbose:
-                                    log.info("rmf link is: %s" % link)
-
-                                response = self._request('GET', link)
-
-                                rsp_filename = os.path.join(_path, paths[0], paths[1], ext.header["RESPFILE"])
-
-                                with open(rsp_filename, 'wb') as f:
-                                    f.write(response.content)
-                                    ret[fname_info["I"] + "_rmf"] = rsp_filename
-
-                    if ret.get(key) and type(ret.get(key)) == str:
-                        log.warning("More than one file found with the instrument: %s" % key)
-                        ret[key] = [ret[key], path_inst_name]
-                    elif ret.get(key) and type(ret.get(key)) == list:
-                        ret[key].append(path_inst_name)
-                    else:
-                        ret[key] = path_inst_name
+            ret = {}
+            # the tarfile is read once, only the selected products are written
+            for member_name, member_path in iter_extract(filename, _path, select=select):
+                paths = os.path.split(os.path.dirname(member_name))
+                fname_info = self._parse_pps_member(member_name)
+                key = fname_info["I"]
+                path_inst_name = os.path.abspath(member_path)
+                if fname_info["T"] == "BGSPEC":
+                    key = fname_info["I"] + "_bkg"
+                elif fname_info["T"] == "SRCARF":
+                    key = fname_info["I"] + "_arf"
+                else:
+                    with fits.open(path_inst_name) as hdul:
+                        for ext in hdul:
+                            if ext.name != "SPECTRUM":
+                                continue
+                            rmf_fname = ext.header["RESPFILE"]
+                            if fname_info["I"] == "M1" or fname_info["I"] == "M2":
+                                inst = "MOS/" + str(ext.header["SPECDELT"]) + "eV/"
+                            elif fname_info["I"] == "PN":
+                                inst = "PN/"
+                                file_name, file_ext = os.path.splitext(rmf_fname)
+                                rmf_fname = file_name + "_v18.0" + file_ext
+
+                            link = self._rmf_ftp + inst + rmf_fname
+
+                            if verbose:
+                                log.info("rmf link is: %s" % link)
+
+                            response = self._request('GET', link)
+
+                            rsp_filename = os.path.join(_path, paths[0], paths[1], ext.header["RESPFILE"])
+
+                            with open(rsp_filename, 'wb') as f:
+                                f.write(response.content)
+                                ret[fname_info["I"] + "_rmf"] = rsp_filename
+
+                if ret.get(key) and type(ret.get(key)) == str:
+                    log.warning("More than one file found with the instrument: %s" % key)
+                    ret[key] = [ret[key], path_inst_name]
+                elif ret.get(key) and type(ret.get(key)) == list:
+                    ret[key].append(path_inst_name)
+                else:
+                    ret[key] = path_inst_name
 
         except FileNotFoundError:
             log.error("File %s not found" % (filename))
@@ -551,43 +563,37 @@ class XMMNewtonClass(BaseQuery):
                 if inst not in _instrument:
                     log.warning("Invalid instrument %s" % inst)
                     instrument.remove(inst)
+
+        def select(member_name):
+            fname_info = self._parse_pps_member(member_name)
+            return (fname_info is not None
+                    and fname_info["I"] in instrument
+                    and int(fname_info["S"]) in band
+                    and fname_info["T"] in _product_type)
+
         try:
-            with tarfile.open(filename, "r") as tar:
-                ret = {}
-                for member in tar.getmembers():
-                    paths = os.path.split(member.name)
-                    fname = paths[1]
-                    paths = os.path.split(paths[0])
-                    if paths[1] != "pps":
-                        continue
-                    fname_info = self._parse_filename(fname)
-                    if fname_info["X"] != "P":
-                        continue
-                    if not fname_info["I"] in instrument:
-                        continue
-                    if not int(fname_info["S"]) in band:
-                        continue
-                    if not fname_info["T"] in _product_type:
-                        continue
-                    tar.extract(member, _path)
-                    if not ret.get(int(fname_info["S"])):
-                        ret[int(fname_info["S"])] = {}
-                    b = int(fname_info["S"])
-                    ins = fname_info["I"]
-                    path_member_name = os.path.abspath(os.path.join(_path, member.name))
-                    if fname_info["T"] == "DETMSK":
-                        ins = fname_info["I"] + "_det"
-                    elif fname_info["T"] == "EXPMAP":
-                        ins = fname_info["I"] + "_expo"
-                    if ret[b].get(ins) and type(ret[b].get(ins)) == str:
-                        log.warning("More than one file found with the "
-                                    "band %u and "
-                                    "the instrument: %s" % (b, ins))
-                        ret[b][ins] = [ret[b][ins], path_member_name]
-                    elif ret[b].get(ins) and type(ret[b].get(ins)) == list:
-                        ret[b][ins].append(path_member_name)
-                    else:
-                        ret[b][ins] = path_member_name
+            ret = {}
+            # the tarfile is read once, only the selected products are written
+            for member_name, member_path in iter_extract(filename, _path, select=select):
+                fname_info = self._parse_pps_member(member_name)
+                if not ret.get(int(fname_info["S"])):
+                    ret[int(fname_info["S"])] = {}
+                b = int(fname_info["S"])
+                ins = fname_info["I"]
+                path_member_name = os.path.abspath(member_path)
+                if fname_info["T"] == "DETMSK":
+                    ins = fname_info["I"] + "_det"
+                elif fname_info["T"] == "EXPMAP":
+                    ins = fname_info["I"] + "_expo"
+                if ret[b].get(ins) and type(ret[b].get(ins)) == str:
+                    log.warning("More than one file found with the "
+                                "band %u and "
+                                "the instrument: %s" % (b, ins))
+                    ret[b][ins] = [ret[b][ins], path_member_name]
+                elif ret[b].get(ins) and type(ret[b].get(ins)) == list:
+                    ret[b][ins].append(path_member_name)
+                else:
+                    ret[b][ins] = path_member_name
 
         except FileNotFoundError:
             log.error("File %s not found" % (filename))
@@ -727,39 +733,31 @@ class XMMNewtonClass(BaseQuery):
         if path != "" and os.path.exists(path):
             _path = path
 
+        def select(member_name):
+            fname_info = self._parse_pps_member(member_name)
+            return (fname_info is not None
+                    and fname_info["I"] in instrument
+                    and int(fname_info["S"]) in _band
+                    and fname_info["T"] in _product_type
+                    and int(fname_info["X-"], 16) == source_number)
+
         try:
-            with tarfile.open(filename, "r") as tar:
-                ret = {}
-                for member in tar.getmembers():
-                    paths = os.path.split(member.name)
-                    fname = paths[1]
-                    paths = os.path.split(paths[0])
-                    if paths[1] != "pps":
-                        continue
-                    fname_info = self._parse_filename(fname)
-                    if fname_info["X"] != "P":
-                        continue
-                    if not fname_info["I"] in instrument:
-                        continue
-                    if not int(fname_info["S"]) in _band:
-                        continue
-                    if not fname_info["T"] in _product_type:
-                        continue
-                    if int(fname_info["X-"], 16) != source_number:
-                        continue
-                    tar.extract(member, _path)
-                    key = fname_info["I"]
-                    path_inst_name = os.path.abspath(os.path.join(_path, member.name))
-                    if fname_info["T"] == "FBKTSR":
-                        key = fname_info["I"] + "_bkg"
-                    if ret.get(key) and type(ret.get(key)) == str:
-                        log.warning("More than one file found with the "
-                                    "instrument: %s" % key)
-                        ret[key] = [ret[key], path_inst_name]
-                    elif ret.get(key) and type(ret.get(key)) == list:
-                        ret[key].append(path_inst_name)
-                    else:
-                        ret[key] = path_inst_name
+            ret = {}
+            # the tarfile is read once, only the selected products are written
+            for member_name, member_path in iter_extract(filename, _path, select=select):
+                fname_info = self._parse_pps_member(member_name)
+                key = fname_info["I"]
+                path_inst_name = os.path.abspath(member_path)
+                if fname_info["T"] == "FBKTSR":
+                    key = fname_info["I"] + "_bkg"
+                if ret.get(key) and type(ret.get(key)) == str:
+                    log.warning("More than one file found with the "
+                                "instrument: %s" % key)
+                    ret[key] = [ret[key], path_inst_name]
+                elif ret.get(key) and type(ret.get(key)) == list:
+                    ret[key].append(path_inst_name)
+                else:
+                    ret[key] = path_inst_name
 
         except FileNotFoundError:
             log.error("File %s not found" % (filename))
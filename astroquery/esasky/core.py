@@ -2,22 +2,22 @@
 
 import json
 import os
-import tarfile
 import sys
 import re
-from io import BytesIO
-from zipfile import ZipFile
+from concurrent.futures import ThreadPoolExecutor
 
 from astropy.io import fits
+from astropy.utils.data import conf as data_conf
 from astroquery import log
 import astropy.units
 from requests import HTTPError
 from requests import ConnectionError
 
-from ..query import BaseQuery
+from ..query import BaseQuery, conf as query_conf
 from ..utils.tap.core import TapPlus
 from ..utils import commons
 from ..utils import async_to_sync
+from ..utils.archives import iter_extract
 from . import conf
 from .. import version
 from astropy.coordinates.name_resolve import sesame_database
@@ -72,7 +72,6 @@ class ESASkyClass(BaseQuery):
     _MAPS_DOWNLOAD_DIR = "Maps"
     _SPECTRA_DOWNLOAD_DIR = "Spectra"
     _isTest = ""
-    _cached_tables = None
 
     _NUMBER_DATA_TYPES = ["REAL", "float", "INTEGER", "int", "BIGINT", "long", "DOUBLE", "double", "SMALLINT", "short"]
 
@@ -87,6 +86,10 @@ class ESASkyClass(BaseQuery):
         else:
             self._tap = tap_handler
 
+        # tables and descriptors fetched during the session, the tables being keyed by only_names
+        self._cached_tables = {}
+        self._cached_descriptors = {}
+
     def query(self, query, *, output_file=None, output_format="votable", verbose=False):
         """Launches a synchronous job to query the ESASky TAP
 
@@ -128,13 +131,15 @@ class ESASkyClass(BaseQuery):
         A list of tables
         """
 
-        if cache and self._cached_tables is not None:
-            tables = self._cached_tables
-        else:
+        tables = None
+        if cache:
+            # the tables loaded with their columns also give the names
+            tables = self._cached_tables.get(only_names, self._cached_tables.get(False))
+        if tables is None:
             tables = self._tap.load_tables(only_names=only_names,
                                            include_shared_tables=False,
                                            verbose=verbose)
-            self._cached_tables = tables
+            self._cached_tables[only_names] = tables
         if only_names:
             return [t.name for t in tables]
         else:
@@ -520,6 +525,7 @@ class ESASkyClass(BaseQuery):
         top = ""
         if sanitized_row_limit > 0:
             top = "TOP {row_limit} ".format(row_limit=sanitized_row_limit)
+        queries = []
         for name in sanitized_missions:
             data_table = self._find_mission_tap_table_name(sso_json, name)
             mission_json = self._find_mission_parameters_in_json(data_table, sso_json)
@@ -530,7 +536,10 @@ class ESASkyClass(BaseQuery):
                     'AND c.sso_type = \'{sso_type}\'' \
                 .format(top=top, data_table=data_table, x_match_table=x_match_table,
                         sso_db_identifier=sso_db_identifier, sso_name=sso['sso_name'], sso_type=sso_type)
-            table = self.query(query)
+            queries.append(query)
+
+        tables = self._map_concurrently(self.query, queries)
+        for name, table in zip(sanitized_missions, tables):
             if len(table) > 0:
                 query_result[name.upper()] = table
 
@@ -1435,6 +1444,8 @@ class ESASkyClass(BaseQuery):
                                                                download_dir)
             log.info("Starting download of {} data. ({} files)".format(
                 mission, len(maps_table[url_key])))
+            directory_path = mission_directory + "/"
+            products = []
             for index in range(len(maps_table)):
                 product_url = maps_table[url_key][index]
                 if isinstance(product_url, bytes):
@@ -1447,71 +1458,38 @@ class ESASkyClass(BaseQuery):
                     observation_id = maps_table[self._get_json_data_for_mission(json, mission)["uniqueIdentifierField"]][index]
                     if isinstance(observation_id, bytes):
                         observation_id = observation_id.decode('utf-8')
+                products.append((product_url, observation_id))
+
+            def download(product):
+                product_url, observation_id = product
                 log.info("Downloading Observation ID: {} from {}"
                          .format(observation_id, product_url))
                 sys.stdout.flush()
-                directory_path = mission_directory + "/"
-                if mission.lower() == self.__HERSCHEL_STRING:
-                    try:
-                        if is_spectra:
-                            key = maps_table['observation_id'][index]
-                            if isinstance(key, bytes):
-                                key = key.decode('utf-8')
-                            maps[key] = self._get_herschel_spectra(
-                                product_url,
-                                directory_path,
-                                cache)
-                        else:
-                            maps.append(self._get_herschel_map(
-                                product_url,
-                                directory_path,
-                                cache))
-                        log.info("[Done]")
-                    except HTTPError as err:
-                        log.error("Download failed with {}.".format(err))
+                try:
+                    if mission.lower() == self.__HERSCHEL_STRING:
                         if is_spectra:
-                            key = maps_table['observation_id'][index]
-                            if isinstance(key, bytes):
-                                key = key.decode('utf-8')
-                            maps[key] = None
+                            result = self._get_herschel_spectra(product_url, directory_path, cache)
                         else:
-                            maps.append(None)
-
+                            result = self._get_herschel_map(product_url, directory_path, cache)
+                    else:
+                        result = self._get_mission_maps(mission, product_url, directory_path, cache)
+                    log.info("[Done]")
+                    return result
+                except (HTTPError, ConnectionError) as err:
+                    log.error("Download failed with {}.".format(err))
+                    return None
+
+            max_workers = min(query_conf.max_workers, len(products))
+            self._size_connection_pool(max_workers)
+            results = self._map_concurrently(download, products, max_workers=max_workers)
+
+            for (_, observation_id), result in zip(products, results):
+                if isinstance(maps, dict):
+                    maps[observation_id] = result
+                elif mission.lower() == self.__HERSCHEL_STRING or result is None:
+                    maps.append(result)
                 else:
-                    try:
-                        response = self._request(
-                            'GET',
-                            product_url,
-                            cache=cache,
-                            stream=True,
-                            headers=self._get_header())
-
-                        response.raise_for_status()
-
-                        if mission.lower() == "integral":
-                            with ZipFile(file=BytesIO(response.content)) as zip:
-                                for info in zip.infolist():
-                                    if self._ends_with_fits_like_extentsion(info.filename):
-                                        maps.append(fits.open(zip.extract(info.filename)))
-                        else:
-                            file_name = self._extract_file_name_from_response_header(response.headers)
-                            if (file_name == ""):
-                                file_name = self._extract_file_name_from_url(product_url)
-                            if(file_name.lower().endswith(self.__TAR_STRING)):
-                                with tarfile.open(fileobj=BytesIO(response.content)) as tar:
-                                    for member in tar.getmembers():
-                                        tar.extract(member, directory_path)
-                                        maps.append(fits.open(directory_path + member.name))
-                            else:
-                                fits_data = response.content
-                                with open(directory_path + file_name, 'wb') as fits_file:
-                                    fits_file.write(fits_data)
-                                    fits_file.flush()
-                                    maps.append(fits.open(directory_path + file_name))
-                        log.info("[Done]")
-                    except (HTTPError, ConnectionError) as err:
-                        log.error("Download failed with {}.".format(err))
-                        maps.append(None)
+                    maps.extend(self._open_fits(path) for path in result)
 
             if None in maps:
                 log.error("Some downloads were unsuccessful, please check "
@@ -1521,6 +1499,81 @@ class ESASkyClass(BaseQuery):
 
         return maps
 
+    def _get_mission_maps(self, mission, product_url, directory_path, cache):
+        """
+        Downloads the product of a mission other than Herschel, and returns the paths of its FITS files.
+        """
+        response, product_path = self._open_product(product_url, directory_path)
+
+        if mission.lower() == "integral":
+            select = self._ends_with_fits_like_extentsion
+        elif product_path.lower().endswith(self.__TAR_STRING):
+            select = None
+        else:
+            return [self._download_product(response, product_path, cache)]
+
+        return [path for _, path in self._extract_product(response, product_path, directory_path,
+                                                          cache, select=select)]
+
+    def _open_product(self, product_url, directory_path):
+        """
+        Requests a product as a stream, and returns the response with the local path of the product.
+
+        The file name is taken from the Content-Disposition header, or else from the URL.
+        """
+        response = self._request('GET', product_url, cache=False, stream=True,
+                                 headers=self._get_header())
+        response.raise_for_status()
+
+        file_name = self._extract_file_name_from_response_header(response.headers)
+        if (file_name == ""):
+            file_name = self._extract_file_name_from_url(product_url)
+        return response, directory_path + file_name
+
+    def _is_cached(self, response, product_path, cache):
+        # with ``cache``, a file already downloaded with the size announced by the server is not
+        # downloaded again
+        length = response.headers.get('Content-Length')
+        if (cache and length is not None and os.path.exists(product_path)
+                and os.stat(product_path).st_size == int(length)):
+            log.info("Found cached file {}.".format(product_path))
+            return True
+        return False
+
+    def _download_product(self, response, product_path, cache):
+        """
+        Streams a product to ``product_path`` by blocks, and returns its local path.
+        """
+        if not self._is_cached(response, product_path, cache):
+            with open(product_path, 'wb') as product_file:
+                for block in response.iter_content(data_conf.download_block_size):
+                    product_file.write(block)
+        response.close()
+        return product_path
+
+    def _extract_product(self, response, product_path, directory_path, cache, select=None):
+        """
+        Extracts the files of an archive product to ``directory_path`` while it is streamed, and yields
+        their names in the archive and their local paths.
+
+        The archive itself is only written to ``product_path`` with ``cache``, in which case an archive
+        already downloaded is extracted without being downloaded again.
+        """
+        try:
+            if self._is_cached(response, product_path, cache):
+                source, save_to = product_path, None
+            else:
+                source = response.iter_content(data_conf.download_block_size)
+                save_to = product_path if cache else None
+            yield from iter_extract(source, directory_path, select=select, save_to=save_to,
+                                    ordered=True)
+        finally:
+            response.close()
+
+    def _open_fits(self, path):
+        # the HDUs are only read when they are accessed
+        return fits.open(path, memmap=True, lazy_load_hdus=True)
+
     def _ends_with_fits_like_extentsion(self, name):
         lower_case_name = name.lower()
         return (lower_case_name.endswith("fits")
@@ -1535,62 +1588,56 @@ class ESASkyClass(BaseQuery):
 
     def _get_herschel_map(self, product_url, directory_path, cache):
         observation = dict()
-        response = self._request('GET', product_url, cache=cache,
-                                 stream=True, headers=self._get_header())
-        response.raise_for_status()
+        response, product_path = self._open_product(product_url, directory_path)
+
+        def select(member_name):
+            member_name = member_name.lower()
+            return 'hspire' in member_name or 'hpacs' in member_name
 
-        with tarfile.open(fileobj=BytesIO(response.content)) as tar:
-            for member in tar.getmembers():
-                member_name = member.name.lower()
-                if ('hspire' in member_name or 'hpacs' in member_name):
-                    herschel_filter = self._get_herschel_filter_name(member_name)
-                    tar.extract(member, directory_path)
-                    observation[herschel_filter] = fits.open(
-                        directory_path + member.name
-                    )
+        for member_name, path in self._extract_product(response, product_path, directory_path,
+                                                       cache, select=select):
+            herschel_filter = self._get_herschel_filter_name(member_name.lower())
+            observation[herschel_filter] = self._open_fits(path)
         return observation
 
     def _get_herschel_spectra(self, product_url, directory_path, cache):
         spectra = dict()
-        response = self._request('GET', product_url, cache=cache,
-                                 stream=True, headers=self._get_header())
-
-        response.raise_for_status()
-
-        with tarfile.open(fileobj=BytesIO(response.content)) as tar:
-            for member in tar.getmembers():
-                member_name = member.name.lower()
-                if ('hspire' in member_name or 'hpacs' in member_name
-                    or 'hhifi' in member_name):
-                    herschel_filter = self._get_herschel_filter_name(member_name)
-                    tar.extract(member, directory_path)
-                    herschel_fits = []
-                    if (herschel_filter in spectra):
-                        hdul = fits.open(directory_path + member.name)
-                        herschel_fits.append(hdul)
-                    else:
-                        herschel_fits = fits.open(directory_path + member.name)
-                        if (isinstance(herschel_fits, list)):
-                            herschel_fits = [herschel_fits]
-
-                    hduListType = {}
-                    for hduList in herschel_fits:
-                        if (hduList[0].header['INSTRUME'] == 'HIFI'):
-                            if ('BACKEND' in hduList[0].header):
-                                headerKey = 'BACKEND'
-                                label = hduList[0].header[headerKey].upper()
-                            if ('SIDEBAND' in hduList[0].header):
-                                headerKey = 'SIDEBAND'
-                                label = label + '_{}'.format(hduList[0].header[headerKey].upper())
-                            if ('BAND' in hduList[0].header):
-                                headerKey = 'BAND'
-                                label = label + '_{}'.format(hduList[0].header[headerKey].lower())
-                            hduListType[label] = hduList
-                        else:
-                            headerKey = 'TYPE'
-                            hduListType[hduList[0].header[headerKey]] = hduList
+        response, product_path = self._open_product(product_url, directory_path)
+
+        def select(member_name):
+            member_name = member_name.lower()
+            return 'hspire' in member_name or 'hpacs' in member_name or 'hhifi' in member_name
+
+        for member_name, path in self._extract_product(response, product_path, directory_path,
+                                                       cache, select=select):
+            herschel_filter = self._get_herschel_filter_name(member_name.lower())
+            herschel_fits = []
+            if (herschel_filter in spectra):
+                hdul = self._open_fits(path)
+                herschel_fits.append(hdul)
+            else:
+                herschel_fits = self._open_fits(path)
+                if (isinstance(herschel_fits, list)):
+                    herschel_fits = [herschel_fits]
+
+            hduListType = {}
+            for hduList in herschel_fits:
+                if (hduList[0].header['INSTRUME'] == 'HIFI'):
+                    if ('BACKEND' in hduList[0].header):
+                        headerKey = 'BACKEND'
+                        label = hduList[0].header[headerKey].upper()
+                    if ('SIDEBAND' in hduList[0].header):
+                        headerKey = 'SIDEBAND'
+                        label = label + '_{}'.format(hduList[0].header[headerKey].upper())
+                    if ('BAND' in hduList[0].header):
+                        headerKey = 'BAND'
+                        label = label + '_{}'.format(hduList[0].header[headerKey].lower())
+                    hduListType[label] = hduList
+                else:
+                    headerKey = 'TYPE'
+                    hduListType[hduList[0].header[headerKey]] = hduList
 
-                    spectra[herschel_filter] = hduListType
+            spectra[herschel_filter] = hduListType
         return spectra
 
     def _get_herschel_filter_name(self, member_name):
@@ -1760,11 +1807,35 @@ class ESASkyClass(BaseQuery):
         return query
 
     def _store_query_result(self, query_result, names, json, **kwargs):
-        for name in names:
-            table = self._query(name=name, json=json, **kwargs)
+        if 'ids' in kwargs:
+            # loading the column metadata once, before the id queries look up their column types
+            self.get_tables(only_names=False)
+
+        tables = self._map_concurrently(lambda name: self._query(name=name, json=json, **kwargs), names)
+        for name, table in zip(names, tables):
             if len(table) > 0:
                 query_result[name.upper()] = table
 
+    def _map_concurrently(self, function, items, max_workers=None):
+        """
+        Calls ``function`` on each of the ``items`` (e.g. per-mission TAP queries or product downloads)
+        from a pool of ``max_workers`` threads, and returns the results in the order of the items.
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [function(item) for item in items]
+
+        if max_workers is None:
+            max_workers = min(query_conf.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(function, item) for item in items]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
     def _find_mission_parameters_in_json(self, mission_tap_name, json):
         for mission in json:
             if (mission[self.__TAP_TABLE_STRING] == mission_tap_name):
@@ -1791,6 +1862,10 @@ class ESASkyClass(BaseQuery):
         return self._fetch_and_parse_json("sso")
 
     def _fetch_and_parse_json(self, object_name):
+        # the descriptors are fetched once per session
+        if object_name in self._cached_descriptors:
+            return self._cached_descriptors[object_name]
+
         url = self.URLbase + "/" + object_name
         response = self._request(
             'GET',
@@ -1802,6 +1877,7 @@ class ESASkyClass(BaseQuery):
 
         string_response = response.content.decode('utf-8')
         json_response = json.loads(string_response)
+        self._cached_descriptors[object_name] = json_response["descriptors"]
         return json_response["descriptors"]
 
     def _json_object_field_to_list(self, json, field_name):
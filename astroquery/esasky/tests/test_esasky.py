@@ -0,0 +1,159 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+
+import io
+import json
+import os
+import tarfile
+import threading
+import time
+
+import requests
+from astropy.io import fits
+from astropy.table import Table
+
+from astroquery.utils.commons import TableList
+from astroquery.utils.mocks import MockResponse
+from astroquery.utils.tap.model.taptable import TapTableMeta
+from astroquery.utils.tap.model.tapcolumn import TapColumn
+
+from ... import esasky
+
+DESCRIPTORS = [{'mission': 'MISSION-{}'.format(index),
+                'tapTable': 'observations.mv_mission_{}'.format(index),
+                'tapRaColumn': 'ra', 'tapDecColumn': 'dec',
+                'useIntersectPolygonInsteadOfContainsPoint': False,
+                'uniqueIdentifierField': 'observation_id'} for index in range(6)]
+
+
+class DummyJob:
+
+    def __init__(self, table):
+        self.table = table
+
+    def get_results(self):
+        return self.table
+
+
+class DummyTapHandler:
+
+    def __init__(self):
+        self.queries = []
+        self.load_tables_calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def launch_job(self, query, **kwargs):
+        with self._lock:
+            self.queries.append(query)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self._lock:
+            self.running -= 1
+        index = int(query.split('mv_mission_')[1].split()[0])
+        # the odd missions find nothing
+        return DummyJob(Table({'observation_id': ['obs{}'.format(index)] * (index % 2 == 0)}))
+
+    def load_tables(self, only_names=False, **kwargs):
+        self.load_tables_calls.append(only_names)
+        tables = []
+        for descriptor in DESCRIPTORS:
+            table = TapTableMeta()
+            table.name = descriptor['tapTable']
+            if not only_names:
+                column = TapColumn(None)
+                column.name = 'observation_id'
+                column.data_type = 'VARCHAR'
+                table.add_column(column)
+            tables.append(table)
+        return tables
+
+
+def get_mockreturn(self, method, url, *args, **kwargs):
+    get_mockreturn.urls.append(url)
+    return MockResponse(json.dumps({'descriptors': DESCRIPTORS}).encode('utf-8'))
+
+
+def test_query_ids_maps_concurrent(monkeypatch):
+    get_mockreturn.urls = []
+    monkeypatch.setattr(esasky.core.ESASkyClass, '_request', get_mockreturn)
+    tap = DummyTapHandler()
+    esa = esasky.core.ESASkyClass(tap_handler=tap)
+
+    result = esa.query_ids_maps(observation_ids=['obs0', 'obs2'])
+    assert isinstance(result, TableList)
+    assert list(result.keys()) == ['MISSION-0', 'MISSION-2', 'MISSION-4']
+    assert len(tap.queries) == len(DESCRIPTORS)
+    assert tap.max_running > 1
+
+    result = esa.query_region_maps('10 20', '1 arcmin', missions=['MISSION-4', 'MISSION-1', 'MISSION-2'])
+    assert list(result.keys()) == ['MISSION-4', 'MISSION-2']
+
+    # the descriptors and the column metadata are only fetched once
+    assert len(get_mockreturn.urls) == 1
+    assert tap.load_tables_calls == [False]
+
+
+def test_get_tables_cache():
+    tap = DummyTapHandler()
+    esa = esasky.core.ESASkyClass(tap_handler=tap)
+
+    assert esa.get_tables() == [descriptor['tapTable'] for descriptor in DESCRIPTORS]
+    assert esa.get_columns('observations.mv_mission_0') == ['observation_id']
+    assert esa.get_tables() == [descriptor['tapTable'] for descriptor in DESCRIPTORS]
+    assert tap.load_tables_calls == [True, False]
+
+
+def _make_fits(value):
+    fits_file = io.BytesIO()
+    fits.PrimaryHDU(header=fits.Header([('VALUE', value)])).writeto(fits_file)
+    return fits_file.getvalue()
+
+
+def _make_tar(members):
+    tar_file = io.BytesIO()
+    with tarfile.open(fileobj=tar_file, mode='w') as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return tar_file.getvalue()
+
+
+PRODUCTS = {'http://fakeurl.edu/obs1': ('obs1.fits', _make_fits(1)),
+            'http://fakeurl.edu/obs2': ('obs2.tar', _make_tar({'obs2a.fits': _make_fits(2),
+                                                               'obs2b.fits': _make_fits(3)}))}
+
+
+def product_mockreturn(self, method, url, *args, **kwargs):
+    if url not in PRODUCTS:
+        return get_mockreturn(self, method, url, *args, **kwargs)
+    file_name, content = PRODUCTS[url]
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Length'] = str(len(content))
+    response.headers['Content-Disposition'] = 'attachment; filename="{}"'.format(file_name)
+    # the products can only be read as a stream
+    response.raw = io.BufferedReader(io.BytesIO(content))
+    return response
+
+
+def test_get_maps_streamed(monkeypatch, tmp_path):
+    get_mockreturn.urls = []
+    monkeypatch.setattr(esasky.core.ESASkyClass, '_request', product_mockreturn)
+    esa = esasky.core.ESASkyClass(tap_handler=DummyTapHandler())
+    maps_table = Table({'product_url': list(PRODUCTS), 'observation_id': ['obs1', 'obs2']})
+
+    maps = esa.get_maps({'MISSION-0': maps_table}, download_dir=str(tmp_path), cache=False)
+    assert [hdul[0].header['VALUE'] for hdul in maps['MISSION-0']] == [1, 2, 3]
+    for hdul in maps['MISSION-0']:
+        hdul.close()
+
+    # the archive is removed once extracted, unless it is kept in the cache
+    assert sorted(os.listdir(tmp_path / 'MISSION-0')) == ['obs1.fits', 'obs2a.fits', 'obs2b.fits']
+
+    maps = esa.get_maps({'MISSION-0': maps_table}, download_dir=str(tmp_path), cache=True)
+    for hdul in maps['MISSION-0']:
+        hdul.close()
+    assert 'obs2.tar' in os.listdir(tmp_path / 'MISSION-0')
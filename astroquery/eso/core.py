@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import html
 import time
 import sys
 import os.path
@@ -9,6 +10,7 @@ import warnings
 import keyring
 import numpy as np
 import re
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 
 from io import BytesIO
@@ -17,7 +19,7 @@ from astroquery import log
 
 from ..exceptions import LoginError, RemoteServiceError, NoResultsWarning
 from ..utils import schema, system_tools
-from ..query import QueryWithLogin, suspend_cache
+from ..query import QueryWithLogin, suspend_cache, conf as query_conf
 from . import conf
 
 __doctest_skip__ = ['EsoClass.*']
@@ -36,6 +38,51 @@ def _check_response(content):
         return True
 
 
+_PRE_RE = re.compile(r'<pre[^>]*>(.*?)</pre>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def _get_pre_text(content):
+    """
+    Extract the text of the first ``<pre>`` element of a header page,
+    without parsing the whole HTML document.
+    """
+    match = _PRE_RE.search(content.decode('utf-8', errors='replace'))
+    if match is None:
+        raise RemoteServiceError("No header found in the response: "
+                                 "{0}".format(content[:200]))
+    return html.unescape(_TAG_RE.sub('', match.group(1)))
+
+
+def _parse_header(dp_id, hdr):
+    """
+    Parse the keywords of a header page into a dict, starting with the
+    ``DP.ID`` of the product.
+    """
+    header = {'DP.ID': dp_id}
+    for key_value in hdr.split('\n'):
+        if "=" in key_value:
+            key, value = key_value.split('=', 1)
+            key = key.strip()
+            value = value.split('/', 1)[0].strip()
+            if key[0:7] != "COMMENT":  # drop comments
+                if value == "T":  # Convert boolean T to True
+                    value = True
+                elif value == "F":  # Convert boolean F to False
+                    value = False
+                # Convert to string, removing quotation marks
+                elif value[0] == "'":
+                    value = value[1:-1]
+                elif "." in value:  # Convert to float
+                    value = float(value)
+                else:  # Convert to integer
+                    value = int(value)
+                header[key] = value
+        elif key_value.startswith("END"):
+            break
+    return header
+
+
 class EsoClass(QueryWithLogin):
 
     ROW_LIMIT = conf.row_limit
@@ -486,7 +533,7 @@ class EsoClass(QueryWithLogin):
             else:
                 warnings.warn("Query returned no results", NoResultsWarning)
 
-    def get_headers(self, product_ids, cache=True):
+    def get_headers(self, product_ids, cache=True, max_workers=None):
         """
         Get the headers associated to a list of data product IDs
 
@@ -501,6 +548,11 @@ class EsoClass(QueryWithLogin):
         ----------
         product_ids : either a list of strings or a `~astropy.table.Column`
             List of data product IDs.
+        cache : bool
+            Cache the header pages.
+        max_workers : int, optional
+            Number of header pages fetched concurrently. Defaults to
+            ``astroquery.query.conf.max_per_host``.
 
         Returns
         -------
@@ -511,51 +563,39 @@ class EsoClass(QueryWithLogin):
         _schema_product_ids = schema.Schema(
             schema.Or(Column, [schema.Schema(str)]))
         _schema_product_ids.validate(product_ids)
-        # Get all headers
-        result = []
-        for dp_id in product_ids:
+        product_ids = list(product_ids)
+        if not product_ids:
+            return Table()
+
+        def get_header(dp_id):
             response = self._request(
                 "GET", "http://archive.eso.org/hdr?DpId={0}".format(dp_id),
                 cache=cache)
-            root = BeautifulSoup(response.content, 'html5lib')
-            hdr = root.select('pre')[0].text
-            header = {'DP.ID': dp_id}
-            for key_value in hdr.split('\n'):
-                if "=" in key_value:
-                    key, value = key_value.split('=', 1)
-                    key = key.strip()
-                    value = value.split('/', 1)[0].strip()
-                    if key[0:7] != "COMMENT":  # drop comments
-                        if value == "T":  # Convert boolean T to True
-                            value = True
-                        elif value == "F":  # Convert boolean F to False
-                            value = False
-                        # Convert to string, removing quotation marks
-                        elif value[0] == "'":
-                            value = value[1:-1]
-                        elif "." in value:  # Convert to float
-                            value = float(value)
-                        else:  # Convert to integer
-                            value = int(value)
-                        header[key] = value
-                elif key_value.startswith("END"):
-                    break
-            result.append(header)
-        # Identify all columns
-        columns = []
-        column_types = []
+            return _parse_header(dp_id, _get_pre_text(response.content))
+
+        # Get all headers, the pages all come from the same host
+        max_workers = min(max_workers or query_conf.max_per_host, len(product_ids))
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(get_header, dp_id) for dp_id in product_ids]
+            try:
+                result = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # Identify all columns, in the order they are first found, and fill
+        # the missing elements with the default value of their type
+        column_types = {}
         for header in result:
-            for key in header:
-                if key not in columns:
-                    columns.append(key)
-                    column_types.append(type(header[key]))
-        # Add all missing elements
-        for i in range(len(result)):
-            for (column, column_type) in zip(columns, column_types):
-                if column not in result[i]:
-                    result[i][column] = column_type()
-        # Return as Table
-        return Table(result)
+            for key, value in header.items():
+                column_types.setdefault(key, type(value))
+        columns = {}
+        for key, column_type in column_types.items():
+            default = column_type()
+            columns[key] = [header.get(key, default) for header in result]
+        return Table(columns)
 
     def _check_existing_files(self, datasets, continuation=False,
                               destination=None):
@@ -835,10 +875,8 @@ class EsoClass(QueryWithLogin):
                              fileId.attrs['value'].split()[1]
                              for fileId in fileIds]
 
-            nfiles = len(fileLinks)
-            log.info("Downloading {} files...".format(nfiles))
-            log.debug("Files:\n{}".format('\n'.join(fileLinks)))
-            for i, fileLink in enumerate(fileLinks, 1):
+            downloads = []
+            for fileLink in fileLinks:
                 fileId = fileLink.rsplit('/', maxsplit=1)[1]
 
                 if request_id is not None:
@@ -848,10 +886,24 @@ class EsoClass(QueryWithLogin):
                     if fileId.split('.fits')[0] not in datasets_to_download:
                         continue
 
-                log.info("Downloading file {}/{}: {}..."
-                         .format(i, nfiles, fileId))
-                filename = self._request("GET", fileLink, save=True,
-                                         continuation=True)
+                local_filename = fileId
+                if os.name == 'nt':
+                    # Windows doesn't allow special characters in filenames
+                    # like ":" so replace them with an underscore
+                    local_filename = local_filename.replace(':', '_')
+                downloads.append((fileLink, os.path.join(self.cache_location,
+                                                         local_filename)))
+
+            nfiles = len(downloads)
+            log.info("Downloading {} files...".format(nfiles))
+            log.debug("Files:\n{}".format('\n'.join(fileLinks)))
+            # the files already downloaded are reused, as with
+            # _request(save=True)
+            filenames = self._download_files(downloads, continuation=True,
+                                             cache=True)
+
+            for (fileLink, _), filename in zip(downloads, filenames):
+                fileId = fileLink.rsplit('/', maxsplit=1)[1]
 
                 if filename.endswith(('.gz', '.7z', '.bz2', '.xz', '.Z')) and unzip:
                     log.info("Unzipping file {0}...".format(fileId))
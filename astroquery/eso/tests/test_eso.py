@@ -92,3 +92,35 @@ def test_vvv(monkeypatch):
     assert result_s is not None
     assert 'Object' in result_s.colnames
     assert 'b333' in result_s['Object']
+
+
+HEADERS = {'ADP.1': ("SIMPLE  =                    T / conforms to FITS\n"
+                     "EXPTIME =                 60.0 / [s] exposure time\n"
+                     "NAXIS   =                    2\n"
+                     "OBJECT  = 'SGR A&lt;*&gt;'          / target\n"
+                     "COMMENT = 'dropped'\n"
+                     "END\n"
+                     "IGNORED =                    1\n"),
+           'ADP.2': ("SIMPLE  =                    F\n"
+                     "FILTER  = 'Ks'\n"
+                     "END\n")}
+
+
+def header_request(request_type, url, **kwargs):
+    dp_id = url.split('DpId=')[1]
+    content = ("<html><body><h1>{0}</h1><PRE class='header'>{1}</PRE>"
+               "</body></html>".format(dp_id, HEADERS[dp_id]))
+    return MockResponse(content=content.encode('utf-8'), url=url)
+
+
+def test_get_headers(monkeypatch):
+    eso = Eso()
+    monkeypatch.setattr(eso, '_request', header_request)
+
+    result = eso.get_headers(['ADP.1', 'ADP.2', 'ADP.1'], max_workers=2)
+    assert result.colnames == ['DP.ID', 'SIMPLE', 'EXPTIME', 'NAXIS', 'OBJECT', 'FILTER']
+    assert list(result['DP.ID']) == ['ADP.1', 'ADP.2', 'ADP.1']
+    assert list(result['SIMPLE']) == [True, False, True]
+    assert list(result['EXPTIME']) == [60.0, 0.0, 60.0]
+    assert list(result['OBJECT']) == ['SGR A<*>', '', 'SGR A<*>']
+    assert list(result['FILTER']) == ['', 'Ks', '']
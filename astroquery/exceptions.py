@@ -8,7 +8,7 @@ from astropy.utils.exceptions import AstropyWarning
 __all__ = ['TimeoutError', 'InvalidQueryError', 'RemoteServiceError',
            'TableParseError', 'LoginError', 'ResolverError',
            'NoResultsWarning', 'LargeQueryWarning', 'InputWarning',
-           'AuthenticationWarning', 'MaxResultsWarning']
+           'AuthenticationWarning', 'MaxResultsWarning', 'DownloadError']
 
 
 class TimeoutError(Exception):
@@ -103,3 +103,11 @@ class EmptyResponseError(ValueError):
     Astroquery error class to be raised when the query returns an empty result
     """
     pass
+
+
+class DownloadError(Exception):
+    """
+    Astroquery error class to be raised when a downloaded file does not
+    match its expected size or checksum.
+    """
+    pass
@@ -32,6 +32,14 @@ class Conf(_config.ConfigNamespace):
     ROW_LIMIT = _config.ConfigItem(50,
                                    "Number of rows to return from database "
                                    "query (set to -1 for unlimited).")
+    LOAD_DATA_CHUNK_SIZE = _config.ConfigItem(
+        5000,
+        "Maximum number of source identifiers requested by each query of "
+        "load_data.")
+    UPLOAD_CHUNK_SIZE = _config.ConfigItem(
+        10000,
+        "Maximum number of positions uploaded by each query of a cone search "
+        "around several coordinates.")
     VALID_DATALINK_RETRIEVAL_TYPES = ['EPOCH_PHOTOMETRY',
                                       'XP_CONTINUOUS',
                                       'XP_SAMPLED',
@@ -43,7 +51,7 @@ class Conf(_config.ConfigNamespace):
 conf = Conf()
 
 
-from .core import Gaia, GaiaClass
+from .core import Gaia, GaiaClass, DataProducts
 
 
-__all__ = ['Gaia', 'GaiaClass', 'Conf', 'conf']
+__all__ = ['Gaia', 'GaiaClass', 'DataProducts', 'Conf', 'conf']
@@ -14,8 +14,13 @@ Created on 30 jun. 2016
 
 
 """
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
 from requests import HTTPError
 
+from astroquery.query import conf as query_conf
 from astroquery.utils.tap import TapPlus
 from astroquery.utils import commons
 from astroquery import log
@@ -30,8 +35,78 @@ import shutil
 import astroquery.utils.tap.model.modelutils as modelutils
 from astropy.io import votable
 from astropy.io import fits
-from astropy.table import Table
+from astropy.table import Table, vstack
 from astropy import units as u
+import numpy as np
+import tempfile
+import threading
+import weakref
+
+
+class DataProducts(Mapping):
+    """
+    Read-only mapping of the data products returned by
+    `~astroquery.gaia.GaiaClass.load_data`, from their file name to their list
+    of tables. The products are kept in their downloaded archives, parsed the
+    first time they are accessed, and kept.
+
+    The archives downloaded to a temporary ``directory`` are read from the
+    disk, the directory being removed with the mapping.
+    """
+
+    def __init__(self, directory=None):
+        self._sources = {}
+        self._tables = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            self._finalizer = weakref.finalize(self, shutil.rmtree, directory,
+                                               ignore_errors=True)
+
+    def _add(self, name, archive, member=None):
+        # archive is the path of a zip archive, or of the product itself when
+        # member is None
+        self._sources.setdefault(name, []).append((archive, member))
+
+    def __getitem__(self, name):
+        with self._lock:
+            if name not in self._tables:
+                tables = []
+                for archive, member in self._sources[name]:
+                    tables.extend(self._read(name, self._get_content(archive, member)))
+                self._tables[name] = tables
+            return self._tables[name]
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __repr__(self):
+        return f"<DataProducts: {list(self._sources)}>"
+
+    @staticmethod
+    def _get_content(archive, member):
+        if member is None:
+            with open(archive, 'rb') as f:
+                return f.read()
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            return zip_ref.read(member)
+
+    @staticmethod
+    def _read(name, content):
+        tables = []
+        if '.fits' in name:
+            with fits.open(BytesIO(content)) as hduList:
+                for hdu in hduList[1:]:
+                    table = Table.read(hdu, format='fits')
+                    GaiaClass.correct_table_units(table)
+                    tables.append(table)
+        elif '.xml' in name:
+            tables.extend(votable.parse(BytesIO(content)).iter_tables())
+        elif '.csv' in name:
+            tables.append(Table.read(content.decode('utf-8'), format='ascii.csv'))
+        return tables
 
 
 class GaiaClass(TapPlus):
@@ -42,6 +117,8 @@ class GaiaClass(TapPlus):
     MAIN_GAIA_TABLE_RA = conf.MAIN_GAIA_TABLE_RA
     MAIN_GAIA_TABLE_DEC = conf.MAIN_GAIA_TABLE_DEC
     ROW_LIMIT = conf.ROW_LIMIT
+    # maximum number of rows returned by the synchronous jobs of the archive
+    SYNC_JOB_ROW_LIMIT = 2000
     VALID_DATALINK_RETRIEVAL_TYPES = conf.VALID_DATALINK_RETRIEVAL_TYPES
 
     def __init__(self, tap_plus_conn_handler=None,
@@ -166,7 +243,9 @@ class GaiaClass(TapPlus):
         Parameters
         ----------
         ids : str list, mandatory
-            list of identifiers
+            list of identifiers. They are requested by chunks of
+            ``conf.LOAD_DATA_CHUNK_SIZE`` identifiers, downloaded
+            concurrently
         data_release: str, optional, default None
             data release from which data should be taken. E.g. 'Gaia DR2'
             By default, it takes the current default one.
@@ -195,8 +274,11 @@ class GaiaClass(TapPlus):
         format : str, optional, default 'votable'
             loading format
         output_file : string, optional, default None
-            file where the results are saved.
-            If it is not provided, the http response contents are returned.
+            file where the results are saved. The results of several
+            chunks of identifiers are saved in as many files, numbered after
+            output_file.
+            If it is not provided, the results are saved in a temporary
+            directory, removed with the returned products.
         overwrite_output_file : boolean, optional, default False
             To overwrite the output_file if it already exists.
         verbose : bool, optional, default 'False'
@@ -204,27 +286,21 @@ class GaiaClass(TapPlus):
 
         Returns
         -------
-        A table object
+        A `DataProducts` mapping from the product file names to their list of
+        tables, each product being read from the downloaded files when it is
+        accessed
         """
         if retrieval_type is None:
             raise ValueError("Missing mandatory argument 'retrieval_type'")
 
         now = datetime.now()
         now_formatted = now.strftime("%Y%m%d_%H%M%S")
-        temp_dirname = "temp_" + now_formatted
+        temp_dirname = "temp_" + now_formatted + "_"
         downloadname_formated = "download_" + now_formatted
 
-        output_file_specified = False
-        if output_file is None:
-            output_file = os.path.join(os.getcwd(), temp_dirname, downloadname_formated)
-        else:
-            output_file_specified = True
+        output_file_specified = output_file is not None
+        if output_file_specified:
             output_file = os.path.abspath(output_file)
-            if not overwrite_output_file and os.path.exists(output_file):
-                raise ValueError(f"{output_file} file already exists. Please use overwrite_output_file='False' to "
-                                 f"overwrite output file.")
-
-        path = os.path.dirname(output_file)
 
         if ids is None:
             raise ValueError("Missing mandatory argument 'ids'")
@@ -250,13 +326,10 @@ class GaiaClass(TapPlus):
             else:
                 params_dict['BAND'] = band
         if isinstance(ids, str):
-            ids_arg = ids
-        else:
-            if isinstance(ids, int):
-                ids_arg = str(ids)
-            else:
-                ids_arg = ','.join(str(item) for item in ids)
-        params_dict['ID'] = ids_arg
+            ids = [item.strip() for item in ids.split(',')]
+        elif isinstance(ids, int):
+            ids = [ids]
+        ids = [str(item) for item in ids]
         if data_release is not None:
             params_dict['RELEASE'] = data_release
         params_dict['DATA_STRUCTURE'] = data_structure
@@ -264,24 +337,64 @@ class GaiaClass(TapPlus):
         params_dict['RETRIEVAL_TYPE'] = str(retrieval_type)
         params_dict['USE_ZIP_ALWAYS'] = 'true'
 
-        if path != '':
-            try:
-                os.mkdir(path)
-            except FileExistsError:
-                log.error("Path %s already exist" % path)
-            except OSError:
-                log.error("Creation of the directory %s failed" % path)
+        chunk_size = max(1, conf.LOAD_DATA_CHUNK_SIZE)
+        chunks = [ids[start:start + chunk_size]
+                  for start in range(0, len(ids), chunk_size)] or [[]]
 
-        try:
-            self.__gaiadata.load_data(params_dict=params_dict,
-                                      output_file=output_file,
+        if output_file_specified:
+            path = os.path.dirname(output_file)
+        else:
+            # the archives are kept in a temporary directory, removed with
+            # the returned DataProducts
+            path = tempfile.mkdtemp(prefix=temp_dirname)
+            output_file = os.path.join(path, downloadname_formated)
+
+        if len(chunks) == 1:
+            output_files = [output_file]
+        else:
+            root, ext = os.path.splitext(output_file)
+            output_files = [f"{root}_{num}{ext}" for num in range(len(chunks))]
+
+        if output_file_specified:
+            if not overwrite_output_file:
+                for chunk_file in output_files:
+                    if os.path.exists(chunk_file):
+                        raise ValueError(f"{chunk_file} file already exists. Please use "
+                                         f"overwrite_output_file='True' to overwrite output file.")
+            if path != '':
+                try:
+                    os.mkdir(path)
+                except FileExistsError:
+                    log.error("Path %s already exist" % path)
+                except OSError:
+                    log.error("Creation of the directory %s failed" % path)
+
+        def load_chunk(chunk, chunk_file):
+            chunk_params = dict(params_dict, ID=','.join(chunk))
+            self.__gaiadata.load_data(params_dict=chunk_params,
+                                      output_file=chunk_file,
                                       verbose=verbose)
-            files = Gaia.__get_data_files(output_file=output_file, path=path)
-        except Exception as err:
-            raise err
-        finally:
+
+        try:
+            max_workers = min(query_conf.max_per_host, len(chunks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(load_chunk, chunk, chunk_file)
+                           for chunk, chunk_file in zip(chunks, output_files)]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            # the products are read later from the saved files, or from the
+            # temporary files, removed with the DataProducts
+            files = Gaia.__get_data_files(output_files,
+                                          directory=None if output_file_specified else path)
+        except BaseException:
             if not output_file_specified:
-                shutil.rmtree(path)
+                shutil.rmtree(path, ignore_errors=True)
+            raise
 
         if verbose:
             if output_file_specified:
@@ -301,41 +414,21 @@ class GaiaClass(TapPlus):
         return files
 
     @staticmethod
-    def __get_data_files(output_file, path):
-        files = {}
-        if zipfile.is_zipfile(output_file):
-            with zipfile.ZipFile(output_file, 'r') as zip_ref:
-                zip_ref.extractall(os.path.dirname(output_file))
-
-        # r=root, d=directories, f = files
-        for r, d, f in os.walk(path):
-            for file in f:
-                if '.fits' in file or '.xml' in file or '.csv' in file:
-                    files[file] = os.path.join(r, file)
-
-        for key, value in files.items():
-            if '.fits' in key:
-                tables = []
-                with fits.open(value) as hduList:
-                    # print(hduList)
-                    num_hdus = len(hduList)
-                    for i in range(1, num_hdus):
-                        table = Table.read(hduList[i], format='fits')
-                        Gaia.correct_table_units(table)
-                        tables.append(table)
-                    files[key] = tables
-            elif '.xml' in key:
-                tables = []
-                for table in votable.parse(value).iter_tables():
-                    tables.append(table)
-                files[key] = tables
-
-            elif '.csv' in key:
-                tables = []
-                table = Table.read(value, format='ascii.csv',
-                                   fast_reader=False)
-                tables.append(table)
-                files[key] = tables
+    def __get_data_files(output_files, directory=None):
+        files = DataProducts(directory)
+        for output_file in output_files:
+            if not os.path.exists(output_file):
+                continue
+            is_zip = zipfile.is_zipfile(output_file)
+            if is_zip:
+                with zipfile.ZipFile(output_file, 'r') as zip_ref:
+                    members = [info.filename for info in zip_ref.infolist() if not info.is_dir()]
+            else:
+                members = [None]
+            for member in members:
+                name = os.path.basename(member if is_zip else output_file)
+                if '.fits' in name or '.xml' in name or '.csv' in name:
+                    files._add(name, output_file, member)
         return files
 
     def get_datalinks(self, ids, verbose=False):
@@ -363,10 +456,11 @@ class GaiaClass(TapPlus):
         Parameters
         ----------
         coordinate : astropy.coordinate, mandatory
-            coordinates center point
+            coordinates center point, or several center points searched with
+            a radius
         radius : astropy.units, required if no 'width' nor 'height' are
         provided
-            radius (deg)
+            radius (deg), or one radius per center point
         width : astropy.units, required if no 'radius' is provided
             box width
         height : astropy.units, required if no 'radius' is provided
@@ -385,6 +479,12 @@ class GaiaClass(TapPlus):
         """
         coord = self.__getCoordInput(coordinate, "coordinate")
         job = None
+        if not coord.isscalar:
+            if radius is None:
+                raise ValueError("Several coordinates can only be searched "
+                                 "with a radius")
+            return self.__cone_search(coord, radius, async_job=async_job,
+                                      verbose=verbose, columns=columns)
         if radius is not None:
             job = self.__cone_search(coord, radius, async_job=async_job,
                                      verbose=verbose, columns=columns)
@@ -442,9 +542,10 @@ class GaiaClass(TapPlus):
         Parameters
         ----------
         coordinate : astropy.coordinates, mandatory
-            coordinates center point
+            coordinates center point, or several center points searched with
+            a radius
         radius : astropy.units, required if no 'width'/'height' are provided
-            radius (deg)
+            radius (deg), or one radius per center point
         width : astropy.units, required if no 'radius' is provided
             box width
         height : astropy.units, required if no 'radius' is provided
@@ -468,9 +569,10 @@ class GaiaClass(TapPlus):
         Parameters
         ----------
         coordinate : astropy.coordinates, mandatory
-            coordinates center point
+            coordinates center point, or several center points searched with
+            a radius
         radius : astropy.units, required if no 'width'/'height' are provided
-            radius
+            radius, or one radius per center point
         width : astropy.units, required if no 'radius' is provided
             box width
         height : astropy.units, required if no 'radius' is provided
@@ -500,9 +602,9 @@ class GaiaClass(TapPlus):
         Parameters
         ----------
         coordinate : astropy.coordinate, mandatory
-            coordinates center point
+            coordinates center point, or several center points
         radius : astropy.units, mandatory
-            radius
+            radius, or one radius per center point
         table_name : str, optional, default main gaia table
             table name doing the cone search against
         ra_column_name : str, optional, default ra column in main gaia table
@@ -529,9 +631,20 @@ class GaiaClass(TapPlus):
 
         Returns
         -------
-        A Job object
+        A Job object, or the results table (astropy.table) of several
+        center points, which has no ``get_results`` method
         """
         coord = self.__getCoordInput(coordinate, "coordinate")
+        if not coord.isscalar:
+            if dump_to_file:
+                raise ValueError("The results of several coordinates cannot "
+                                 "be dumped to a file")
+            return self.__cone_search_targets(
+                coord, radius, table_name=table_name,
+                ra_column_name=ra_column_name,
+                dec_column_name=dec_column_name, async_job=async_job,
+                output_format=output_format, verbose=verbose,
+                columns=columns)
         raHours, dec = commons.coord_to_radec(coord)
         ra = raHours * 15.0  # Converts to degrees
         if radius is not None:
@@ -579,6 +692,121 @@ class GaiaClass(TapPlus):
                                    verbose=verbose,
                                    dump_to_file=dump_to_file)
 
+    def __cone_search_targets(self, coordinates, radius, table_name=None,
+                              ra_column_name=MAIN_GAIA_TABLE_RA,
+                              dec_column_name=MAIN_GAIA_TABLE_DEC,
+                              async_job=False, output_format="votable",
+                              verbose=False, columns=[]):
+        """Cone searches around several center points, uploaded to the
+        server and matched with a join query per chunk of
+        ``conf.UPLOAD_CHUNK_SIZE`` points. The queries are sent concurrently.
+
+        Parameters
+        ----------
+        coordinates : astropy.coordinate, mandatory
+            coordinates center points
+        radius : astropy.units, mandatory
+            radius, or one radius per center point
+        table_name : str, optional, default main gaia table
+            table name doing the cone search against
+        ra_column_name : str, optional, default ra column in main gaia table
+            ra column doing the cone search against
+        dec_column_name : str, optional, default dec column in main gaia table
+            dec column doing the cone search against
+        async_job : bool, optional, default 'False'
+            executes the jobs in asynchronous/synchronous mode (default
+            synchronous)
+        output_format : str, optional, default 'votable'
+            results format
+        verbose : bool, optional, default 'False'
+            flag to display information about the process
+        columns: list, optional, default []
+            if empty, all columns will be selected
+
+        Returns
+        -------
+        The matches of all the center points (astropy.table), sorted by
+        center point and distance
+        """
+        raHours, dec = commons.coord_to_radec(coordinates.ravel())
+        radiusQuantity = self.__getQuantityInput(radius, "radius")
+        radiusDeg = commons.radius_to_unit(radiusQuantity, unit='deg')
+        try:
+            radiusDeg = np.broadcast_to(radiusDeg, coordinates.shape).ravel()
+        except ValueError:
+            raise ValueError("radius must be a scalar or have one value per "
+                             "coordinate")
+        targets = Table([np.arange(len(dec)), raHours * 15.0, dec, radiusDeg],
+                        names=['target_idx', 'target_ra', 'target_dec',
+                               'target_radius'])
+
+        if columns:
+            columns = ','.join(map(str, columns))
+        else:
+            columns = "gaia.*"
+
+        upload_table_name = "cone_search_targets"
+        query = """
+                SELECT
+                  {row_limit}
+                  target.target_idx,
+                  {columns},
+                  DISTANCE(
+                    POINT('ICRS', gaia.{ra_column}, gaia.{dec_column}),
+                    POINT('ICRS', target.target_ra, target.target_dec)
+                  ) AS dist
+                FROM
+                  {table_name} AS gaia
+                JOIN
+                  TAP_UPLOAD.{upload_table_name} AS target
+                ON
+                  1 = CONTAINS(
+                    POINT('ICRS', gaia.{ra_column}, gaia.{dec_column}),
+                    CIRCLE('ICRS', target.target_ra, target.target_dec,
+                           target.target_radius)
+                  )
+                ORDER BY
+                  target.target_idx ASC,
+                  dist ASC
+                """.format(**{'ra_column': ra_column_name,
+                              'row_limit': "TOP {0}".format(self.ROW_LIMIT) if self.ROW_LIMIT > 0 else "",
+                              'dec_column': dec_column_name, 'columns': columns,
+                              'upload_table_name': upload_table_name,
+                              'table_name': table_name or self.MAIN_GAIA_TABLE or conf.MAIN_GAIA_TABLE})
+
+        def search(chunk):
+            launch_job = self.launch_job_async if async_job else self.launch_job
+            job = launch_job(query=query, output_format=output_format,
+                             verbose=verbose, upload_resource=chunk,
+                             upload_table_name=upload_table_name)
+            return job.get_results()
+
+        chunk_size = max(1, conf.UPLOAD_CHUNK_SIZE)
+        chunks = [targets[start:start + chunk_size]
+                  for start in range(0, len(targets), chunk_size)]
+        with ThreadPoolExecutor(max_workers=min(query_conf.max_per_host,
+                                                len(chunks))) as executor:
+            futures = [executor.submit(search, chunk) for chunk in chunks]
+            try:
+                chunk_results = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # a truncated chunk is not followed by the matches of the next ones,
+        # so that the results are those of a single query
+        limit = self.ROW_LIMIT if self.ROW_LIMIT > 0 else (None if async_job else self.SYNC_JOB_ROW_LIMIT)
+        results = []
+        for result in chunk_results:
+            results.append(result)
+            if limit is not None and len(result) >= limit:
+                break
+        results = results[0] if len(results) == 1 else vstack(results, metadata_conflicts='silent')
+        if self.ROW_LIMIT > 0:
+            results = results[:self.ROW_LIMIT]
+        return results
+
     def cone_search(self, coordinate, radius=None,
                     table_name=None,
                     ra_column_name=MAIN_GAIA_TABLE_RA,
@@ -590,12 +818,18 @@ class GaiaClass(TapPlus):
         """Cone search sorted by distance (sync.)
         TAP & TAP+
 
+        Several center points are uploaded to the server and matched with a
+        single join query per ``conf.UPLOAD_CHUNK_SIZE`` points, the queries
+        being sent concurrently. Their matches are returned in one table,
+        sorted by center point and distance, with the index of their center
+        point in the ``target_idx`` column.
+
         Parameters
         ----------
         coordinate : astropy.coordinate, mandatory
-            coordinates center point
+            coordinates center point, or several center points
         radius : astropy.units, mandatory
-            radius
+            radius, or one radius per center point
         table_name : str, optional, default main gaia table
             table name doing the cone search against
         ra_column_name : str, optional, default ra column in main gaia table
@@ -616,7 +850,8 @@ class GaiaClass(TapPlus):
 
         Returns
         -------
-        A Job object
+        A Job object, or the results table (astropy.table) of several
+        center points, which has no ``get_results`` method
         """
         return self.__cone_search(coordinate,
                                   radius=radius,
@@ -640,12 +875,18 @@ class GaiaClass(TapPlus):
         """Cone search sorted by distance (async)
         TAP & TAP+
 
+        Several center points are uploaded to the server and matched with a
+        single join query per ``conf.UPLOAD_CHUNK_SIZE`` points, the queries
+        being sent concurrently. Their matches are returned in one table,
+        sorted by center point and distance, with the index of their center
+        point in the ``target_idx`` column.
+
         Parameters
         ----------
         coordinate : astropy.coordinate, mandatory
-            coordinates center point
+            coordinates center point, or several center points
         radius : astropy.units, mandatory
-            radius
+            radius, or one radius per center point
         table_name : str, optional, default main gaia table
             table name doing the cone search against
         ra_column_name : str, optional, default ra column in main gaia table
@@ -655,7 +896,8 @@ class GaiaClass(TapPlus):
         background : bool, optional, default 'False'
             when the job is executed in asynchronous mode, this flag
             specifies whether
-            the execution will wait until results are available
+            the execution will wait until results are available. The results
+            of several center points are always waited for
         output_file : str, optional, default None
             file name where the results are saved if dumpToFile is True.
             If this parameter is not provided, the jobid is used instead
@@ -668,7 +910,8 @@ class GaiaClass(TapPlus):
 
         Returns
         -------
-        A Job object
+        A Job object, or the results table (astropy.table) of several
+        center points, which has no ``get_results`` method
         """
         return self.__cone_search(coordinate,
                                   radius=radius,
@@ -854,7 +1097,7 @@ class GaiaClass(TapPlus):
                          output_format="votable", verbose=False,
                          dump_to_file=False, background=False,
                          upload_resource=None, upload_table_name=None,
-                         autorun=True):
+                         autorun=True, stream=False):
         """Launches an asynchronous job
 
         Parameters
@@ -884,6 +1127,9 @@ class GaiaClass(TapPlus):
         autorun : boolean, optional, default True
             if 'True', sets 'phase' parameter to 'RUN',
             so the framework can start the job.
+        stream : bool, optional, default 'False'
+            if True, the results are not loaded in memory: they can be read
+            by chunks, while they are downloaded, with Job.iter_results
 
         Returns
         -------
@@ -898,7 +1144,8 @@ class GaiaClass(TapPlus):
                                         background=background,
                                         upload_resource=upload_resource,
                                         upload_table_name=upload_table_name,
-                                        autorun=autorun)
+                                        autorun=autorun,
+                                        stream=stream)
 
 
 Gaia = GaiaClass()
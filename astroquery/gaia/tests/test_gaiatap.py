@@ -15,11 +15,15 @@ Created on 30 jun. 2016
 
 """
 import unittest
+import gc
 import os
+import io
+import tempfile
+import zipfile
 import pytest
 
 from astroquery.gaia import conf
-from astroquery.gaia.core import GaiaClass
+from astroquery.gaia.core import GaiaClass, DataProducts
 from astroquery.gaia.tests.DummyTapHandler import DummyTapHandler
 from astroquery.utils.tap.conn.tests.DummyConnHandler import DummyConnHandler
 from astroquery.utils.tap.conn.tests.DummyResponse import DummyResponse
@@ -30,6 +34,10 @@ import numpy as np
 from astroquery.utils.tap.xmlparser import utils
 from astroquery.utils.tap.core import TapPlus, TAP_CLIENT_ID
 from astroquery.utils.tap import taputils
+from astroquery.utils.tap.model.job import Job
+from astropy.io import fits
+from astropy.io.votable import from_table
+from astropy.table import Table
 
 
 def data_path(filename):
@@ -360,6 +368,97 @@ class TestTap(unittest.TestCase):
         # Cleanup.
         conf.reset('MAIN_GAIA_TABLE')
 
+    def __fake_launch_job(self, async_job, calls):
+        # answers the cone search of each uploaded center point with two
+        # sources, the second one at half its radius
+        def launch_job(query, upload_resource, upload_table_name, **kwargs):
+            calls.append((query, upload_resource, upload_table_name))
+            rows = []
+            for target in upload_resource:
+                idx = target['target_idx']
+                rows.append((idx, 10 * idx, 0.0))
+                rows.append((idx, 10 * idx + 1, target['target_radius'] / 2))
+            if 'TOP 3' in query:
+                rows = rows[:3]
+            job = Job(async_job=async_job, query=query)
+            job.set_results(Table(rows=rows, names=['target_idx', 'source_id', 'dist'],
+                                  dtype=[int, int, float]))
+            return job
+        return launch_job
+
+    def test_cone_search_targets(self):
+        tap = GaiaClass(DummyConnHandler(), DummyConnHandler())
+        sc = SkyCoord(ra=[10, 20, 30, 40, 50], dec=[-5, 0, 5, 10, 15],
+                      unit=(u.degree, u.degree), frame='icrs')
+        radius = Quantity([1, 2, 3, 4, 5], u.arcmin)
+        for method, async_job in ((tap.cone_search, False),
+                                  (tap.cone_search_async, True)):
+            calls = []
+            launch_job = self.__fake_launch_job(async_job, calls)
+            tap.launch_job = tap.launch_job_async = None
+            if async_job:
+                tap.launch_job_async = launch_job
+            else:
+                tap.launch_job = launch_job
+            with conf.set_temp('UPLOAD_CHUNK_SIZE', 2):
+                results = method(sc, radius)
+
+            assert len(calls) == 3
+            query, upload, upload_table_name = calls[0]
+            assert 'JOIN TAP_UPLOAD.' + upload_table_name in ' '.join(query.split())
+            assert 'gaiadr2.gaia_source AS gaia' in query
+            assert 'TOP 50' in query
+            uploads = [call[1] for call in calls]
+            assert [len(upload) for upload in uploads] == [2, 2, 1]
+            np.testing.assert_allclose(np.concatenate([upload['target_radius'] for upload in uploads]),
+                                       radius.to_value(u.deg))
+            # converted to FK5, as the single center points
+            np.testing.assert_allclose(uploads[2]['target_ra'], [50], atol=1e-4)
+            np.testing.assert_allclose(uploads[2]['target_dec'], [15], atol=1e-4)
+
+            # the results of several center points are returned, not a job
+            assert isinstance(results, Table)
+            assert len(results) == 10
+            assert results['target_idx'].tolist() == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+            assert results['source_id'].tolist() == [0, 1, 10, 11, 20, 21, 30, 31, 40, 41]
+
+        # a scalar radius applies to all the center points
+        tap.launch_job = self.__fake_launch_job(False, calls)
+        results = tap.query_object(sc, radius=Quantity(1, u.deg))
+        np.testing.assert_allclose(results['dist'][1::2], 0.5)
+
+        with pytest.raises(ValueError, match="one value per coordinate"):
+            tap.cone_search(sc, Quantity([1, 2], u.deg))
+        with pytest.raises(ValueError, match="dumped to a file"):
+            tap.cone_search(sc, radius, dump_to_file=True)
+        with pytest.raises(ValueError, match="with a radius"):
+            tap.query_object(sc, width=Quantity(1, u.deg), height=Quantity(1, u.deg))
+
+    def test_cone_search_targets_row_limit(self):
+        tap = GaiaClass(DummyConnHandler(), DummyConnHandler())
+        sc = SkyCoord(ra=[10, 20, 30, 40], dec=[-5, 0, 5, 10],
+                      unit=(u.degree, u.degree), frame='icrs')
+        calls = []
+        tap.launch_job = self.__fake_launch_job(False, calls)
+        tap.ROW_LIMIT = 3
+        with conf.set_temp('UPLOAD_CHUNK_SIZE', 2):
+            results = tap.cone_search(sc, Quantity(1, u.deg))
+
+        # the first chunk is truncated, the matches of the next ones are
+        # left out as a single query would
+        assert len(calls) == 2
+        assert results['target_idx'].tolist() == [0, 0, 1]
+
+        # without row limit, the synchronous jobs are truncated by the archive
+        calls = []
+        tap.launch_job = self.__fake_launch_job(False, calls)
+        tap.ROW_LIMIT = -1
+        tap.SYNC_JOB_ROW_LIMIT = 4
+        with conf.set_temp('UPLOAD_CHUNK_SIZE', 2):
+            results = tap.cone_search(sc, Quantity(1, u.deg))
+        assert len(calls) == 2
+        assert results['target_idx'].tolist() == [0, 0, 1, 1]
+
     def __check_results_column(self, results, columnName, description, unit,
                                dataType):
         c = results[columnName]
@@ -579,3 +678,98 @@ class TestTap(unittest.TestCase):
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
+
+
+class DummyDataHandler:
+    """Writes the archive of the products of each chunk of identifiers"""
+
+    def __init__(self):
+        self.ids = []
+
+    def load_data(self, params_dict, output_file=None, verbose=False):
+        ids = params_dict['ID'].split(',')
+        self.ids.append(ids)
+        combined = Table({'source_id': np.array(ids, dtype=int)})
+        votable = io.BytesIO()
+        from_table(combined).to_xml(votable)
+        hdus = io.BytesIO()
+        fits.HDUList([fits.PrimaryHDU(), fits.BinTableHDU(combined)]).writeto(hdus)
+        with zipfile.ZipFile(output_file, 'w') as zip_ref:
+            for source_id in ids:
+                zip_ref.writestr(f"EPOCH_PHOTOMETRY-Gaia DR3 {source_id}.csv",
+                                 f"source_id,g_flux\n{source_id},1.5\n")
+            zip_ref.writestr("XP_SAMPLED_COMBINED.xml", votable.getvalue())
+            zip_ref.writestr("RVS_COMBINED.fits", hdus.getvalue())
+            zip_ref.writestr("README.txt", "not a product")
+
+
+@pytest.mark.parametrize('output_file', [None, 'products.zip'])
+def test_load_data_chunks(tmp_path, monkeypatch, output_file):
+    workdir = tmp_path / 'work'
+    tempdir = tmp_path / 'temp'
+    workdir.mkdir()
+    tempdir.mkdir()
+    monkeypatch.chdir(workdir)
+    monkeypatch.setattr(tempfile, 'tempdir', str(tempdir))
+    reads = []
+
+    def read(name, content, read=DataProducts._read):
+        reads.append(name)
+        return read(name, content)
+
+    monkeypatch.setattr(DataProducts, '_read', staticmethod(read))
+    handler = DummyDataHandler()
+    tap = GaiaClass(DummyTapHandler(), handler)
+    with conf.set_temp('LOAD_DATA_CHUNK_SIZE', 2):
+        files = tap.load_data(ids=[1, 2, 3, 4, 5], retrieval_type='ALL', output_file=output_file)
+
+    assert sorted(handler.ids) == [['1', '2'], ['3', '4'], ['5']]
+    if output_file is None:
+        assert os.listdir(workdir) == []
+        # the products are kept in a temporary directory
+        assert len(os.listdir(tempdir)) == 1
+    else:
+        assert sorted(os.listdir(workdir)) == ['products_0.zip', 'products_1.zip', 'products_2.zip']
+        assert os.listdir(tempdir) == []
+
+    assert isinstance(files, DataProducts)
+    assert sorted(files) == ([f"EPOCH_PHOTOMETRY-Gaia DR3 {source_id}.csv" for source_id in range(1, 6)]
+                             + ['RVS_COMBINED.fits', 'XP_SAMPLED_COMBINED.xml'])
+    # the products are read when they are accessed
+    assert reads == []
+    tables = files['EPOCH_PHOTOMETRY-Gaia DR3 3.csv']
+    assert reads == ['EPOCH_PHOTOMETRY-Gaia DR3 3.csv']
+    # and parsed once
+    assert files['EPOCH_PHOTOMETRY-Gaia DR3 3.csv'] is tables
+    assert reads == ['EPOCH_PHOTOMETRY-Gaia DR3 3.csv']
+    assert len(tables) == 1
+    assert tables[0]['source_id'][0] == 3
+    assert tables[0]['g_flux'][0] == 1.5
+    # the combined products of the chunks are gathered
+    assert [table.to_table()['source_id'].tolist() for table in files['XP_SAMPLED_COMBINED.xml']] == \
+        [[1, 2], [3, 4], [5]]
+    assert [table['source_id'].tolist() for table in files['RVS_COMBINED.fits']] == [[1, 2], [3, 4], [5]]
+
+    # the temporary directory is removed with the products
+    del files, tables
+    gc.collect()
+    assert os.listdir(tempdir) == []
+    if output_file is not None:
+        assert len(os.listdir(workdir)) == 3
+
+
+def test_load_data_chunks_overwrite(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # only the numbered file of a chunk exists
+    (tmp_path / 'products_1.zip').write_bytes(b'existing')
+    handler = DummyDataHandler()
+    tap = GaiaClass(DummyTapHandler(), handler)
+    with conf.set_temp('LOAD_DATA_CHUNK_SIZE', 2):
+        with pytest.raises(ValueError, match='products_1.zip file already exists'):
+            tap.load_data(ids=[1, 2, 3, 4, 5], retrieval_type='ALL', output_file='products.zip')
+        assert handler.ids == []
+        assert (tmp_path / 'products_1.zip').read_bytes() == b'existing'
+
+        tap.load_data(ids=[1, 2, 3, 4, 5], retrieval_type='ALL', output_file='products.zip',
+                      overwrite_output_file=True)
+    assert zipfile.is_zipfile(tmp_path / 'products_1.zip')
@@ -9,6 +9,7 @@ from astropy import units as u
 from ..query import BaseQuery
 from ..utils import commons
 from ..utils import async_to_sync
+from ..utils.responses import ResponseReader
 from ..exceptions import InvalidQueryError, NoResultsWarning
 from . import conf
 
@@ -225,21 +226,23 @@ class HeasarcClass(BaseQuery):
         if not verbose:
             commons.suppress_vo_warnings()
 
-        if "BATCH_RETRIEVAL_MSG ERROR:" in response.text:
+        # the messages are looked for in the beginning and the end of the raw
+        # body, which is only decoded to text to be shown or fixed
+        reader = ResponseReader(response)
+        if reader.find("BATCH_RETRIEVAL_MSG ERROR:"):
             raise InvalidQueryError("One or more inputs is not recognized by HEASARC. "
                              "Check that the object name is in GRB, SIMBAD+Sesame, or "
                              "NED format and that the mission name is as listed in "
                              "query_mission_list().")
-        elif "Software error:" in response.text:
+        elif reader.find("Software error:"):
             raise InvalidQueryError("Unspecified error from HEASARC database. "
                                     "\nCheck error message: \n{!s}".format(response.text))
-        elif "NO MATCHING ROWS" in response.text:
+        elif reader.find("NO MATCHING ROWS"):
             warnings.warn(NoResultsWarning("No matching rows were found in the query."))
             return Table()
 
         try:
-            data = BytesIO(response.content)
-            table = Table.read(data, hdu=1)
+            table = Table.read(reader.open(), hdu=1)
             return table
         except ValueError:
             try:
@@ -1,8 +1,9 @@
-from astropy.table import Table
+import numpy as np
 from astropy import units as u
 
 from ..query import BaseQuery
 from ..utils import async_to_sync, prepend_docstr_nosections
+from ..utils.fixed_width import read_fixed_width
 from . import conf
 from .utils import parse_readme
 
@@ -229,22 +230,13 @@ class HitranClass(BaseQuery):
         """
         formats = parse_readme(self.FORMATFILE)
 
+        col_ends = np.cumsum([entry['length'] for entry in formats.values()])
+        col_starts = np.concatenate([[0], col_ends[:-1]])
         dtypes = [entry['dtype'] for entry in formats.values()]
 
-        rows = []
-        for line in response.text.split('\n'):
-            if line.strip():
-                row = []
-                start = 0
-                for key, entry in formats.items():
-                    formatter = entry['formatter']
-                    length = entry['length']
-                    value = formatter(line[start:start+length])
-                    row.append(value)
-                    start = start + length
-                rows.append(row)
-
-        result = Table(rows=rows, names=formats.keys(), dtype=dtypes)
+        result = read_fixed_width(response.text, names=list(formats.keys()),
+                                  col_starts=col_starts.tolist(),
+                                  col_ends=col_ends.tolist(), dtypes=dtypes)
 
         return result
 
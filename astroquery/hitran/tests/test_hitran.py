@@ -1,11 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import os
 import numpy as np
+import pytest
 
 from astropy import units as u
 from astropy.table import Table
 
 from ...hitran import Hitran
+from ...hitran import core
+from ...utils.tests.reference import check_reference
 
 HITRAN_DATA = 'H2O.data'
 
@@ -52,3 +55,33 @@ def test_query():
                                    'line_mixing_flag', 'gp', 'gpp'])
     assert tbl['molec_id'][0] == 1
     np.testing.assert_almost_equal(tbl['nu'][0], 0.072059)
+
+
+def _reference_read_fixed_width(content, names, col_starts, col_ends, dtypes):
+    formatters = [str if dtype.startswith('S') else {'f': float, 'i': int}[dtype]
+                  for dtype in dtypes]
+    rows = []
+    for line in content.split('\n'):
+        if line.strip():
+            rows.append([formatter(line[start:end]) for formatter, start, end
+                         in zip(formatters, col_starts, col_ends)])
+    return Table(rows=rows, names=names, dtype=dtypes)
+
+
+def test_parse_result_reference(monkeypatch):
+    # the columns are read as by a line by line reader
+    response = MockResponseHitran()
+    tbl = check_reference(lambda: Hitran._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', _reference_read_fixed_width)
+    assert len(tbl) == 122
+
+
+@pytest.mark.benchmark
+def test_parse_result_benchmark(monkeypatch):
+    # the recorded response is replicated to a realistic size
+    response = MockResponseHitran()
+    monkeypatch.setattr(MockResponseHitran, 'text', response.text * 200)
+    tbl = check_reference(lambda: Hitran._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', _reference_read_fixed_width,
+                          num_tries=3)
+    assert len(tbl) == 24400
@@ -0,0 +1,451 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Instrumentation of the requests sent by the query classes.
+
+Each HTTP request sent by `~astroquery.query.BaseQuery` (``_request`` and
+``_download_file``) or by `~astroquery.utils.tap.conn.tapconn.TapConn`, and
+each parsing of a response by ``_parse_result``, gives a `RequestEvent`. The
+events of a query instance are aggregated in the summary returned by its
+``stats()`` method, and given to the exporters of its ``instrumentation``,
+of which there are none by default.
+"""
+import abc
+import contextlib
+import logging
+import re
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import numpy as np
+import requests
+from urllib3 import connection, connectionpool
+
+import astropy.units as u
+from astropy.table import Table
+
+from astroquery import log
+
+__all__ = ['RequestEvent', 'Instrumentation', 'Exporter', 'CallbackExporter',
+           'LoggingExporter', 'SpanExporter', 'TimedHTTPAdapter',
+           'url_template', 'record_connect', 'take_connect']
+
+
+# path segments holding an identifier, such as the jobs of the TAP services
+_ID_SEGMENT = re.compile(r'^[^/]*[0-9]{6,}[^/]*$')
+
+
+def url_template(url):
+    """
+    Return the template of ``url`` under which its requests are aggregated.
+
+    The template is the URL without its credentials, query and fragment,
+    where the path segments holding identifiers (runs of at least 6 digits)
+    are replaced by ``{id}``.
+    """
+    if url is None:
+        return None
+    parts = urlsplit(url)
+    path = '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment
+                    for segment in parts.path.split('/'))
+    return urlunsplit((parts.scheme, parts.netloc.rpartition('@')[2], path, '', ''))
+
+
+# time spent opening connections by each thread, since the start of its
+# current event
+_connections = threading.local()
+
+
+def record_connect(seconds):
+    """
+    Add ``seconds`` to the time spent by the current thread opening
+    connections, which is reported as the ``connect`` time of its current
+    request.
+    """
+    _connections.connect = (getattr(_connections, 'connect', None) or 0) + seconds
+
+
+def take_connect():
+    """
+    Return the time spent by the current thread opening connections since
+    the previous call, `None` if no connection was opened.
+    """
+    connect = getattr(_connections, 'connect', None)
+    _connections.connect = None
+    return connect
+
+
+class _TimedConnectionMixin:
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            record_connect(time.perf_counter() - start)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, connection.HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, connection.HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    `requests` adapter measuring the time spent opening connections,
+    including the name resolution and the TLS handshake.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool}
+
+
+_EVENT_FIELDS = ('service', 'kind', 'method', 'url', 'status', 'cache',
+                 'start', 'connect', 'ttfb', 'total', 'bytes_sent',
+                 'bytes_received', 'retries', 'error')
+
+
+class RequestEvent:
+    """
+    Measurements of a request, or of the parsing of a response.
+
+    The fields which were not measured are `None`.
+
+    Attributes
+    ----------
+    service : str
+        Name of the instrumented service, e.g. its class name.
+    kind : str
+        ``'request'`` for the requests of ``_request`` and of `TapConn`,
+        ``'download'`` for those of ``_download_file``, and ``'parse'``
+        for the parsing of a response by ``_parse_result``.
+    method : str
+        The HTTP method.
+    url : str
+        The template of the URL, see `url_template`.
+    status : int
+        The HTTP status code of the response.
+    cache : str
+        ``'hit'`` if the response was found in the cache, ``'miss'`` if it
+        was requested and cached, `None` if the cache was not used.
+    start : float
+        The start of the request, in seconds since the epoch.
+    connect : float
+        Time spent opening new connections, including the name resolution
+        and the TLS handshake, in seconds. `None` when a kept-alive
+        connection was reused.
+    ttfb : float
+        Time to the first byte, until the headers of the response were
+        received, in seconds.
+    total : float
+        Total duration, in seconds. It includes the reading of the body of
+        the responses which are not streamed.
+    bytes_sent : int
+        Size of the body of the request.
+    bytes_received : int
+        Size of the body of the response, 0 for the cache hits.
+    retries : int
+        Number of times the request was retried.
+    error : str
+        Name of the class of the exception raised, if any.
+    """
+
+    __slots__ = _EVENT_FIELDS + ('_perf_start',)
+
+    def __init__(self, **fields):
+        for name in _EVENT_FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown fields {', '.join(fields)}")
+        self._perf_start = time.perf_counter()
+        if self.start is None:
+            self.start = time.time()
+
+    def elapsed(self):
+        """
+        Return the time elapsed since the event started, in seconds.
+        """
+        return time.perf_counter() - self._perf_start
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in _EVENT_FIELDS}
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value!r}' for name, value in self.as_dict().items()
+                           if value is not None)
+        return f'RequestEvent({fields})'
+
+
+class Exporter(abc.ABC):
+    """
+    Base class of the exporters of `RequestEvent`.
+    """
+
+    @abc.abstractmethod
+    def export(self, event):
+        """
+        Export a `RequestEvent`.
+        """
+
+
+class CallbackExporter(Exporter):
+    """
+    Exporter calling a function with each `RequestEvent`.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def export(self, event):
+        self.callback(event)
+
+
+class LoggingExporter(Exporter):
+    """
+    Exporter logging each `RequestEvent` as ``name=value`` pairs.
+
+    Parameters
+    ----------
+    level : int, optional
+        Level of the log records, ``logging.INFO`` by default.
+    logger : `logging.Logger`, optional
+        The logger, the astroquery logger by default.
+    """
+
+    def __init__(self, level=logging.INFO, logger=None):
+        self.level = level
+        self.logger = logger or log
+
+    def export(self, event):
+        self.logger.log(self.level, 'request ' + ' '.join(
+            f'{name}={value}' for name, value in event.as_dict().items()
+            if value is not None))
+
+
+class SpanExporter(Exporter):
+    """
+    Exporter recording each `RequestEvent` as an OpenTelemetry span.
+
+    Parameters
+    ----------
+    tracer : optional
+        The tracer starting the spans, with the ``start_span(name,
+        start_time=..., attributes=...)`` method of the OpenTelemetry tracers.
+        By default, the ``astroquery`` tracer of ``opentelemetry.trace``,
+        which requires the ``opentelemetry-api`` package.
+    """
+
+    def __init__(self, tracer=None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError("SpanExporter needs a tracer, or the "
+                                  "opentelemetry-api package to be installed")
+            tracer = trace.get_tracer('astroquery')
+        self.tracer = tracer
+
+    def export(self, event):
+        fields = event.as_dict()
+        attributes = {f'astroquery.{name}': value for name, value in fields.items()
+                      if value is not None and name != 'start'}
+        # the attributes of the HTTP semantic conventions
+        for name, attribute in (('method', 'http.method'), ('url', 'http.url'),
+                                ('status', 'http.status_code')):
+            if fields[name] is not None:
+                attributes[attribute] = fields[name]
+        start = int(event.start * 1e9)
+        span = self.tracer.start_span(f'{event.service} {event.kind}',
+                                      start_time=start, attributes=attributes)
+        span.end(end_time=start + int((event.total or 0) * 1e9))
+
+
+class _Aggregate:
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.bytes_received = 0
+        self.total_time = 0.
+        self.max_time = 0.
+        self.connects = []
+        self.ttfbs = []
+
+    def add(self, event):
+        self.count += 1
+        self.errors += event.error is not None
+        self.cache_hits += event.cache == 'hit'
+        self.retries += event.retries or 0
+        self.bytes_received += event.bytes_received or 0
+        self.total_time += event.total or 0
+        self.max_time = max(self.max_time, event.total or 0)
+        if event.connect is not None:
+            self.connects.append(event.connect)
+        if event.ttfb is not None:
+            self.ttfbs.append(event.ttfb)
+
+
+class Instrumentation:
+    """
+    Measurements of the requests of a query instance.
+
+    The events are aggregated for `stats`, and given to the ``exporters``.
+    The exceptions raised by the exporters are logged, without failing the
+    requests.
+
+    Parameters
+    ----------
+    service : str
+        Name of the instrumented service, set on its events.
+    exporters : list of `Exporter` or callable, optional
+        The exporters of the events, the functions being wrapped in
+        `CallbackExporter`.
+    """
+
+    def __init__(self, service, exporters=()):
+        self.service = service
+        self.exporters = []
+        for exporter in exporters:
+            self.add_exporter(exporter)
+        self._lock = threading.Lock()
+        self._aggregates = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter):
+        """
+        Add an `Exporter`, or a function called with each event.
+
+        Returns
+        -------
+        exporter : `Exporter`
+            The exporter added, to be given to `remove_exporter`.
+        """
+        if not isinstance(exporter, Exporter):
+            exporter = CallbackExporter(exporter)
+        self.exporters.append(exporter)
+        return exporter
+
+    def remove_exporter(self, exporter):
+        """
+        Remove an `Exporter`.
+        """
+        self.exporters.remove(exporter)
+
+    def start_event(self, kind, method=None, url=None):
+        """
+        Start a `RequestEvent`, to be completed by the caller and given to
+        `finish_event`.
+        """
+        take_connect()
+        return RequestEvent(service=self.service, kind=kind, method=method,
+                            url=url_template(url))
+
+    def finish_event(self, event, error=None):
+        """
+        Set the total duration of ``event`` and the ``error`` raised, then
+        emit it.
+        """
+        event.total = event.elapsed()
+        if error is not None:
+            event.error = type(error).__name__
+        self.emit(event)
+
+    @contextlib.contextmanager
+    def measure(self, kind, method=None, url=None):
+        """
+        Context manager measuring a request or a parsing.
+
+        It yields the `RequestEvent`, which is emitted on exit with its
+        total duration, the time spent opening connections in the current
+        thread, and the exception raised.
+        """
+        event = self.start_event(kind, method=method, url=url)
+        try:
+            yield event
+        except BaseException as ex:
+            event.connect = take_connect()
+            self.finish_event(event, ex)
+            raise
+        event.connect = take_connect()
+        self.finish_event(event)
+
+    def emit(self, event):
+        """
+        Aggregate ``event`` and give it to the exporters.
+        """
+        key = (event.kind, event.method or '', event.url or '')
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                aggregate = self._aggregates[key] = _Aggregate()
+            aggregate.add(event)
+        for exporter in list(self.exporters):
+            try:
+                exporter.export(event)
+            except Exception as ex:
+                log.warning(f"The request event exporter {exporter!r} failed: {ex}")
+
+    def stats(self):
+        """
+        Return the summary of the events, by kind of event, method and URL
+        template.
+
+        Returns
+        -------
+        stats : `~astropy.table.Table`
+            The number of events (``count``), of errors and of cache hits,
+            the number of retries and of bytes received, and the total, mean
+            and maximum durations, with the mean connect time (of the
+            requests opening a connection) and time to first byte.
+        """
+        with self._lock:
+            aggregates = sorted(self._aggregates.items())
+            rows = [(kind, method, url, aggregate.count, aggregate.errors,
+                     aggregate.cache_hits, aggregate.retries, aggregate.bytes_received,
+                     aggregate.total_time, aggregate.total_time / aggregate.count,
+                     aggregate.max_time,
+                     np.mean(aggregate.connects) if aggregate.connects else np.nan,
+                     np.mean(aggregate.ttfbs) if aggregate.ttfbs else np.nan)
+                    for (kind, method, url), aggregate in aggregates]
+
+        names = ('kind', 'method', 'url', 'count', 'errors', 'cache_hits', 'retries',
+                 'bytes_received', 'total_time', 'mean_time', 'max_time',
+                 'mean_connect', 'mean_ttfb')
+        dtypes = ('U8', 'U8', 'U', 'i8', 'i8', 'i8', 'i8', 'i8', 'f8', 'f8', 'f8',
+                  'f8', 'f8')
+        table = Table(rows=rows or None, names=names, dtype=dtypes)
+        table['bytes_received'].unit = u.byte
+        for name in names[8:]:
+            table[name].unit = u.s
+        return table
+
+    def reset(self):
+        """
+        Forget the events aggregated for `stats`.
+        """
+        with self._lock:
+            self._aggregates = {}
@@ -100,15 +100,14 @@ If onlist=0, the following parameters are required:
 """
 
 import warnings
-from io import BytesIO
 import xml.etree.ElementTree as tree
 
 import astropy.units as u
 import astropy.coordinates as coord
-import astropy.io.votable as votable
 
 from astroquery.query import BaseQuery
 from astroquery.utils import commons, async_to_sync
+from astroquery.utils.responses import ResponseReader
 from astroquery.ipac.irsa import conf
 from astroquery.exceptions import TableParseError, NoResultsWarning, InvalidQueryError
 
@@ -188,6 +187,9 @@ class IrsaClass(BaseQuery):
 
         if get_query_payload:
             return request_payload
+        # the responses are not streamed, so that the error messages found at
+        # the end of large bodies are detected, and the raw body is kept in
+        # self.response when it fails to parse
         response = self._request("GET", url=Irsa.IRSA_URL,
                                  params=request_payload, timeout=Irsa.TIMEOUT,
                                  cache=cache)
@@ -309,34 +311,34 @@ class IrsaClass(BaseQuery):
         if not verbose:
             commons.suppress_vo_warnings()
 
-        content = response.text
-
+        # The error messages are looked for at the beginning and at the end
+        # of the raw body, which is not decoded
+        reader = ResponseReader(response)
         # Check if results were returned
-        if 'The catalog is not on the list' in content:
+        if reader.find('The catalog is not on the list'):
             raise ValueError("Invalid Catalog specified")
 
         # Check that object name was not malformed
-        if 'Either wrong or missing coordinate/object name' in content:
+        if reader.find('Either wrong or missing coordinate/object name'):
             raise ValueError("Malformed coordinate/object name")
 
         # Check to see that output table size limit hasn't been exceeded
-        if 'Exceeding output table size limit' in content:
+        if reader.find('Exceeding output table size limit'):
             raise TableParseError("Exceeded output table size - reduce number "
                                   "of output columns and/or limit search area")
 
         # Check to see that the query engine is working
-        if 'SQLConnect failed' in content:
+        if reader.find('SQLConnect failed'):
             raise TimeoutError("The IRSA server is currently down")
 
         # Check that the results are not of length zero
-        if len(content) == 0:
+        if reader.is_empty:
             warnings.warn("The IRSA server sent back an empty reply",
                           NoResultsWarning)
 
         # Read it in using the astropy VO table reader
         try:
-            first_table = votable.parse(BytesIO(response.content),
-                                        verify='warn').get_first_table()
+            first_table = reader.parse_votable(verify='warn').get_first_table()
         except Exception as ex:
             self.response = response
             self.table_parse_error = ex
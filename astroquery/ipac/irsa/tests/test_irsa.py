@@ -9,10 +9,12 @@ from astropy.table import Table
 import astropy.coordinates as coord
 import astropy.units as u
 
+from astroquery.exceptions import TableParseError
 from astroquery.utils.mocks import MockResponse
 from astroquery.utils import commons
 from astroquery.ipac.irsa import Irsa, conf
 from astroquery.ipac import irsa
+from astroquery.ipac.irsa.core import IrsaClass
 
 DATA_FILES = {'Cone': 'Cone.xml',
               'Box': 'Box.xml',
@@ -119,6 +121,37 @@ def test_query_region_box(coordinates, patch_get):
     assert isinstance(result, Table)
 
 
+def test_query_region_not_streamed(monkeypatch):
+    requests_kwargs = []
+
+    def mockreturn(method, url, params=None, timeout=10, cache=False, **kwargs):
+        requests_kwargs.append(dict(cache=cache, **kwargs))
+        # a large body, with the error message at its end
+        with open(data_path(DATA_FILES['Cone']), 'rb') as f:
+            return MockResponse(f.read() * 10 + b'ERROR: Exceeding output table size limit')
+
+    monkeypatch.setattr(Irsa, '_request', mockreturn)
+    with pytest.raises(TableParseError, match='Exceeded output table size'):
+        Irsa.query_region("m31", catalog='fp_psc', spatial='Cone', cache=False)
+
+    assert requests_kwargs == [dict(cache=False)]
+
+
+def test_parse_result_votable_error():
+    irsa = IrsaClass()
+    response = MockResponse(b'<VOTABLE>' * 10000)
+    with pytest.raises(TableParseError, match='self.response'):
+        irsa._parse_result(response)
+    # the raw body is kept for diagnostics
+    assert irsa.response.content == b'<VOTABLE>' * 10000
+
+
+def test_parse_result_error():
+    response = MockResponse(b'<html>ERROR: The catalog is not on the list</html>')
+    with pytest.raises(ValueError, match='Invalid Catalog specified'):
+        Irsa._parse_result(response)
+
+
 poly1 = [coord.SkyCoord(ra=10.1, dec=10.1, unit=(u.deg, u.deg)),
          coord.SkyCoord(ra=10.0, dec=10.1, unit=(u.deg, u.deg)),
          coord.SkyCoord(ra=10.0, dec=10.0, unit=(u.deg, u.deg))]
@@ -1,7 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
 import re
-from io import BytesIO
 from collections import namedtuple
 from xml.dom.minidom import parseString
 
@@ -9,10 +8,10 @@ from datetime import datetime
 
 import astropy.units as u
 import astropy.coordinates as coord
-import astropy.io.votable as votable
 
 from astroquery.query import BaseQuery
 from astroquery.utils import commons
+from astroquery.utils.responses import ResponseReader
 from astroquery.ipac.ned import conf
 from astroquery.exceptions import TableParseError, RemoteServiceError
 
@@ -699,13 +698,13 @@ class NedClass(BaseQuery):
         """
         if not verbose:
             commons.suppress_vo_warnings()
+        reader = ResponseReader(response)
         try:
-            tf = BytesIO(response.content)
-            first_table = votable.parse(tf, verify='warn').get_first_table()
+            first_table = reader.parse_votable(verify='warn').get_first_table()
             table = first_table.to_table(use_names_over_ids=True)
             return table
         except Exception as ex:
-            (is_valid, err_msg) = _check_ned_valid(response.content)
+            (is_valid, err_msg) = _check_ned_valid(reader.content)
             if not is_valid:
                 if err_msg:
                     raise RemoteServiceError(
@@ -119,9 +119,6 @@ class HorizonsClass(BaseQuery):
             raise ValueError('id_type ({:s}) not allowed'.format(id_type))
         self.id_type = id_type
 
-        # return raw response?
-        self.return_raw = False
-
         self.query_type = None  # ['ephemerides', 'elements', 'vectors']
 
         self.uri = None  # will contain query URL
@@ -493,10 +490,12 @@ class HorizonsClass(BaseQuery):
         # check for required information
         if self.id is None:
             raise ValueError("'id' parameter not set. Query aborted.")
-        if self.location is None:
-            self.location = '500@399'
-        if self.epochs is None:
-            self.epochs = Time.now().jd
+        location = self.location
+        if location is None:
+            location = '500@399'
+        epochs = self.epochs
+        if epochs is None:
+            epochs = Time.now().jd
 
         # assemble commandline based on self.id_type
         commandline = str(self.id)
@@ -534,44 +533,42 @@ class HorizonsClass(BaseQuery):
             ('REF_SYSTEM', refsystem),
             ('EXTRA_PREC', {True: 'YES', False: 'NO'}[extra_precision])])
 
-        if isinstance(self.location, dict):
-            if ('lon' not in self.location or 'lat' not in self.location or
-                    'elevation' not in self.location):
+        if isinstance(location, dict):
+            if ('lon' not in location or 'lat' not in location or
+                    'elevation' not in location):
                 raise ValueError(("'location' must contain lon, lat, "
                                   "elevation"))
 
-            if 'body' not in self.location:
-                self.location['body'] = '399'
             request_payload['CENTER'] = 'coord@{:s}'.format(
-                str(self.location['body']))
+                str(location.get('body', '399')))
             request_payload['COORD_TYPE'] = 'GEODETIC'
             request_payload['SITE_COORD'] = "'{:f},{:f},{:f}'".format(
-                self.location['lon'], self.location['lat'],
-                self.location['elevation'])
+                location['lon'], location['lat'],
+                location['elevation'])
         else:
-            request_payload['CENTER'] = "'" + str(self.location) + "'"
+            request_payload['CENTER'] = "'" + str(location) + "'"
 
         if rate_cutoff is not None:
             request_payload['ANG_RATE_CUTOFF'] = (str(rate_cutoff))
 
-        # parse self.epochs
-        if isinstance(self.epochs, (list, tuple, ndarray)):
+        # parse epochs
+        if isinstance(epochs, (list, tuple, ndarray)):
             request_payload['TLIST'] = "\n".join([str(epoch) for epoch in
-                                                  self.epochs])
-        elif isinstance(self.epochs, dict):
-            if ('start' not in self.epochs or 'stop' not in self.epochs or
-                    'step' not in self.epochs):
+                                                  epochs])
+        elif isinstance(epochs, dict):
+            if ('start' not in epochs or 'stop' not in epochs or
+                    'step' not in epochs):
                 raise ValueError("'epochs' must contain start, " +
                                  "stop, step")
             request_payload['START_TIME'] = (
-                '"'+self.epochs['start'].replace("'", '')+'"')
+                '"'+epochs['start'].replace("'", '')+'"')
             request_payload['STOP_TIME'] = (
-                '"'+self.epochs['stop'].replace("'", '')+'"')
+                '"'+epochs['stop'].replace("'", '')+'"')
             request_payload['STEP_SIZE'] = (
-                '"'+self.epochs['step'].replace("'", '')+'"')
+                '"'+epochs['step'].replace("'", '')+'"')
         else:
             # treat epochs as scalar
-            request_payload['TLIST'] = str(self.epochs)
+            request_payload['TLIST'] = str(epochs)
 
         if airmass_lessthan < 99:
             request_payload['AIRMASS'] = str(airmass_lessthan)
@@ -587,14 +584,14 @@ class HorizonsClass(BaseQuery):
         if get_query_payload:
             return request_payload
 
-        # set return_raw flag, if raw response desired
-        if get_raw_response:
-            self.return_raw = True
-
         # query and parse
         response = self._request('GET', URL, params=request_payload,
                                  timeout=self.TIMEOUT, cache=cache)
         self.uri = response.url
+        # the query type and the raw response flag travel with the response,
+        # so that concurrent queries on this instance do not mix them up
+        response.query_type = 'ephemerides'
+        response.return_raw = get_raw_response
 
         # check length of uri
         if len(self.uri) >= 2000:
@@ -723,10 +720,12 @@ class HorizonsClass(BaseQuery):
         # check for required information
         if self.id is None:
             raise ValueError("'id' parameter not set. Query aborted.")
-        if self.location is None:
-            self.location = '500@10'
-        if self.epochs is None:
-            self.epochs = Time.now().jd
+        location = self.location
+        if location is None:
+            location = '500@10'
+        epochs = self.epochs
+        if epochs is None:
+            epochs = Time.now().jd
 
         # assemble commandline based on self.id_type
         commandline = str(self.id)
@@ -748,7 +747,7 @@ class HorizonsClass(BaseQuery):
             if no_fragments:
                 commandline += ' NOFRAG;'
 
-        if isinstance(self.location, dict):
+        if isinstance(location, dict):
             raise ValueError(('cannot use topographic position in orbital'
                               'elements query'))
 
@@ -759,7 +758,7 @@ class HorizonsClass(BaseQuery):
             ('MAKE_EPHEM', 'YES'),
             ('OUT_UNITS', 'AU-D'),
             ('COMMAND', '"' + commandline + '"'),
-            ('CENTER', ("'" + str(self.location) + "'")),
+            ('CENTER', ("'" + str(location) + "'")),
             ('CSV_FORMAT', 'YES'),
             ('ELEM_LABELS', 'YES'),
             ('OBJ_DATA', 'YES'),
@@ -769,25 +768,25 @@ class HorizonsClass(BaseQuery):
             ('TP_TYPE', {'absolute': 'ABSOLUTE',
                          'relative': 'RELATIVE'}[tp_type])])
 
-        # parse self.epochs
-        if isinstance(self.epochs, (list, tuple, ndarray)):
+        # parse epochs
+        if isinstance(epochs, (list, tuple, ndarray)):
             request_payload['TLIST'] = "\n".join([str(epoch) for
                                                   epoch in
-                                                  self.epochs])
-        elif type(self.epochs) is dict:
-            if ('start' not in self.epochs or 'stop' not in self.epochs or
-                    'step' not in self.epochs):
+                                                  epochs])
+        elif type(epochs) is dict:
+            if ('start' not in epochs or 'stop' not in epochs or
+                    'step' not in epochs):
                 raise ValueError("'epochs' must contain start, "
                                  "stop, step")
             request_payload['START_TIME'] = (
-                '"'+self.epochs['start'].replace("'", '')+'"')
+                '"'+epochs['start'].replace("'", '')+'"')
             request_payload['STOP_TIME'] = (
-                '"'+self.epochs['stop'].replace("'", '')+'"')
+                '"'+epochs['stop'].replace("'", '')+'"')
             request_payload['STEP_SIZE'] = (
-                '"'+self.epochs['step'].replace("'", '')+'"')
+                '"'+epochs['step'].replace("'", '')+'"')
 
         else:
-            request_payload['TLIST'] = str(self.epochs)
+            request_payload['TLIST'] = str(epochs)
 
         self.query_type = 'elements'
 
@@ -795,14 +794,14 @@ class HorizonsClass(BaseQuery):
         if get_query_payload:
             return request_payload
 
-        # set return_raw flag, if raw response desired
-        if get_raw_response:
-            self.return_raw = True
-
         # query and parse
         response = self._request('GET', URL, params=request_payload,
                                  timeout=self.TIMEOUT, cache=cache)
         self.uri = response.url
+        # the query type and the raw response flag travel with the response,
+        # so that concurrent queries on this instance do not mix them up
+        response.query_type = 'elements'
+        response.return_raw = get_raw_response
 
         # check length of uri
         if len(self.uri) >= 2000:
@@ -953,10 +952,12 @@ class HorizonsClass(BaseQuery):
         # check for required information
         if self.id is None:
             raise ValueError("'id' parameter not set. Query aborted.")
-        if self.location is None:
-            self.location = '500@10'
-        if self.epochs is None:
-            self.epochs = Time.now().jd
+        location = self.location
+        if location is None:
+            location = '500@10'
+        epochs = self.epochs
+        if epochs is None:
+            epochs = Time.now().jd
 
         # assemble commandline based on self.id_type
         commandline = str(self.id)
@@ -979,7 +980,7 @@ class HorizonsClass(BaseQuery):
             if no_fragments:
                 commandline += ' NOFRAG;'
 
-        if isinstance(self.location, dict):
+        if isinstance(location, dict):
             raise ValueError(('cannot use topographic position in state'
                               'vectors query'))
 
@@ -989,7 +990,7 @@ class HorizonsClass(BaseQuery):
             ('EPHEM_TYPE', 'VECTORS'),
             ('OUT_UNITS', 'AU-D'),
             ('COMMAND', '"' + commandline + '"'),
-            ('CENTER', ("'" + str(self.location) + "'")),
+            ('CENTER', ("'" + str(location) + "'")),
             ('CSV_FORMAT', ('"YES"')),
             ('REF_PLANE', {'ecliptic': 'ECLIPTIC',
                            'earth': 'FRAME',
@@ -1005,25 +1006,25 @@ class HorizonsClass(BaseQuery):
             ('OBJ_DATA', 'YES')]
         )
 
-        # parse self.epochs
-        if isinstance(self.epochs, (list, tuple, ndarray)):
+        # parse epochs
+        if isinstance(epochs, (list, tuple, ndarray)):
             request_payload['TLIST'] = "\n".join([str(epoch) for epoch in
-                                                  self.epochs])
-        elif type(self.epochs) is dict:
-            if ('start' not in self.epochs or 'stop' not in self.epochs or
-                    'step' not in self.epochs):
+                                                  epochs])
+        elif type(epochs) is dict:
+            if ('start' not in epochs or 'stop' not in epochs or
+                    'step' not in epochs):
                 raise ValueError("'epochs' must contain start, " +
                                  "stop, step")
             request_payload['START_TIME'] = (
-                '"'+self.epochs['start'].replace("'", '')+'"')
+                '"'+epochs['start'].replace("'", '')+'"')
             request_payload['STOP_TIME'] = (
-                '"'+self.epochs['stop'].replace("'", '')+'"')
+                '"'+epochs['stop'].replace("'", '')+'"')
             request_payload['STEP_SIZE'] = (
-                '"'+self.epochs['step'].replace("'", '')+'"')
+                '"'+epochs['step'].replace("'", '')+'"')
 
         else:
             # treat epochs as a list
-            request_payload['TLIST'] = str(self.epochs)
+            request_payload['TLIST'] = str(epochs)
 
         self.query_type = 'vectors'
 
@@ -1031,14 +1032,14 @@ class HorizonsClass(BaseQuery):
         if get_query_payload:
             return request_payload
 
-        # set return_raw flag, if raw response desired
-        if get_raw_response:
-            self.return_raw = True
-
         # query and parse
         response = self._request('GET', URL, params=request_payload,
                                  timeout=self.TIMEOUT, cache=cache)
         self.uri = response.url
+        # the query type and the raw response flag travel with the response,
+        # so that concurrent queries on this instance do not mix them up
+        response.query_type = 'vectors'
+        response.return_raw = get_raw_response
 
         # check length of uri
         if len(self.uri) >= 2000:
@@ -1051,7 +1052,7 @@ class HorizonsClass(BaseQuery):
 
     # ---------------------------------- parser functions
 
-    def _parse_horizons(self, src):
+    def _parse_horizons(self, src, query_type=None, return_raw=False):
         """
         Routine for parsing data from JPL Horizons
 
@@ -1061,6 +1062,11 @@ class HorizonsClass(BaseQuery):
         self : HorizonsClass instance
         src : list
             raw response from server
+        query_type : str, optional
+            ``'ephemerides'``, ``'elements'`` or ``'vectors'``, defaults to
+            the type of the last query
+        return_raw : bool, optional
+            return the raw response instead of a table
 
 
         Returns
@@ -1068,13 +1074,13 @@ class HorizonsClass(BaseQuery):
         data : `astropy.Table`
         """
 
-        self.raw_response = src
+        self.raw_response = raw_response = src
+        if query_type is None:
+            query_type = self.query_type
 
         # return raw response, if desired
-        if self.return_raw:
-            # reset return_raw flag
-            self.return_raw = False
-            return self.raw_response
+        if return_raw:
+            return raw_response
 
         # split response by line break
         src = src.split('\n')
@@ -1086,19 +1092,19 @@ class HorizonsClass(BaseQuery):
         headerline = []
         for idx, line in enumerate(src):
             # read in ephemerides header line; replace some field names
-            if (self.query_type == 'ephemerides' and
+            if (query_type == 'ephemerides' and
                     "Date__(UT)__HR:MN" in line):
                 headerline = str(line).split(',')
                 headerline[2] = 'solar_presence'
                 headerline[3] = 'flags'
                 headerline[-1] = '_dump'
             # read in elements header line
-            elif (self.query_type == 'elements' and
+            elif (query_type == 'elements' and
                   "JDTDB," in line):
                 headerline = str(line).split(',')
                 headerline[-1] = '_dump'
             # read in vectors header line
-            elif (self.query_type == 'vectors' and
+            elif (query_type == 'vectors' and
                   "JDTDB," in line):
                 headerline = str(line).split(',')
                 headerline[-1] = '_dump'
@@ -1184,7 +1190,7 @@ class HorizonsClass(BaseQuery):
             else:
                 raise ValueError(('Query failed without known error message; '
                                   'received the following response:\n'
-                                  '{}').format(self.raw_response))
+                                  '{}').format(raw_response))
         # strip whitespaces from column labels
         headerline = [h.strip() for h in headerline]
 
@@ -1237,15 +1243,15 @@ class HorizonsClass(BaseQuery):
                                    name='phasecoeff'), index=7)
 
         # replace missing airmass values with 999 (not observable)
-        if self.query_type == 'ephemerides' and 'a-mass' in data.colnames:
+        if query_type == 'ephemerides' and 'a-mass' in data.colnames:
             data['a-mass'] = data['a-mass'].filled(999)
 
         # set column definition dictionary
-        if self.query_type == 'ephemerides':
+        if query_type == 'ephemerides':
             column_defs = conf.eph_columns
-        elif self.query_type == 'elements':
+        elif query_type == 'elements':
             column_defs = conf.elem_columns
-        elif self.query_type == 'vectors':
+        elif query_type == 'vectors':
             column_defs = conf.vec_columns
         else:
             raise TypeError('Query type unknown.')
@@ -1271,8 +1277,8 @@ class HorizonsClass(BaseQuery):
         Routine for managing parser calls;
 
 
-        This routine decides based on `self.query_type` which parser
-        has to be used.
+        This routine decides based on the query type of the response which
+        parser has to be used.
 
 
         Parameters
@@ -1288,14 +1294,17 @@ class HorizonsClass(BaseQuery):
 
         """
         self.last_response = response
-        if self.query_type not in ['ephemerides', 'elements', 'vectors']:
+        query_type = getattr(response, 'query_type', self.query_type)
+        if query_type not in ['ephemerides', 'elements', 'vectors']:
             return None
         else:
             try:
-                data = self._parse_horizons(response.text)
+                data = self._parse_horizons(
+                    response.text, query_type=query_type,
+                    return_raw=getattr(response, 'return_raw', False))
             except Exception as ex:
                 try:
-                    self._last_query.remove_cache_file(self.cache_location)
+                    self._remove_last_query_from_cache(response)
                 except OSError:
                     # this is allowed: if `cache` was set to False, this
                     # won't be needed
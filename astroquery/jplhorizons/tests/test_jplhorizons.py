@@ -3,7 +3,10 @@
 from multiprocessing import Value
 import pytest
 import os
+import pickle
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from numpy.ma import is_masked
 from astropy.tests.helper import assert_quantity_allclose
@@ -67,6 +70,27 @@ def test_parse_result(patch_request):
         res = q.ephemerides()
 
 
+def test_parse_result_cache(monkeypatch, tmp_path):
+    def request(query, session, cache_location=None, **kwargs):
+        with open(data_path(DATA_FILES.get(query.params['COMMAND'], DATA_FILES['ephemerides'])),
+                  'rb') as f:
+            return MockResponse(content=f.read(), url=query.url)
+
+    monkeypatch.setattr(AstroQuery, 'request', request)
+    obj = jplhorizons.Horizons(id='tlist_error', location='500', epochs=2451544.5)
+    obj.cache_location = str(tmp_path)
+    response = obj.ephemerides_async()
+    # another query of the instance, e.g. from another thread
+    obj._request('GET', jplhorizons.conf.horizons_server, params={'COMMAND': '"Ceres"'})
+    assert len(os.listdir(tmp_path)) == 2
+    with pytest.raises(ValueError):
+        obj._parse_result(response)
+    # only the entry of the response failing to parse is removed
+    cached, = os.listdir(tmp_path)
+    with open(os.path.join(tmp_path, cached), 'rb') as f:
+        assert b'Ceres' in pickle.load(f).content
+
+
 def test_ephemerides_query(patch_request):
     # check values of Ceres for a given epoch
     # orbital uncertainty of Ceres is basically zero
@@ -241,3 +265,33 @@ def test_id_type_deprecation():
 
     with pytest.warns(AstropyDeprecationWarning):
         res = jplhorizons.Horizons(id='Ceres', id_type='majorbody')
+
+
+def test_concurrent_queries(monkeypatch):
+    # slow down the requests, so that the queries interleave
+    def slow_request(self, request_type, url, **kwargs):
+        time.sleep(0.005)
+        return nonremote_request(self, request_type, url, **kwargs)
+
+    monkeypatch.setattr(jplhorizons.core.HorizonsClass, '_request',
+                        slow_request)
+    obj = jplhorizons.Horizons(id='Ceres', location='500@10',
+                               epochs=2451544.5)
+    calls = [('ephemerides', False), ('elements', False), ('vectors', False),
+             ('vectors', True)] * 10
+
+    def query(call):
+        query_type, get_raw_response = call
+        return getattr(obj, query_type)(get_raw_response=get_raw_response)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(query, calls))
+
+    for (query_type, get_raw_response), result in zip(calls, results):
+        if get_raw_response:
+            assert isinstance(result, str)
+        else:
+            assert {'ephemerides': 'elongFlag', 'elements': 'Omega',
+                    'vectors': 'vx'}[query_type] in result.colnames
+    # the default location is not stored on the instance
+    assert obj.location == '500@10'
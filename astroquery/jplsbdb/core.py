@@ -22,12 +22,6 @@ class SBDBClass(BaseQuery):
     <https://ssd.jpl.nasa.gov/sbdb.cgi>`_ service.
     """
 
-    # internal flag whether to return the raw reponse
-    _return_raw = False
-
-    # actual query uri
-    _uri = None
-
     def query_async(self, targetid, id_type='search',
                     neo_only=False,
                     alternate_id=False,
@@ -174,11 +168,10 @@ class SBDBClass(BaseQuery):
                                  params=request_payload,
                                  timeout=TIMEOUT, cache=cache)
 
-        if get_raw_response:
-            self._return_raw = True
-
-        if get_uri:
-            self._uri = response.url
+        # the parsing options travel with the response, so that concurrent
+        # queries do not interfere with each other
+        response.return_raw = get_raw_response
+        response.query_uri = response.url if get_uri else None
 
         return response
 
@@ -188,7 +181,7 @@ class SBDBClass(BaseQuery):
 
         """
 
-        if self._return_raw:
+        if getattr(response, 'return_raw', False):
             return response.text
 
         # decode json response from JPL SBDB server into ascii
@@ -207,8 +200,8 @@ class SBDBClass(BaseQuery):
         src = self._process_data(src)
 
         # add query uri, if desired
-        if self._uri is not None:
-            src['query_uri'] = self._uri
+        if getattr(response, 'query_uri', None) is not None:
+            src['query_uri'] = response.query_uri
 
         return src
 
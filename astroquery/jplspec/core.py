@@ -6,6 +6,7 @@ import astropy.units as u
 from astropy.io import ascii
 from ..query import BaseQuery
 from ..utils import async_to_sync
+from ..utils.fixed_width import read_fixed_width
 # import configurable items declared in __init__.py
 from . import conf
 from . import lookup_table
@@ -163,12 +164,11 @@ class JPLSpecClass(BaseQuery):
         # data starts at 0 since regex was applied
         # Warning for a result with more than 1000 lines:
         # THIS form is currently limited to 1000 lines.
-        result = ascii.read(response.text, header_start=None, data_start=0,
-                            comment=r'THIS|^\s{12,14}\d{4,6}.*',
-                            names=('FREQ', 'ERR', 'LGINT', 'DR', 'ELO', 'GUP',
-                                   'TAG', 'QNFMT', 'QN\'', 'QN"'),
-                            col_starts=(0, 13, 21, 29, 31, 41, 44, 51, 55, 67),
-                            format='fixed_width', fast_reader=False)
+        result = read_fixed_width(response.text,
+                                  comment=r'THIS|^\s{12,14}\d{4,6}.*',
+                                  names=('FREQ', 'ERR', 'LGINT', 'DR', 'ELO', 'GUP',
+                                         'TAG', 'QNFMT', 'QN\'', 'QN"'),
+                                  col_starts=(0, 13, 21, 29, 31, 41, 44, 51, 55, 67))
 
         if len(result) > self.maxlines:
             warnings.warn("This form is currently limited to {0} lines."
@@ -1,10 +1,14 @@
 import numpy as np
 
 import os
+import pytest
 
 from astropy import units as u
 from astropy.table import Table
 from ...jplspec import JPLSpec
+from ...jplspec import core
+from ...utils.mocks import MockResponse
+from ...utils.tests.reference import check_reference, reference_read_fixed_width
 
 file1 = 'CO.data'
 file2 = 'CO_6.data'
@@ -118,3 +122,24 @@ def test_query_multi():
     assert tbl['TAG'][0] == -18003
     assert tbl['TAG'][38] == -19002
     assert tbl['TAG'][207] == 21001
+
+
+def test_parse_result_reference(monkeypatch):
+    # the columns are read as by the generic fixed-width reader of astropy
+    response = MockResponseSpec(file3)
+    monkeypatch.setattr(JPLSpec, 'maxlines', 2000, raising=False)
+    tbl = check_reference(lambda: JPLSpec._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', reference_read_fixed_width)
+    assert len(tbl) == 208
+
+
+@pytest.mark.benchmark
+def test_parse_result_benchmark(monkeypatch):
+    # the recorded response is replicated to a realistic size
+    with open(data_path(file3), 'rb') as f:
+        response = MockResponse(f.read() * 100)
+    monkeypatch.setattr(JPLSpec, 'maxlines', len(response.content), raising=False)
+    tbl = check_reference(lambda: JPLSpec._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', reference_read_fixed_width,
+                          num_tries=3)
+    assert len(tbl) == 20800
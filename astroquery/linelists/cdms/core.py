@@ -8,6 +8,7 @@ import astropy.units as u
 from astropy.io import ascii
 from astroquery.query import BaseQuery
 from astroquery.utils import async_to_sync
+from astroquery.utils.fixed_width import read_fixed_width
 # import configurable items declared in __init__.py
 from astroquery.linelists.cdms import conf
 from astroquery.jplspec import lookup_table
@@ -226,11 +227,10 @@ class CDMSClass(BaseQuery):
                   'F': 73,
                   'name': 89}
 
-        result = ascii.read(text, header_start=None, data_start=0,
-                            comment=r'THIS|^\s{12,14}\d{4,6}.*',
-                            names=list(starts.keys()),
-                            col_starts=list(starts.values()),
-                            format='fixed_width', fast_reader=False)
+        result = read_fixed_width(text,
+                                  comment=r'THIS|^\s{12,14}\d{4,6}.*',
+                                  names=list(starts.keys()),
+                                  col_starts=list(starts.values()))
 
         result['FREQ'].unit = u.MHz
         result['ERR'].unit = u.MHz
@@ -1,10 +1,14 @@
 import numpy as np
 
 import os
+import pytest
 
 from astropy import units as u
 from astropy.table import Table
 from astroquery.linelists.cdms import CDMS
+from astroquery.linelists.cdms import core
+from astroquery.utils.mocks import MockResponse
+from astroquery.utils.tests.reference import check_reference, reference_read_fixed_width
 
 
 def data_path(filename):
@@ -63,3 +67,26 @@ def test_query():
     assert tbl['FREQ'][0] == 115271.2018
     assert tbl['ERR'][0] == .0005
     assert tbl['LGINT'][0] == -7.1425
+
+
+def test_parse_result_reference(monkeypatch):
+    # the columns are read as by the generic fixed-width reader of astropy
+    response = MockResponseSpec('CO.data')
+    monkeypatch.setattr(CDMS, '_last_query_temperature', 300, raising=False)
+    tbl = check_reference(lambda: CDMS._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', reference_read_fixed_width)
+    assert len(tbl) == 8
+
+
+@pytest.mark.benchmark
+def test_parse_result_benchmark(monkeypatch):
+    # the recorded lines are replicated to a realistic size
+    with open(data_path('CO.data'), 'rb') as f:
+        head, rest = f.read().split(b'<pre>\n')
+    lines, tail = rest.split(b'</pre>')
+    response = MockResponse(head + b'<pre>\n' + lines * 5000 + b'</pre>' + tail)
+    monkeypatch.setattr(CDMS, '_last_query_temperature', 300, raising=False)
+    tbl = check_reference(lambda: CDMS._parse_result(response), monkeypatch,
+                          core, 'read_fixed_width', reference_read_fixed_width,
+                          num_tries=3)
+    assert len(tbl) == 40000
@@ -44,14 +44,21 @@ class CatalogsClass(MastQueryWithLogin):
                                   "args": {"data_release": "dr2", "table": "mean"}}}
         self._service_api_connection.set_service_params(services, "catalogs", True)
 
-        self.catalog_limit = None
-        self._current_connection = None
-
     def _parse_result(self, response, verbose=False):
 
-        results_table = self._current_connection._parse_result(response, verbose)
+        # the Portal API returns the pages of its results as a list of
+        # responses, which carry the result limit of their catalog
+        catalog_limit = None
+        if isinstance(response, list):
+            connection = self._portal_api_connection
+            if response:
+                catalog_limit = getattr(response[0], 'catalog_limit', None)
+        else:
+            connection = self._service_api_connection
+
+        results_table = connection._parse_result(response, verbose)
 
-        if len(results_table) == self.catalog_limit:
+        if len(results_table) == catalog_limit:
             warnings.warn("Maximum catalog results returned, may not include all sources within radius.",
                           MaxResultsWarning)
 
@@ -108,11 +115,12 @@ class CatalogsClass(MastQueryWithLogin):
                   'radius': radius.deg}
 
         # Determine API connection and service name
+        catalog_limit = None
         if catalog.lower() in self._service_api_connection.SERVICES:
-            self._current_connection = self._service_api_connection
+            connection = self._service_api_connection
             service = catalog
         else:
-            self._current_connection = self._portal_api_connection
+            connection = self._portal_api_connection
 
             # Sorting out the non-standard portal service names
             if catalog.lower() == "hsc":
@@ -123,7 +131,7 @@ class CatalogsClass(MastQueryWithLogin):
                         warnings.warn("Invalid HSC version number, defaulting to v3.", InputWarning)
                     service = "Mast.Hsc.Db.v3"
 
-                self.catalog_limit = kwargs.get('nr', 50000)
+                catalog_limit = kwargs.get('nr', 50000)
 
                 # Hsc specific parameters (can be overridden by user)
                 params['nr'] = 50000
@@ -132,7 +140,7 @@ class CatalogsClass(MastQueryWithLogin):
 
             elif catalog.lower() == "galex":
                 service = "Mast.Galex.Catalog"
-                self.catalog_limit = kwargs.get('maxrecords', 50000)
+                catalog_limit = kwargs.get('maxrecords', 50000)
 
                 # galex specific parameters (can be overridden by user)
                 params['maxrecords'] = 50000
@@ -147,13 +155,16 @@ class CatalogsClass(MastQueryWithLogin):
 
             else:
                 service = "Mast.Catalogs." + catalog + ".Cone"
-                self.catalog_limit = None
 
         # adding additional user specified parameters
         for prop, value in kwargs.items():
             params[prop] = value
 
-        return self._current_connection.service_request_async(service, params, pagesize, page)
+        response = connection.service_request_async(service, params, pagesize, page)
+        if catalog_limit is not None:
+            for resp in response:
+                resp.catalog_limit = catalog_limit
+        return response
 
     @class_or_instance
     def query_object_async(self, objectname, radius=0.2*u.deg, catalog="Hsc",
@@ -258,40 +269,40 @@ class CatalogsClass(MastQueryWithLogin):
         # Determine API connection, service name, and build filter set
         filters = None
         if catalog.lower() in self._service_api_connection.SERVICES:
-            self._current_connection = self._service_api_connection
+            connection = self._service_api_connection
             service = catalog
 
-            if not self._current_connection.check_catalogs_criteria_params(criteria):
+            if not connection.check_catalogs_criteria_params(criteria):
                 raise InvalidQueryError("At least one non-positional criterion must be supplied.")
 
             for prop, value in criteria.items():
                 params[prop] = value
 
         else:
-            self._current_connection = self._portal_api_connection
+            connection = self._portal_api_connection
 
             if catalog.lower() == "tic":
                 service = "Mast.Catalogs.Filtered.Tic"
                 if coordinates or objectname:
                     service += ".Position"
                 service += ".Rows"  # Using the rowstore version of the query for speed
-                filters = self._current_connection.build_filter_set("Mast.Catalogs.Tess.Cone",
-                                                                     service, **criteria)
+                filters = connection.build_filter_set("Mast.Catalogs.Tess.Cone",
+                                                      service, **criteria)
                 params["columns"] = "*"
             elif catalog.lower() == "ctl":
                 service = "Mast.Catalogs.Filtered.Ctl"
                 if coordinates or objectname:
                     service += ".Position"
                 service += ".Rows"  # Using the rowstore version of the query for speed
-                filters = self._current_connection.build_filter_set("Mast.Catalogs.Tess.Cone",
-                                                                     service, **criteria)
+                filters = connection.build_filter_set("Mast.Catalogs.Tess.Cone",
+                                                      service, **criteria)
                 params["columns"] = "*"
             elif catalog.lower() == "diskdetective":
                 service = "Mast.Catalogs.Filtered.DiskDetective"
                 if coordinates or objectname:
                     service += ".Position"
-                filters = self._current_connection.build_filter_set("Mast.Catalogs.Dd.Cone",
-                                                                     service, **criteria)
+                filters = connection.build_filter_set("Mast.Catalogs.Dd.Cone",
+                                                      service, **criteria)
             else:
                 raise InvalidQueryError("Criteria query not available for {}".format(catalog))
 
@@ -299,7 +310,7 @@ class CatalogsClass(MastQueryWithLogin):
                 raise InvalidQueryError("At least one non-positional criterion must be supplied.")
             params["filters"] =  filters
 
-        return self._current_connection.service_request_async(service, params, pagesize=pagesize, page=page)
+        return connection.service_request_async(service, params, pagesize=pagesize, page=page)
 
     @class_or_instance
     def query_hsc_matchid_async(self, match, version=3, pagesize=None, page=None):
@@ -324,8 +335,6 @@ class CatalogsClass(MastQueryWithLogin):
         response : list of `~requests.Response`
         """
 
-        self._current_connection = self._portal_api_connection
-
         if isinstance(match, Row):
             match = match["MatchID"]
         match = str(match)  # np.int64 gives json serializer problems, so stringify right here
@@ -339,7 +348,7 @@ class CatalogsClass(MastQueryWithLogin):
 
         params = {"input": match}
 
-        return self._current_connection.service_request_async(service, params, pagesize, page)
+        return self._portal_api_connection.service_request_async(service, params, pagesize, page)
 
     @class_or_instance
     def get_hsc_spectra_async(self, pagesize=None, page=None):
@@ -360,12 +369,10 @@ class CatalogsClass(MastQueryWithLogin):
         response : list of `~requests.Response`
         """
 
-        self._current_connection = self._portal_api_connection
-
         service = "Mast.HscSpectra.Db.All"
         params = {}
 
-        return self._current_connection.service_request_async(service, params, pagesize, page)
+        return self._portal_api_connection.service_request_async(service, params, pagesize, page)
 
     def download_hsc_spectra(self, spectra, download_dir=None, cache=True, curl_flag=False):
         """
@@ -28,6 +28,7 @@ from astropy.io import fits
 
 from ..query import BaseQuery
 from ..utils import commons
+from ..utils.archives import extract
 from ..exceptions import InputWarning, NoResultsWarning, InvalidQueryError, RemoteServiceError
 
 from . import conf
@@ -306,14 +307,11 @@ class TesscutClass(MastQueryWithLogin):
             return localpath_table
 
         print("Inflating...")
-        # unzipping the zipfile
-        zip_ref = zipfile.ZipFile(zipfile_path, 'r')
-        cutout_files = zip_ref.namelist()
-        zip_ref.extractall(path, members=cutout_files)
-        zip_ref.close()
+        # unzipping the zipfile, the cutouts being decompressed concurrently
+        cutout_paths = extract(zipfile_path, path)
         os.remove(zipfile_path)
 
-        localpath_table['Local Path'] = [path+x for x in cutout_files]
+        localpath_table['Local Path'] = cutout_paths
         return localpath_table
 
     def get_cutouts(self, coordinates=None, size=5, sector=None,
@@ -565,14 +563,11 @@ class ZcutClass(MastQueryWithLogin):
             return localpath_table
 
         print("Inflating...")
-        # unzipping the zipfile
-        zip_ref = zipfile.ZipFile(zipfile_path, 'r')
-        cutout_files = zip_ref.namelist()
-        zip_ref.extractall(path, members=cutout_files)
-        zip_ref.close()
+        # unzipping the zipfile, the cutouts being decompressed concurrently
+        cutout_paths = extract(zipfile_path, path)
         os.remove(zipfile_path)
 
-        localpath_table['Local Path'] = [path+x for x in cutout_files]
+        localpath_table['Local Path'] = cutout_paths
         return localpath_table
 
     def get_cutouts(self, coordinates, size=5, survey=None):
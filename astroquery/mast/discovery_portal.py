@@ -10,15 +10,18 @@ import warnings
 import uuid
 import json
 import time
+import itertools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from urllib.parse import quote as urlencode
+from urllib.parse import quote as urlencode, unquote
 
-from astropy.table import Table, vstack, MaskedColumn
+from astropy.table import Table
 from astropy.utils import deprecated
 
-from ..query import BaseQuery, QueryWithLogin
+from ..query import BaseQuery, QueryWithLogin, conf as query_conf
 from ..utils import async_to_sync
 from ..utils.class_or_instance import class_or_instance
 from ..exceptions import InputWarning, NoResultsWarning, RemoteServiceError
@@ -51,14 +54,37 @@ def _prepare_service_request_string(json_obj):
     return 'request={}'.format(urlencode(request_string))
 
 
+def _set_request_page(request_string, page):
+    """
+    Changes the page of a url-safe Mashup request string.
+
+    Parameters
+    ----------
+    request_string : str
+        URL encoded Mashup Request string, see `_prepare_service_request_string`.
+    page : int
+        The requested page.
+
+    Returns
+    -------
+    response : str
+        URL encoded Mashup Request string.
+    """
+
+    json_obj = json.loads(unquote(request_string[len('request='):]))
+    json_obj['page'] = page
+    return _prepare_service_request_string(json_obj)
+
+
 def _json_to_table(json_obj, col_config=None):
     """
     Takes a JSON object as returned from a Mashup request and turns it into an `~astropy.table.Table`.
 
     Parameters
     ----------
-    json_obj : dict
-        A Mashup response JSON object (python dictionary)
+    json_obj : dict or list of dict
+        A Mashup response JSON object (python dictionary), or the list of the JSON objects
+        of the pages of a response, which are merged in order.
     col_config : dict, optional
         Dictionary that defines column properties, e.g. default value.
 
@@ -69,14 +95,25 @@ def _json_to_table(json_obj, col_config=None):
 
     data_table = Table(masked=True)
 
-    if not all(x in json_obj.keys() for x in ['fields', 'data']):
-        raise KeyError("Missing required key(s) 'data' and/or 'fields.'")
+    pages = [json_obj] if isinstance(json_obj, dict) else json_obj
+    for page in pages:
+        if not all(x in page.keys() for x in ['fields', 'data']):
+            raise KeyError("Missing required key(s) 'data' and/or 'fields.'")
+
+    fields = [(x['name'], x['type']) for x in pages[0]['fields'] if x['name'] != "_selected_"]
+    names = [col for col, _ in fields]
 
-    for col, atype in [(x['name'], x['type']) for x in json_obj['fields']]:
+    # transposing the rows of all the pages at once, rather than stepping through them for each column;
+    # rows missing a column fall back on the per-column lookups below
+    columns = None
+    if len(names) > 1:
+        try:
+            columns = list(zip(*map(operator.itemgetter(*names), itertools.chain.from_iterable(
+                page['data'] for page in pages))))
+        except KeyError:
+            pass
 
-        # Removing "_selected_" column
-        if col == "_selected_":
-            continue
+    for idx, (col, atype) in enumerate(fields):
 
         # reading the colum config if given
         ignore_value = None
@@ -89,20 +126,13 @@ def _json_to_table(json_obj, col_config=None):
         atype = reg_type[1]
         ignore_value = reg_type[2] if (ignore_value is None) else ignore_value
 
-        # Make the column list (don't assign final type yet or there will be errors)
-        col_data = np.array([x.get(col, ignore_value) for x in json_obj['data']], dtype=object)
-        if ignore_value is not None:
-            col_data[np.where(np.equal(col_data, None))] = ignore_value
-
-        # no consistant way to make the mask because np.equal fails on ''
-        # and array == value fails with None
-        if atype == 'str':
-            col_mask = (col_data == ignore_value)
+        if columns:
+            col_data = columns[idx]
         else:
-            col_mask = np.equal(col_data, ignore_value)
+            col_data = [x.get(col, ignore_value) for page in pages for x in page['data']]
 
         # add the column
-        data_table.add_column(MaskedColumn(col_data.astype(atype), name=col, mask=col_mask))
+        data_table.add_column(utils._make_masked_column(col, col_data, atype, ignore_value), copy=False)
 
     return data_table
 
@@ -125,7 +155,6 @@ class PortalAPI(BaseQuery):
     PAGESIZE = conf.pagesize
 
     _column_configs = dict()
-    _current_service = None
 
     def __init__(self, session=None):
 
@@ -171,45 +200,75 @@ class PortalAPI(BaseQuery):
         """
 
         start_time = time.time()
-        all_responses = []
-        total_pages = 1
-        cur_page = 0
 
-        while cur_page < total_pages:
-            status = "EXECUTING"
+        response, status, result = self._request_page(method, url, params=params, data=data,
+                                                      headers=headers, files=files, stream=stream,
+                                                      auth=auth, start_time=start_time)
+        all_responses = [response]
+
+        if (status != "COMPLETE") or (not retrieve_all):
+            return all_responses
+
+        paging = result.get("paging")
+        if paging is None:
+            return all_responses
+        total_pages = paging['pagesFiltered']
+        cur_page = paging['page']
+        if cur_page >= total_pages:
+            return all_responses
+
+        # the remaining pages are fetched concurrently
+        pages = range(cur_page + 1, total_pages + 1)
+        max_workers = min(query_conf.max_workers, len(pages))
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._request_page, method, url, params=params,
+                                       data=_set_request_page(data, page), headers=headers,
+                                       files=files, stream=stream, auth=auth, start_time=start_time)
+                       for page in pages]
+            try:
+                all_responses += [future.result()[0] for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
-            while status == "EXECUTING":
-                response = super(PortalAPI, self)._request(method, url, params=params, data=data,
-                                                           headers=headers, files=files, cache=False,
-                                                           stream=stream, auth=auth)
+        return all_responses
 
-                if (time.time() - start_time) >= self.TIMEOUT:
-                    raise TimeoutError("Timeout limit of {} exceeded.".format(self.TIMEOUT))
+    def _request_page(self, method, url, params=None, data=None, headers=None, files=None,
+                      stream=False, auth=None, start_time=None):
+        """
+        Send a Mashup request, and send it again while the server reports that it is executing.
 
-                # Raising error based on HTTP status if necessary
-                response.raise_for_status()
+        Returns
+        -------
+        response : tuple
+            The `~requests.Response`, its status and its decoded JSON content.
+        """
 
-                result = response.json()
+        status = "EXECUTING"
 
-                if not result:  # kind of hacky, but col_config service returns nothing if there is an error
-                    status = "ERROR"
-                else:
-                    status = result.get("status")
+        while status == "EXECUTING":
+            response = super(PortalAPI, self)._request(method, url, params=params, data=data,
+                                                       headers=headers, files=files, cache=False,
+                                                       stream=stream, auth=auth)
 
-            all_responses.append(response)
+            if (time.time() - start_time) >= self.TIMEOUT:
+                raise TimeoutError("Timeout limit of {} exceeded.".format(self.TIMEOUT))
 
-            if (status != "COMPLETE") or (not retrieve_all):
-                break
+            # Raising error based on HTTP status if necessary
+            response.raise_for_status()
 
-            paging = result.get("paging")
-            if paging is None:
-                break
-            total_pages = paging['pagesFiltered']
-            cur_page = paging['page']
+            result = utils._json_loads(response.content)
 
-            data = data.replace("page%22%3A%20"+str(cur_page)+"%2C", "page%22%3A%20"+str(cur_page+1)+"%2C")
+            if not result:  # kind of hacky, but col_config service returns nothing if there is an error
+                status = "ERROR"
+            else:
+                status = result.get("status")
 
-        return all_responses
+        # keeping the decoded page, so that it is not decoded again by _parse_result
+        response.mashup_json = result
+        return response, status, result
 
     def _get_col_config(self, service, fetch_name=None):
         """
@@ -277,23 +336,24 @@ class PortalAPI(BaseQuery):
 
         result_list = []
 
-        # loading the columns config
+        # loading the columns config of the service queried
         col_config = None
-        if self._current_service:
-            col_config = self._column_configs.get(self._current_service)
-            self._current_service = None  # clearing current service
+        service = getattr(responses[0], 'mashup_service', None) if responses else None
+        if service:
+            col_config = self._column_configs.get(service)
 
         for resp in responses:
-            result = resp.json()
+            result = getattr(resp, 'mashup_json', None)
+            if result is None:
+                result = resp.json()
 
             # check for error message
             if result['status'] == "ERROR":
                 raise RemoteServiceError(result.get('msg', "There was an error with your request."))
 
-            result_table = _json_to_table(result, col_config)
-            result_list.append(result_table)
+            result_list.append(result)
 
-        all_results = vstack(result_list)
+        all_results = _json_to_table(result_list, col_config)
 
         # Check for no results
         if not all_results:
@@ -331,11 +391,10 @@ class PortalAPI(BaseQuery):
         response : list of `~requests.Response`
         """
 
-        # setting self._current_service
+        # loading the columns config of the service
         if service not in self._column_configs.keys():
             fetch_name = kwargs.pop('fetch_name', None)
             self._get_col_config(service, fetch_name)
-        self._current_service = service
 
         # setting up pagination
         if not pagesize:
@@ -363,6 +422,11 @@ class PortalAPI(BaseQuery):
         response = self._request("POST", self.MAST_REQUEST_URL, data=req_string, headers=headers,
                                  retrieve_all=retrieve_all)
 
+        # the service travels with the responses to _parse_result, so that
+        # concurrent queries each get the columns config of their own service
+        for resp in response:
+            resp.mashup_service = service
+
         return response
 
     def build_filter_set(self, column_config_name, service_name=None, **filters):
@@ -11,6 +11,7 @@ import json
 import time
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -27,7 +28,7 @@ from astropy.utils.console import ProgressBarOrSpinner
 
 from urllib.parse import quote as urlencode
 
-from ..query import QueryWithLogin
+from ..query import QueryWithLogin, conf as query_conf
 from ..utils import commons, async_to_sync
 from ..utils.class_or_instance import class_or_instance
 from ..exceptions import (TimeoutError, InvalidQueryError, RemoteServiceError,
@@ -604,20 +605,28 @@ class ObservationsClass(MastQueryWithLogin):
         response : `~astropy.table.Table`
         """
 
-        manifest_array = []
+        local_paths = []
         for data_product in products:
 
             # create the local file download path
             local_path = os.path.join(base_dir, data_product['obs_collection'], data_product['obs_id'])
             if not os.path.exists(local_path):
                 os.makedirs(local_path)
-            local_path = os.path.join(local_path, os.path.basename(data_product['productFilename']))
+            local_paths.append(os.path.join(local_path, os.path.basename(data_product['productFilename'])))
 
-            # download the files
-            status, msg, url = self.download_file(data_product["dataURI"], local_path=local_path,
-                                                  cache=cache, cloud_only=cloud_only)
+        # download the files concurrently, `download_file` handles the cloud
+        # access and the HTTP errors of each file
+        def download(args):
+            data_product, local_path = args
+            return self.download_file(data_product["dataURI"], local_path=local_path,
+                                      cache=cache, cloud_only=cloud_only)
 
-            manifest_array.append([local_path, status, msg, url])
+        self._size_connection_pool(query_conf.max_workers)
+        with ThreadPoolExecutor(max_workers=query_conf.max_workers) as executor:
+            statuses = list(executor.map(download, zip(products, local_paths)))
+
+        manifest_array = [[local_path, status, msg, url]
+                          for local_path, (status, msg, url) in zip(local_paths, statuses)]
 
         manifest = Table(rows=manifest_array, names=('Local Path', 'Status', 'Message', "URL"))
 
@@ -12,7 +12,7 @@ import warnings
 
 import numpy as np
 
-from astropy.table import Table, Column, MaskedColumn
+from astropy.table import Table, Column
 
 from ..query import BaseQuery
 from ..utils import async_to_sync
@@ -46,6 +46,9 @@ def _json_to_table(json_obj):
     # determine database type key in case missing
     type_key = 'type' if json_obj['info'][0].get('type') else 'db_type'
 
+    # transposing the rows once, rather than stepping through them for each column
+    columns = list(zip(*json_obj['data'])) or [()] * len(json_obj['info'])
+
     # for each item in info, store the type and column name
     for idx, col, col_type, ignore_value in \
             [(idx, x['name'], x[type_key], "NULL") for idx, x in enumerate(json_obj['info'])]:
@@ -73,21 +76,8 @@ def _json_to_table(json_obj):
             col_type = "str"
             ignore_value = "" if (ignore_value is None) else ignore_value
 
-        # Make the column list (don't assign final type yet or there will be errors)
-        # Step through data array of values
-        col_data = np.array([x[idx] for x in json_obj['data']], dtype=object)
-        if ignore_value is not None:
-            col_data[np.where(np.equal(col_data, None))] = ignore_value
-
-        # no consistant way to make the mask because np.equal fails on ''
-        # and array == value fails with None
-        if col_type == 'str':
-            col_mask = (col_data == ignore_value)
-        else:
-            col_mask = np.equal(col_data, ignore_value)
-
         # add the column
-        data_table.add_column(MaskedColumn(col_data.astype(col_type), name=col, mask=col_mask))
+        data_table.add_column(utils._make_masked_column(col, columns[idx], col_type, ignore_value), copy=False)
 
     return data_table
 
@@ -201,7 +191,7 @@ class ServiceAPI(BaseQuery):
         response : `~astropy.table.Table`
         """
 
-        result = response.json()
+        result = utils._json_loads(response.content)
         result_table = _json_to_table(result)
 
         # Check for no results
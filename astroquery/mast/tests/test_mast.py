@@ -1,21 +1,26 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import json
 import os
 import re
 from shutil import copyfile
+from urllib.parse import unquote
 
+import numpy as np
 import pytest
 
-from astropy.table import Table
+from astropy.table import Table, MaskedColumn
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 
 import astropy.units as u
 
 from astroquery.utils.mocks import MockResponse
+from astroquery.utils.tests.reference import assert_columns_equal, check_reference
 from ...exceptions import InvalidQueryError, InputWarning
 
 from ... import mast
+from ...query import BaseQuery
 
 DATA_FILES = {'Mast.Caom.Cone': 'caom.json',
               'Mast.Name.Lookup': 'resolver.json',
@@ -205,6 +210,95 @@ def test_mast_service_request(patch_post):
     assert isinstance(result, Table)
 
 
+def test_mast_service_request_pages(monkeypatch):
+    with open(data_path(DATA_FILES['Mast.Caom.Cone'])) as f:
+        caom = json.load(f)
+    pagesize = 5
+    requested = []
+
+    def paged_request(self, method, url, data=None, **kwargs):
+        page = json.loads(unquote(data[len('request='):]))['page']
+        requested.append(page)
+        content = dict(caom, data=caom['data'][(page - 1) * pagesize:page * pagesize],
+                       paging={'page': page, 'pageSize': pagesize, 'pagesFiltered': 4,
+                               'rows': 5, 'rowsFiltered': 19, 'rowsTotal': 19})
+        if page == 3 and requested.count(3) == 1:
+            content = {'status': 'EXECUTING'}
+        return MockResponse(json.dumps(content).encode('utf-8'))
+
+    monkeypatch.setattr(BaseQuery, '_request', paged_request)
+    portal = mast.discovery_portal.PortalAPI()
+    request_string = mast.discovery_portal._prepare_service_request_string(
+        {'service': 'Mast.Caom.Cone', 'params': {}, 'format': 'json', 'pagesize': pagesize, 'page': 1})
+
+    responses = portal._request("POST", portal.MAST_REQUEST_URL, data=request_string)
+    # the executing page was requested again
+    assert sorted(requested) == [1, 2, 3, 3, 4]
+    assert [response.mashup_json['paging']['page'] for response in responses] == [1, 2, 3, 4]
+
+    result = portal._parse_result(responses)
+    assert isinstance(result, Table)
+    assert list(result['obs_id']) == [row['obs_id'] for row in caom['data']]
+    assert result['dataURL'].mask.all()
+
+
+def _reference_masked_column(name, values, dtype, ignore_value):
+    # the per-column object array conversion that the typed fast path replaces
+    col_data = np.empty(len(values), dtype=object)
+    col_data[:] = values
+    if ignore_value is not None:
+        col_data[np.where(np.equal(col_data, None))] = ignore_value
+    col_mask = np.equal(col_data, ignore_value)
+    return MaskedColumn(col_data.astype(dtype), name=name, mask=col_mask)
+
+
+@pytest.mark.parametrize(('values', 'dtype', 'ignore_value'), [
+    ([1.5, None, -999, 2], np.float64, -999),
+    ([1.5, None, 3, 2], np.float64, np.nan),
+    ([1.5, None, 3], np.float64, None),
+    ([1, None, -999, 2**40], np.int64, -999),
+    (['a', None, '', 'bcd'], str, ""),
+    ([True, None, False], bool, None),
+    ([1, 2, 3], np.ubyte, None),
+    ([], np.int64, -999)])
+def test_make_masked_column(values, dtype, ignore_value):
+    column = mast.utils._make_masked_column('col', values, dtype, ignore_value)
+    assert_columns_equal(column, _reference_masked_column('col', values, dtype, ignore_value))
+
+
+def _json_to_tables(caom, panstarrs):
+    return [mast.discovery_portal._json_to_table(caom),
+            mast.services._json_to_table(panstarrs)]
+
+
+def _load_json(replication=1):
+    with open(data_path(DATA_FILES['Mast.Caom.Cone'])) as f:
+        caom = json.load(f)
+    with open(data_path(DATA_FILES['panstarrs'])) as f:
+        panstarrs = json.load(f)
+    caom['data'] = caom['data'] * replication
+    panstarrs['data'] = panstarrs['data'] * replication
+    return caom, panstarrs
+
+
+def test_json_to_table_reference(monkeypatch):
+    # the columns are built as by the former row by row conversion
+    caom, panstarrs = _load_json()
+    tables = check_reference(lambda: _json_to_tables(caom, panstarrs), monkeypatch,
+                             mast.utils, '_make_masked_column', _reference_masked_column)
+    assert [len(table) for table in tables] == [len(caom['data']), len(panstarrs['data'])]
+
+
+@pytest.mark.benchmark
+def test_json_to_table_benchmark(monkeypatch):
+    # the recorded responses are replicated to a realistic size
+    caom, panstarrs = _load_json(replication=2000)
+    tables = check_reference(lambda: _json_to_tables(caom, panstarrs), monkeypatch,
+                             mast.utils, '_make_masked_column', _reference_masked_column,
+                             num_tries=3)
+    assert [len(table) for table in tables] == [len(caom['data']), len(panstarrs['data'])]
+
+
 def test_resolve_object(patch_post):
     m103_loc = mast.Mast.resolve_object("M103")
     print(m103_loc)
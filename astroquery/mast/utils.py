@@ -12,6 +12,12 @@ import requests
 import json
 from urllib import parse
 import astropy.coordinates as coord
+from astropy.table import MaskedColumn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..version import version
 from ..exceptions import ResolverError, InvalidQueryError
@@ -68,6 +74,121 @@ def parse_type(dbtype):
     }.get(dbtype, (dbtype, dbtype, dbtype))
 
 
+def _json_loads(content):
+    """
+    Decodes the content of a JSON response, with the faster ``orjson`` parser when it is installed.
+
+    Parameters
+    ----------
+    content : bytes or str
+        JSON document.
+
+    Returns
+    -------
+    response : dict
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except ValueError:
+            # e.g. NaN values, which orjson rejects
+            pass
+    return json.loads(content)
+
+
+def _make_masked_column(name, values, dtype, ignore_value=None):
+    """
+    Takes the values of a column of a JSON response and turns them into a `~astropy.table.MaskedColumn`.
+
+    None values are replaced with ``ignore_value``, and the values equal to ``ignore_value`` are masked.
+
+    Parameters
+    ----------
+    name : str
+        Column name.
+    values : list or tuple
+        Column values, as decoded from the JSON response.
+    dtype : type or str
+        Column data type, e.g. as given by `parse_type`.
+    ignore_value : optional
+        Value of the missing data.
+
+    Returns
+    -------
+    response : `~astropy.table.MaskedColumn`
+    """
+
+    try:
+        column = _make_typed_masked_column(name, values, dtype, ignore_value)
+    except (TypeError, ValueError, OverflowError):
+        column = None
+    if column is not None:
+        return column
+
+    # Make the column list (don't assign final type yet or there will be errors)
+    col_data = np.empty(len(values), dtype=object)
+    col_data[:] = values
+    if ignore_value is not None:
+        col_data[np.where(np.equal(col_data, None))] = ignore_value
+
+    # no consistant way to make the mask because np.equal fails on ''
+    # and array == value fails with None
+    if dtype in (str, 'str'):
+        col_mask = (col_data == ignore_value)
+    else:
+        col_mask = np.equal(col_data, ignore_value)
+
+    return MaskedColumn(col_data.astype(dtype), name=name, mask=col_mask)
+
+
+def _make_typed_masked_column(name, values, dtype, ignore_value):
+    """
+    Fast path of `_make_masked_column`: the values are converted by a single NumPy call for the common data
+    types and missing values. Returns None for the other cases.
+    """
+
+    kind = np.dtype(dtype).kind
+    has_none = None in values
+    numeric_ignore = isinstance(ignore_value, (int, float)) and not isinstance(ignore_value, bool)
+
+    if kind == 'f' and (ignore_value is None or numeric_ignore):
+        # None values are converted to NaN
+        data = np.array(values, dtype=dtype)
+        if ignore_value is None:
+            mask = _none_mask(values) if has_none else False
+        elif np.isnan(ignore_value):
+            mask = False
+        else:
+            if has_none:
+                data[_none_mask(values)] = ignore_value
+            mask = data == ignore_value
+    elif kind in 'iu' and numeric_ignore:
+        if has_none:
+            values = [ignore_value if value is None else value for value in values]
+        data = np.array(values, dtype=dtype)
+        mask = data == ignore_value
+    elif kind == 'U' and isinstance(ignore_value, str):
+        if has_none:
+            values = [ignore_value if value is None else value for value in values]
+        data = np.array(values, dtype=dtype)
+        mask = data == ignore_value
+    elif kind == 'b' and ignore_value is None:
+        # None values are converted to False
+        data = np.array(values, dtype=dtype)
+        mask = _none_mask(values) if has_none else False
+    else:
+        return None
+
+    if data.ndim != 1:
+        return None
+    return MaskedColumn(data, name=name, mask=mask)
+
+
+def _none_mask(values):
+    return np.array([value is None for value in values], dtype=bool)
+
+
 def _simple_request(url, params):
     """
     Light wrapper on requests.session().get basically to make monkey patched testing easier/more effective.
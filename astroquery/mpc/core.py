@@ -332,7 +332,9 @@ class MPCClass(BaseQuery):
 
         self.query_type = 'object'
         auth = (self.MPC_USERNAME, self.MPC_PASSWORD)
-        return self._request('GET', mpc_endpoint, params=request_args, auth=auth)
+        response = self._request('GET', mpc_endpoint, params=request_args, auth=auth)
+        response.query_type = 'object'
+        return response
 
     def get_mpc_object_endpoint(self, target_type):
         mpc_endpoint = self.MPC_URL
@@ -595,11 +597,7 @@ class MPCClass(BaseQuery):
             start=_start, step=_step, number=number, eph_type=eph_type,
             proper_motion=proper_motion)
 
-        # store for retrieval in _parse_result
-        self._ra_format = ra_format
-        self._dec_format = dec_format
-        self._proper_motion_unit = u.Unit(proper_motion_unit)
-        self._unc_links = unc_links
+        proper_motion_unit = u.Unit(proper_motion_unit)
 
         if get_query_payload:
             return request_args
@@ -607,6 +605,15 @@ class MPCClass(BaseQuery):
         self.query_type = 'ephemeris'
         response = self._request('POST', self.MPES_URL, data=request_args)
 
+        # the query type and the formatting options travel with the
+        # response to _parse_result, so that concurrent queries do not
+        # interfere with each other
+        response.query_type = 'ephemeris'
+        response.ra_format = ra_format
+        response.dec_format = dec_format
+        response.proper_motion_unit = proper_motion_unit
+        response.unc_links = unc_links
+
         return response
 
     @class_or_instance
@@ -652,6 +659,7 @@ class MPCClass(BaseQuery):
         self.query_type = 'observatory_code'
         response = self._request('GET', self.OBSERVATORY_CODES_URL,
                                  timeout=self.TIMEOUT, cache=cache)
+        response.query_type = 'observatory_code'
 
         return response
 
@@ -984,26 +992,24 @@ class MPCClass(BaseQuery):
                                        self.MPC_PASSWORD),
                                  timeout=self.TIMEOUT, cache=cache)
 
+        response.query_type = 'observations'
         if get_mpcformat:
-            self.obsformat = 'mpc'
-        else:
-            self.obsformat = 'table'
-
-        if get_raw_response:
-            self.get_raw_response = True
+            response.obsformat = 'mpc'
         else:
-            self.get_raw_response = False
+            response.obsformat = 'table'
+        response.get_raw_response = get_raw_response
 
         return response
 
     def _parse_result(self, result, **kwargs):
-        if self.query_type == 'object':
+        query_type = getattr(result, 'query_type', getattr(self, 'query_type', None))
+        if query_type == 'object':
             try:
                 data = result.json()
             except ValueError:
                 raise InvalidQueryError(result.text)
             return data
-        elif self.query_type == 'observatory_code':
+        elif query_type == 'observatory_code':
             root = BeautifulSoup(result.content, 'html.parser')
             text_table = root.find('pre').text
             start = text_table.index('000')
@@ -1042,7 +1048,7 @@ class MPCClass(BaseQuery):
             tab['sin'].mask = ~np.isfinite(tab['sin'])
 
             return tab
-        elif self.query_type == 'ephemeris':
+        elif query_type == 'ephemeris':
             content = result.content.decode()
             table_start = content.find('<pre>')
             if table_start == -1:
@@ -1104,7 +1110,7 @@ class MPCClass(BaseQuery):
                     col_ends += tuple((col_ends[-1] + offset for offset in
                                        (10, 16)))
                     units += ('arcsec', 'deg')
-                if ">Map</a>" in first_row and self._unc_links:
+                if ">Map</a>" in first_row and result.unc_links:
                     names += ('Unc. map', 'Unc. offsets')
                     col_starts += (first_row.index(' / <a') + 3, )
                     col_starts += (
@@ -1144,15 +1150,15 @@ class MPCClass(BaseQuery):
                 dec = Angle(tab['Dec'], unit='deg')
 
                 # optionally convert back to a string
-                if self._ra_format is not None:
-                    ra_unit = self._ra_format.get('unit', ra.unit)
-                    ra = ra.to_string(**self._ra_format)
+                if result.ra_format is not None:
+                    ra_unit = result.ra_format.get('unit', ra.unit)
+                    ra = ra.to_string(**result.ra_format)
                 else:
                     ra_unit = ra.unit
 
-                if self._dec_format is not None:
-                    dec_unit = self._dec_format.get('unit', dec.unit)
-                    dec = dec.to_string(**self._dec_format)
+                if result.dec_format is not None:
+                    dec_unit = result.dec_format.get('unit', dec.unit)
+                    dec = dec.to_string(**result.dec_format)
                 else:
                     dec_unit = dec.unit
 
@@ -1164,14 +1170,14 @@ class MPCClass(BaseQuery):
                 # convert proper motion columns
                 for col in ('Proper motion', 'dRA', 'dRA cos(Dec)', 'dDec'):
                     if col in tab.colnames:
-                        tab[col].convert_unit_to(self._proper_motion_unit)
+                        tab[col].convert_unit_to(result.proper_motion_unit)
             else:
                 # convert from MPES string to Time
                 tab['JD'] = Time(tab['JD'], format='jd', scale='tt')
 
             return tab
 
-        elif self.query_type == 'observations':
+        elif query_type == 'observations':
 
             warnings.simplefilter("ignore", ErfaWarning)
 
@@ -1187,11 +1193,11 @@ class MPCClass(BaseQuery):
                                     'identifiers correct?'))
 
             # return raw response if requested
-            if self.get_raw_response:
+            if result.get_raw_response:
                 return src
 
             # return raw 80-column observation format if requested
-            if self.obsformat == 'mpc':
+            if result.obsformat == 'mpc':
                 tab = Table([[o['original_record'] for o in src]])
                 tab.rename_column('col0', 'obs')
                 return tab
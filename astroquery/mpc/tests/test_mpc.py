@@ -43,6 +43,9 @@ This is sufficient for testing.
 
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 
@@ -396,6 +399,33 @@ def test_get_observations(patch_get):
     assert "12893J93S07X*4 1993 09 17.25833" in str(result)
 
 
+def test_concurrent_queries(monkeypatch):
+    # slow down the requests, so that the queries interleave
+    def slow_mockreturn(*args, **kwargs):
+        time.sleep(0.005)
+        return get_mockreturn(*args, **kwargs)
+
+    monkeypatch.setattr(mpc.MPCClass, '_request', slow_mockreturn)
+    queries = [lambda: mpc.core.MPC.get_observatory_codes(),
+               lambda: mpc.core.MPC.get_observations(12893),
+               lambda: mpc.core.MPC.get_observations(12893, get_raw_response=True),
+               lambda: mpc.core.MPC.get_observations(12893, get_mpcformat=True)] * 10
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(query) for query in queries]
+        results = [future.result() for future in futures]
+
+    for index, result in enumerate(results):
+        if index % 4 == 0:
+            assert result['Name'][0] == 'Greenwich'
+        elif index % 4 == 1:
+            assert result['desig'][0] == '1998 QS55'
+        elif index % 4 == 2:
+            assert result[0]['designation'] == '1998 QS55'
+        else:
+            assert result.colnames == ['obs']
+
+
 def test_get_observations_target_parsing(patch_get):
     result = mpc.core.MPC.get_observations(12893, get_query_payload=True)
     assert result['object_type'] == 'M' and result['number'] == '12893'
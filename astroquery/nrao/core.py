@@ -2,7 +2,6 @@
 
 
 import re
-import os
 import warnings
 import functools
 import keyring
@@ -357,9 +356,7 @@ class NraoClass(QueryWithLogin):
         # fail if response is entirely whitespace or if it is empty
         if not response.content.strip():
             if cache:
-                last_pickle = self._last_query.hash()+".pickle"
-                cache_fn = os.path.join(self.cache_location, last_pickle)
-                os.remove(cache_fn)
+                self._remove_last_query_from_cache(response)
             if retry > 0:
                 log.warning("Query resulted in an empty result.  Retrying {0}"
                             " more times.".format(retry))
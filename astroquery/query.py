@@ -2,16 +2,24 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 import abc
+import base64
 import inspect
+import json as _json
 import pickle
 import getpass
 import hashlib
 import keyring
 import io
 import os
+import sqlite3
+import threading
+import time
 import requests
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
+from astropy import config as _config
 from astropy.config import paths
 from astroquery import log
 import astropy.units as u
@@ -19,9 +27,33 @@ from astropy.utils.console import ProgressBarOrSpinner
 import astropy.utils.data
 
 from . import version
+from .exceptions import DownloadError, RemoteServiceError
+from .instrumentation import Instrumentation, TimedHTTPAdapter
 from .utils import system_tools
 
-__all__ = ['BaseQuery', 'QueryWithLogin']
+__all__ = ['BaseQuery', 'QueryWithLogin', 'QueryBatch', 'CacheStore',
+           'PickleCacheStore', 'SQLiteCacheStore', 'Conf', 'conf']
+
+
+class Conf(_config.ConfigNamespace):
+    """
+    Configuration parameters for the requests sent by `BaseQuery`.
+    """
+    max_workers = _config.ConfigItem(
+        8,
+        'Default number of concurrent requests of BaseQuery.batch, also '
+        'used to size the HTTP connection pool.')
+    max_per_host = _config.ConfigItem(
+        4,
+        'Default maximum number of concurrent requests to a single host in '
+        'BaseQuery.batch.')
+    download_segment_size = _config.ConfigItem(
+        64 * 2**20,
+        'Size in bytes of the byte-range segments downloaded in parallel by '
+        'BaseQuery._download_files for large files, 0 to disable.')
+
+
+conf = Conf()
 
 
 def to_cache(response, cache_file):
@@ -30,6 +62,39 @@ def to_cache(response, cache_file):
         pickle.dump(response, f)
 
 
+def _record_response(event, response, read=True):
+    """
+    Set the status, the sizes, the time to first byte and the retries of
+    ``response`` on the `~astroquery.instrumentation.RequestEvent` of its
+    request.  The size of the body is its ``Content-Length`` unless it was
+    ``read``.
+    """
+    event.status = getattr(response, 'status_code', None)
+    body = getattr(getattr(response, 'request', None), 'body', None)
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if isinstance(body, bytes):
+        event.bytes_sent = len(body)
+    if event.cache == 'hit':
+        event.bytes_received = 0
+        return
+
+    elapsed = getattr(response, 'elapsed', None)
+    if elapsed is not None:
+        event.ttfb = elapsed.total_seconds()
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    if getattr(retries, 'history', None) is not None:
+        event.retries = len(retries.history)
+    if read:
+        content = getattr(response, 'content', None)
+        if isinstance(content, bytes):
+            event.bytes_received = len(content)
+    else:
+        length = (getattr(response, 'headers', None) or {}).get('Content-Length')
+        if length is not None and length.isdigit():
+            event.bytes_received = int(length)
+
+
 def _replace_none_iterable(iterable):
     return tuple('' if i is None else i for i in iterable)
 
@@ -129,6 +194,239 @@ class AstroQuery:
                           "it does not exist")
 
 
+class CacheStore(abc.ABC):
+    """
+    Interface of the cache backends used by `BaseQuery._request`.
+
+    A cache store maps an `AstroQuery` (through its hash) to a previously
+    retrieved `requests.Response`.  Subclasses must implement `get`, `set`,
+    `remove` and `clear`.
+    """
+
+    @abc.abstractmethod
+    def get(self, query):
+        """
+        Return the cached response for ``query``, or `None` if there is no
+        (valid) entry for it.
+        """
+
+    @abc.abstractmethod
+    def set(self, query, response):
+        """
+        Store ``response`` as the result of ``query``.
+        """
+
+    @abc.abstractmethod
+    def remove(self, query):
+        """
+        Remove the entry of ``query``.  Raises `OSError` if it does not
+        exist.
+        """
+
+    @abc.abstractmethod
+    def clear(self):
+        """
+        Remove all the entries of the store.
+        """
+
+
+class PickleCacheStore(CacheStore):
+    """
+    The default cache store: one pickled `requests.Response` per request
+    in the ``cache_location`` directory.
+
+    Parameters
+    ----------
+    cache_location : str
+        Directory in which the pickle files are written.
+    """
+
+    def __init__(self, cache_location):
+        self.cache_location = cache_location
+
+    def get(self, query):
+        return query.from_cache(self.cache_location)
+
+    def set(self, query, response):
+        to_cache(response, query.request_file(self.cache_location))
+
+    def remove(self, query):
+        query.remove_cache_file(self.cache_location)
+
+    def clear(self):
+        for fn in os.listdir(self.cache_location):
+            if fn.endswith(".pickle"):
+                os.remove(os.path.join(self.cache_location, fn))
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    A cache store keeping the status, headers and body of the responses in
+    a single, indexed SQLite file.
+
+    Lookups are done on the request hash (the primary key of the table), so
+    they do not depend on the number of cached requests.  Entries older than
+    ``ttl`` are ignored and deleted on access, and the least recently used
+    entries are evicted once the total size of the stored bodies exceeds
+    ``max_size``.
+
+    Parameters
+    ----------
+    cache_location : str
+        Directory in which the database file is created.
+    filename : str, optional
+        Name of the database file.  Defaults to ``cache.sqlite``.
+    max_size : int or `~astropy.units.Quantity`, optional
+        Maximum total size of the cached bodies, in bytes.  `None` (the
+        default) means no limit.
+    ttl : float or `~astropy.units.Quantity`, optional
+        Time to live of the entries, in seconds.  `None` (the default) means
+        the entries never expire.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            hash TEXT PRIMARY KEY,
+            url TEXT,
+            status_code INTEGER,
+            reason TEXT,
+            encoding TEXT,
+            headers TEXT,
+            content BLOB,
+            size INTEGER,
+            created REAL,
+            accessed REAL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+    """
+
+    def __init__(self, cache_location, filename='cache.sqlite',
+                 max_size=None, ttl=None):
+        self.cache_location = cache_location
+        self.filename = filename
+        if hasattr(max_size, 'to'):
+            max_size = max_size.to(u.byte).value
+        if hasattr(ttl, 'to'):
+            ttl = ttl.to(u.s).value
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def path(self):
+        return os.path.join(self.cache_location, self.filename)
+
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(self.cache_location, exist_ok=True)
+            self._connection = sqlite3.connect(self.path,
+                                               check_same_thread=False)
+            self._connection.executescript(self._SCHEMA)
+        return self._connection
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_connection'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, query):
+        key = query.hash()
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT url, status_code, reason, encoding, headers, content, "
+                "created FROM responses WHERE hash = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            url, status_code, reason, encoding, headers, content, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                log.debug("Cache entry {0} has expired".format(key))
+                with conn:
+                    conn.execute("DELETE FROM responses WHERE hash = ?", (key,))
+                return None
+            with conn:
+                conn.execute("UPDATE responses SET accessed = ? WHERE hash = ?",
+                             (now, key))
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response.reason = reason
+        response.encoding = encoding
+        response.headers = requests.structures.CaseInsensitiveDict(
+            _json.loads(headers))
+        response._content = content
+        log.debug("Retrieving data from {0} ({1})".format(self.path, key))
+        return response
+
+    def set(self, query, response):
+        key = query.hash()
+        content = response.content
+        now = time.time()
+        log.debug("Caching data to {0} ({1})".format(self.path, key))
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, response.url, response.status_code, response.reason,
+                     response.encoding, _json.dumps(dict(response.headers)),
+                     content, len(content), now, now))
+                if self.max_size is not None:
+                    self._evict(conn)
+
+    def _evict(self, conn):
+        total, = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_size:
+            return
+        rows = conn.execute(
+            "SELECT hash, size FROM responses ORDER BY accessed")
+        to_delete = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            to_delete.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE hash = ?", to_delete)
+
+    def remove(self, query):
+        key = query.hash()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute("DELETE FROM responses WHERE hash = ?",
+                                      (key,))
+        if cursor.rowcount == 0:
+            raise OSError(f"Tried to remove cache entry {key} from "
+                          f"{self.path} but it does not exist")
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
 class LoginABCMeta(abc.ABCMeta):
     """
     The goal of this metaclass is to copy the docstring and signature from
@@ -169,17 +467,70 @@ class BaseQuery(metaclass=LoginABCMeta):
             'astroquery/{vers} {olduseragent}'
             .format(vers=version.version,
                     olduseragent=S.headers['User-Agent']))
+        for prefix in ('http://', 'https://'):
+            S.mount(prefix, TimedHTTPAdapter())
+        # the measurements of the requests, see `stats`
+        self._instrumentation = Instrumentation(self.__class__.__name__)
 
         self.cache_location = os.path.join(
             paths.get_cache_dir(), 'astroquery',
             self.__class__.__name__.split("Class")[0])
         os.makedirs(self.cache_location, exist_ok=True)
         self._cache_active = True
+        # None means the default `PickleCacheStore` in ``cache_location``
+        self.cache_store = None
 
     def __call__(self, *args, **kwargs):
         """ init a fresh copy of self """
         return self.__class__(*args, **kwargs)
 
+    @property
+    def instrumentation(self):
+        """
+        The `~astroquery.instrumentation.Instrumentation` measuring the
+        requests of this instance, to which exporters can be added.
+        """
+        # created here for the subclasses not calling BaseQuery.__init__
+        if '_instrumentation' not in self.__dict__:
+            self._instrumentation = Instrumentation(self.__class__.__name__)
+        return self._instrumentation
+
+    def stats(self):
+        """
+        Return the summary of the requests sent by this instance and of the
+        parsing of their responses.
+
+        The requests are summarized by method and URL template, see
+        `~astroquery.instrumentation.Instrumentation.stats`. The individual
+        requests are given to the exporters added to ``instrumentation``.
+
+        Returns
+        -------
+        stats : `~astropy.table.Table`
+        """
+        return self.instrumentation.stats()
+
+    def _get_cache_store(self):
+        """
+        Return the `CacheStore` used by `_request`.
+        """
+        if self.cache_store is not None:
+            return self.cache_store
+        return PickleCacheStore(self.cache_location)
+
+    def _remove_last_query_from_cache(self, response=None):
+        """
+        Remove the entry of the last query from the cache - may be needed if a
+        query fails during parsing (successful request, but failed return).
+        When ``response`` is given, the entry of the query it was returned
+        for is removed instead, so that the queries of the other threads are
+        left alone.  Raises `OSError` if there is no such entry.
+        """
+        query = getattr(response, 'query', None)
+        if not isinstance(query, AstroQuery):
+            query = self._last_query
+        self._get_cache_store().remove(query)
+
     def _response_hook(self, response, *args, **kwargs):
         loglevel = log.getEffectiveLevel()
 
@@ -300,29 +651,115 @@ class BaseQuery(metaclass=LoginABCMeta):
                 return local_filepath
         else:
             query = AstroQuery(method, url, **req_kwargs)
-            if ((self.cache_location is None) or (not self._cache_active) or (not cache)):
-                with suspend_cache(self):
-                    response = query.request(self._session, stream=stream,
-                                             auth=auth, verify=verify,
-                                             allow_redirects=allow_redirects,
-                                             json=json)
+            response = self._request_query(query, cache=cache, stream=stream,
+                                           auth=auth, verify=verify,
+                                           allow_redirects=allow_redirects)
+            self._last_query = query
+            return response
+
+    def _request_query(self, query, cache=True, stream=False, auth=None,
+                       verify=True, allow_redirects=True):
+        """
+        Send an `AstroQuery`, going through the cache store if caching is
+        active.  This is the part of `_request` shared with `_request_many`.
+        """
+        with self.instrumentation.measure('request', query.method, query.url) as event:
+            if (((self.cache_location is None and self.cache_store is None)
+                 or (not self._cache_active) or (not cache))):
+                response = query.request(self._session, stream=stream,
+                                         auth=auth, verify=verify,
+                                         allow_redirects=allow_redirects,
+                                         json=query.json)
             else:
-                response = query.from_cache(self.cache_location)
-                if not response:
+                cache_store = self._get_cache_store()
+                response = cache_store.get(query)
+                if response:
+                    event.cache = 'hit'
+                else:
+                    event.cache = 'miss'
                     response = query.request(self._session,
                                              self.cache_location,
                                              stream=stream,
                                              auth=auth,
                                              allow_redirects=allow_redirects,
                                              verify=verify,
-                                             json=json)
-                    to_cache(response, query.request_file(self.cache_location))
-            self._last_query = query
-            return response
+                                             json=query.json)
+                    cache_store.set(query, response)
+            _record_response(event, response, read=not stream)
+        # the query is carried by its response, see
+        # `_remove_last_query_from_cache`
+        response.query = query
+        return response
+
+    def batch(self, max_workers=None, max_per_host=None):
+        """
+        Context manager running requests concurrently on the session of this
+        instance.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of threads sending the requests, and size of the HTTP
+            connection pool.  Defaults to ``conf.max_workers``.
+        max_per_host : int, optional
+            Maximum number of requests sent concurrently to a single host.
+            Defaults to ``conf.max_per_host``.
+
+        Returns
+        -------
+        batch : `QueryBatch`
+
+        Examples
+        --------
+        >>> from astroquery.query import AstroQuery
+        >>> with Vizier.batch(max_workers=8) as batch:  # doctest: +SKIP
+        ...     responses = batch.map([AstroQuery('GET', url) for url in urls])
+        """
+        return QueryBatch(self, max_workers=max_workers,
+                          max_per_host=max_per_host)
+
+    def _request_many(self, queries, cache=True, max_workers=None,
+                      max_per_host=None, **kwargs):
+        """
+        Send a list of `AstroQuery` concurrently, see `batch`.
+
+        Parameters
+        ----------
+        queries : list of `AstroQuery`
+        cache : bool
+        max_workers : int, optional
+        max_per_host : int, optional
+        **kwargs
+            Passed to `_request_query` (``stream``, ``auth``, ``verify``,
+            ``allow_redirects``).
+
+        Returns
+        -------
+        responses : list of `requests.Response`
+            The responses, in the order of ``queries``.
+        """
+        with self.batch(max_workers=max_workers,
+                        max_per_host=max_per_host) as batch:
+            return batch.map(queries, cache=cache, **kwargs)
+
+    def _size_connection_pool(self, maxsize):
+        """
+        Make sure the HTTP(S) connection pools of the session can keep
+        ``maxsize`` connections per host open.
+        """
+        for prefix in ('http://', 'https://'):
+            adapter = self._session.get_adapter(prefix)
+            if getattr(adapter, '_pool_maxsize', maxsize) < maxsize:
+                new_adapter = TimedHTTPAdapter(
+                    pool_connections=adapter._pool_connections,
+                    pool_maxsize=maxsize,
+                    max_retries=adapter.max_retries,
+                    pool_block=adapter._pool_block)
+                self._session.mount(prefix, new_adapter)
 
     def _download_file(self, url, local_filepath, timeout=None, auth=None,
                        continuation=True, cache=False, method="GET",
-                       head_safe=False, **kwargs):
+                       head_safe=False, progress_callback=None, **kwargs):
         """
         Download a file.  Resembles `astropy.utils.data.download_file` but uses
         the local ``_session``
@@ -340,105 +777,474 @@ class BaseQuery(metaclass=LoginABCMeta):
         cache : bool
         method : "GET" or "POST"
         head_safe : bool
+        progress_callback : callable or None
+            If given, it is called with the size of each downloaded block
+            instead of displaying a progress bar.
         """
 
-        if head_safe:
-            response = self._session.request("HEAD", url,
-                                             timeout=timeout, stream=True,
-                                             auth=auth, **kwargs)
-        else:
-            response = self._session.request(method, url,
-                                             timeout=timeout, stream=True,
-                                             auth=auth, **kwargs)
-
-        response.raise_for_status()
-        if 'content-length' in response.headers:
-            length = int(response.headers['content-length'])
-            if length == 0:
-                log.warn('URL {0} has length=0'.format(url))
-        else:
-            length = None
-
-        if ((os.path.exists(local_filepath)
-             and ('Accept-Ranges' in response.headers)
-             and continuation)):
-            open_mode = 'ab'
-
-            existing_file_length = os.stat(local_filepath).st_size
-            if length is not None and existing_file_length >= length:
-                # all done!
-                log.info("Found cached file {0} with expected size {1}."
-                         .format(local_filepath, existing_file_length))
-                return
-            elif existing_file_length == 0:
-                open_mode = 'wb'
+        with self.instrumentation.measure('download', method, url) as event:
+            if head_safe:
+                response = self._session.request("HEAD", url,
+                                                 timeout=timeout, stream=True,
+                                                 auth=auth, **kwargs)
             else:
-                log.info("Continuing download of file {0}, with {1} bytes to "
-                         "go ({2}%)".format(local_filepath,
-                                            length - existing_file_length,
-                                            (length-existing_file_length)/length*100))
-
-                # bytes are indexed from 0:
-                # https://en.wikipedia.org/wiki/List_of_HTTP_header_fields#range-request-header
-                end = "{0}".format(length-1) if length is not None else ""
-                self._session.headers['Range'] = "bytes={0}-{1}".format(existing_file_length,
-                                                                        end)
-
                 response = self._session.request(method, url,
                                                  timeout=timeout, stream=True,
                                                  auth=auth, **kwargs)
-                response.raise_for_status()
-                del self._session.headers['Range']
-
-        elif cache and os.path.exists(local_filepath):
-            if length is not None:
-                statinfo = os.stat(local_filepath)
-                if statinfo.st_size != length:
-                    log.warning(f"Found cached file {local_filepath} with size {statinfo.st_size} "
-                                f"that is different from expected size {length}")
+
+            response.raise_for_status()
+            if 'content-length' in response.headers:
+                length = int(response.headers['content-length'])
+                if length == 0:
+                    log.warn('URL {0} has length=0'.format(url))
+            else:
+                length = None
+
+            if ((os.path.exists(local_filepath)
+                 and ('Accept-Ranges' in response.headers)
+                 and continuation)):
+                open_mode = 'ab'
+
+                existing_file_length = os.stat(local_filepath).st_size
+                if length is not None and existing_file_length >= length:
+                    # all done!
+                    log.info("Found cached file {0} with expected size {1}."
+                             .format(local_filepath, existing_file_length))
+                    event.cache = 'hit'
+                    _record_response(event, response)
+                    return
+                elif existing_file_length == 0:
                     open_mode = 'wb'
                 else:
-                    log.info("Found cached file {0} with expected size {1}."
-                             .format(local_filepath, statinfo.st_size))
+                    log.info("Continuing download of file {0}, with {1} bytes to "
+                             "go ({2}%)".format(local_filepath,
+                                                length - existing_file_length,
+                                                (length-existing_file_length)/length*100))
+
+                    # bytes are indexed from 0:
+                    # https://en.wikipedia.org/wiki/List_of_HTTP_header_fields#range-request-header
+                    end = "{0}".format(length-1) if length is not None else ""
+                    # The range is set on this request only, the session headers
+                    # are shared with the other threads using this instance.
+                    range_kwargs = dict(kwargs)
+                    range_kwargs['headers'] = dict(kwargs.get('headers') or {})
+                    range_kwargs['headers']['Range'] = "bytes={0}-{1}".format(
+                        existing_file_length, end)
+
+                    response = self._session.request(method, url,
+                                                     timeout=timeout, stream=True,
+                                                     auth=auth, **range_kwargs)
+                    response.raise_for_status()
+
+            elif cache and os.path.exists(local_filepath):
+                if length is not None:
+                    statinfo = os.stat(local_filepath)
+                    if statinfo.st_size != length:
+                        log.warning(f"Found cached file {local_filepath} with size {statinfo.st_size} "
+                                    f"that is different from expected size {length}")
+                        open_mode = 'wb'
+                    else:
+                        log.info("Found cached file {0} with expected size {1}."
+                                 .format(local_filepath, statinfo.st_size))
+                        event.cache = 'hit'
+                        _record_response(event, response)
+                        response.close()
+                        return
+                else:
+                    log.info("Found cached file {0}.".format(local_filepath))
+                    event.cache = 'hit'
+                    _record_response(event, response)
                     response.close()
                     return
             else:
-                log.info("Found cached file {0}.".format(local_filepath))
+                open_mode = 'wb'
+                if head_safe:
+                    response = self._session.request(method, url,
+                                                     timeout=timeout, stream=True,
+                                                     auth=auth, **kwargs)
+                    response.raise_for_status()
+
+            blocksize = astropy.utils.data.conf.download_block_size
+
+            log.debug(f"Downloading URL {url} to {local_filepath} with size {length} "
+                      f"by blocks of {blocksize}")
+
+            bytes_read = 0
+            _record_response(event, response, read=False)
+
+            if progress_callback is not None:
+                with open(local_filepath, open_mode) as f:
+                    for block in response.iter_content(blocksize):
+                        f.write(block)
+                        bytes_read += len(block)
+                        progress_callback(len(block))
                 response.close()
-                return
-        else:
-            open_mode = 'wb'
-            if head_safe:
-                response = self._session.request(method, url,
-                                                 timeout=timeout, stream=True,
+                event.bytes_received = bytes_read
+                return response
+
+            with ProgressBarOrSpinner(length, f'Downloading URL {url} to {local_filepath} ...',
+                                      file=_progress_stream()) as pb:
+                with open(local_filepath, open_mode) as f:
+                    for block in response.iter_content(blocksize):
+                        f.write(block)
+                        bytes_read += len(block)
+                        if length is not None:
+                            pb.update(bytes_read if bytes_read <= length else length)
+                        else:
+                            pb.update(bytes_read)
+            response.close()
+            event.bytes_received = bytes_read
+            return response
+
+    def _download_files(self, downloads, max_workers=None, timeout=None,
+                        auth=None, continuation=True, cache=False,
+                        method="GET", head_safe=False, segment_size=None,
+                        checksums=None, return_exceptions=False, **kwargs):
+        """
+        Download several files concurrently.
+
+        Each file is downloaded with `_download_file` (so partial downloads
+        are continued and cached files are skipped in the same way), except
+        for the files larger than ``segment_size`` served with
+        ``Accept-Ranges: bytes``, which are downloaded in parallel byte-range
+        segments.  The segments are written to a ``.part`` file, renamed to
+        the local path once the download is complete and verified; with
+        ``continuation``, an interrupted segmented download is continued with
+        the segments not downloaded yet.  The sizes of the downloaded files
+        are checked against the ``Content-Length`` announced by the server,
+        and their checksums against ``checksums`` or the ``Content-MD5``
+        header if available.
+
+        Parameters
+        ----------
+        downloads : list of tuple
+            ``(url, local_filepath)`` pairs.
+        max_workers : int, optional
+            Number of concurrent requests.  Defaults to ``conf.max_workers``.
+        timeout : int
+        auth : dict or None
+        continuation : bool
+        cache : bool
+        method : "GET" or "POST"
+        head_safe : bool
+            See `_download_file`.
+        segment_size : int or `~astropy.units.Quantity`, optional
+            Size of the byte-range segments, and minimum size of a file to
+            be downloaded in segments.  Defaults to
+            ``conf.download_segment_size``; 0 disables segmented downloads.
+        checksums : dict, optional
+            Expected checksums of the files, keyed by local path, as
+            ``'<algorithm>:<hexdigest>'`` strings with an algorithm known to
+            `hashlib`, e.g. ``'md5:d41d8cd98f00b204e9800998ecf8427e'``.
+        return_exceptions : bool
+            If `True`, the exception raised by a failed download is returned
+            in place of its local path instead of being raised once all the
+            downloads are done.
+        **kwargs
+            Passed to the requests.
+
+        Returns
+        -------
+        local_filepaths : list
+            The local paths (or exceptions), in the order of ``downloads``.
+        """
+        max_workers = max_workers or conf.max_workers
+        if segment_size is None:
+            segment_size = conf.download_segment_size
+        if hasattr(segment_size, 'to'):
+            segment_size = segment_size.to(u.byte).value
+        segment_size = int(segment_size or 0)
+        checksums = checksums or {}
+        downloads = [tuple(download) for download in downloads]
+        if not downloads:
+            return []
+
+        self._size_connection_pool(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if segment_size:
+                probes = list(executor.map(
+                    lambda download: self._probe_download(
+                        download[0], timeout=timeout, auth=auth, **kwargs),
+                    downloads))
+            else:
+                probes = [(None, False, None)] * len(downloads)
+
+            known_lengths = [length for length, _, _ in probes
+                             if length is not None]
+            total = (sum(known_lengths)
+                     if len(known_lengths) == len(downloads) else None)
+            progress = _DownloadProgress(total, len(downloads))
+
+            futures = []
+            segmented_files = []
+            with progress:
+                for (url, local_filepath), (length, ranges, _) in zip(downloads, probes):
+                    segmented_files.append(None)
+                    if (method == "GET" and ranges and length is not None
+                            and length > segment_size):
+                        if (cache and os.path.exists(local_filepath)
+                                and os.stat(local_filepath).st_size == length):
+                            log.info("Found cached file {0} with expected size "
+                                     "{1}.".format(local_filepath, length))
+                            progress.update(length)
+                            futures.append([])
+                            continue
+                        log.debug(f"Downloading URL {url} to {local_filepath} "
+                                  f"in segments of {segment_size} bytes")
+                        segmented = _SegmentedFile(local_filepath, length,
+                                                   resume=continuation)
+                        segmented_files[-1] = segmented
+                        file_futures = []
+                        for start in range(0, length, segment_size):
+                            end = min(start + segment_size, length) - 1
+                            if (start, end) in segmented.done:
+                                progress.update(end - start + 1)
+                                continue
+                            file_futures.append(executor.submit(
+                                self._download_segment, url,
+                                segmented.part_filepath, start, end,
+                                timeout=timeout, auth=auth,
+                                progress_callback=progress.update,
+                                done_callback=segmented.segment_done,
+                                **kwargs))
+                        futures.append(file_futures)
+                    else:
+                        futures.append([executor.submit(
+                            self._download_file, url, local_filepath,
+                            timeout=timeout, auth=auth,
+                            continuation=continuation, cache=cache,
+                            method=method, head_safe=head_safe,
+                            progress_callback=progress.update, **kwargs)])
+
+                results = []
+                for ((url, local_filepath), (length, _, md5), file_futures,
+                     segmented) in zip(downloads, probes, futures, segmented_files):
+                    try:
+                        responses = [future.result() for future in file_futures]
+                        if segmented is None and responses and _is_encoded(responses[0]):
+                            # the file was sent encoded (e.g. gzip) although
+                            # the HEAD response was not
+                            length = md5 = None
+                        expected = checksums.get(local_filepath)
+                        if expected is None and md5 is not None:
+                            expected = 'md5:' + md5
+                        if segmented is None:
+                            self._verify_download(local_filepath, length, expected)
+                        else:
+                            try:
+                                self._verify_download(segmented.part_filepath,
+                                                      length, expected)
+                            except DownloadError:
+                                # the segments are corrupted, none is kept
+                                segmented.discard()
+                                raise
+                            segmented.complete()
+                        results.append(local_filepath)
+                    except Exception as ex:
+                        results.append(ex)
+                    progress.file_done()
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def _probe_download(self, url, timeout=None, auth=None, **kwargs):
+        """
+        Send a HEAD request for ``url``, returning its length, whether it
+        supports byte-range requests, and its MD5 checksum (hex) if
+        advertised.  Servers rejecting HEAD requests, or sending the file
+        with a ``Content-Encoding``, give ``(None, False, None)``.
+        """
+        try:
+            # the session is used directly, as in `_download_segment`, since
+            # the probes are sent from the threads of `_download_files`
+            with self.instrumentation.measure('request', "HEAD", url) as event:
+                response = self._session.request("HEAD", url, timeout=timeout,
                                                  auth=auth, **kwargs)
+                _record_response(event, response)
                 response.raise_for_status()
+        except requests.exceptions.RequestException as ex:
+            log.debug(f"HEAD request to {url} failed: {ex}")
+            return None, False, None
+
+        headers = response.headers
+        if _is_encoded(response):
+            # the length, the ranges and the checksum are those of the
+            # encoded body, not of the decoded file written by iter_content
+            return None, False, None
+        length = headers.get('Content-Length')
+        length = int(length) if length is not None else None
+        ranges = headers.get('Accept-Ranges') == 'bytes'
+        md5 = headers.get('Content-MD5')
+        if md5 is not None:
+            try:
+                md5 = base64.b64decode(md5).hex()
+            except (ValueError, TypeError):
+                md5 = None
+        return length, ranges, md5
+
+    def _download_segment(self, url, local_filepath, start, end, timeout=None,
+                          auth=None, progress_callback=None, done_callback=None,
+                          **kwargs):
+        """
+        Download the bytes ``start`` to ``end`` (included) of ``url`` into
+        the preallocated file ``local_filepath``, then call
+        ``done_callback(start, end)`` if given.
+        """
+        kwargs['headers'] = dict(kwargs.get('headers') or {})
+        kwargs['headers']['Range'] = "bytes={0}-{1}".format(start, end)
+        with self.instrumentation.measure('download', "GET", url) as event:
+            response = self._session.request("GET", url, timeout=timeout,
+                                             stream=True, auth=auth, **kwargs)
+            _record_response(event, response, read=False)
+            response.raise_for_status()
+            if response.status_code != 206:
+                response.close()
+                raise RemoteServiceError(f"Server did not honour the byte range "
+                                         f"{start}-{end} requested for {url}")
+
+            blocksize = astropy.utils.data.conf.download_block_size
+            bytes_read = 0
+            with open(local_filepath, 'r+b') as f:
+                f.seek(start)
+                for block in response.iter_content(blocksize):
+                    f.write(block)
+                    bytes_read += len(block)
+                    if progress_callback is not None:
+                        progress_callback(len(block))
+            response.close()
+            event.bytes_received = bytes_read
+        if done_callback is not None:
+            done_callback(start, end)
+
+    @staticmethod
+    def _verify_download(local_filepath, length=None, checksum=None):
+        """
+        Check the size and the ``'<algorithm>:<hexdigest>'`` checksum of a
+        downloaded file, raising `~astroquery.exceptions.DownloadError` if
+        they do not match.
+        """
+        if length is not None:
+            size = os.stat(local_filepath).st_size
+            if size != length:
+                raise DownloadError(f"File {local_filepath} has size {size} "
+                                    f"instead of the expected {length}")
+        if checksum is not None:
+            algorithm, expected = checksum.split(':', 1)
+            digest = hashlib.new(algorithm)
+            blocksize = astropy.utils.data.conf.download_block_size
+            with open(local_filepath, 'rb') as f:
+                for block in iter(lambda: f.read(blocksize), b''):
+                    digest.update(block)
+            if digest.hexdigest().lower() != expected.lower():
+                raise DownloadError(f"File {local_filepath} has {algorithm} "
+                                    f"checksum {digest.hexdigest()} instead "
+                                    f"of the expected {expected}")
+
+
+def _is_encoded(response):
+    """
+    Whether the body of ``response`` is sent with a ``Content-Encoding``,
+    which ``iter_content`` decodes.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    return headers.get('Content-Encoding', 'identity').lower() != 'identity'
 
-        blocksize = astropy.utils.data.conf.download_block_size
 
-        log.debug(f"Downloading URL {url} to {local_filepath} with size {length} "
-                  f"by blocks of {blocksize}")
+def _progress_stream():
+    # Only show progress bar if logging level is INFO or lower.
+    if log.getEffectiveLevel() <= 20:
+        return None  # Astropy default
+    return io.StringIO()
 
-        bytes_read = 0
 
-        # Only show progress bar if logging level is INFO or lower.
-        if log.getEffectiveLevel() <= 20:
-            progress_stream = None  # Astropy default
+class _SegmentedFile:
+    """
+    Partial file of a download in byte-range segments, preallocated next to
+    its local path with a ``.part`` suffix.  The finished segments are
+    recorded in a ``.part.segments`` file, so that an interrupted download
+    can be continued with the segments not downloaded yet.
+    """
+
+    def __init__(self, local_filepath, length, resume=True):
+        self.local_filepath = local_filepath
+        self.part_filepath = local_filepath + '.part'
+        self.segments_filepath = self.part_filepath + '.segments'
+        self.done = set()
+        self._lock = threading.Lock()
+        if (resume and os.path.exists(self.segments_filepath)
+                and os.path.exists(self.part_filepath)
+                and os.stat(self.part_filepath).st_size == length):
+            with open(self.segments_filepath) as f:
+                for line in f:
+                    fields = line.split()
+                    # the last line may have been written partly
+                    if len(fields) == 2 and line.endswith('\n'):
+                        self.done.add((int(fields[0]), int(fields[1])))
+            log.info(f"Continuing download of file {local_filepath}, with "
+                     f"{len(self.done)} segments already downloaded")
         else:
-            progress_stream = io.StringIO()
+            with open(self.part_filepath, 'wb') as f:
+                f.truncate(length)
+            open(self.segments_filepath, 'w').close()
+
+    def segment_done(self, start, end):
+        with self._lock:
+            with open(self.segments_filepath, 'a') as f:
+                f.write(f'{start} {end}\n')
+
+    def complete(self):
+        """
+        Move the complete file to its local path.
+        """
+        os.replace(self.part_filepath, self.local_filepath)
+        os.remove(self.segments_filepath)
+
+    def discard(self):
+        for path in (self.part_filepath, self.segments_filepath):
+            if os.path.exists(path):
+                os.remove(path)
 
-        with ProgressBarOrSpinner(length, f'Downloading URL {url} to {local_filepath} ...',
-                                  file=progress_stream) as pb:
-            with open(local_filepath, open_mode) as f:
-                for block in response.iter_content(blocksize):
-                    f.write(block)
-                    bytes_read += len(block)
-                    if length is not None:
-                        pb.update(bytes_read if bytes_read <= length else length)
-                    else:
-                        pb.update(bytes_read)
-        response.close()
-        return response
+
+class _DownloadProgress:
+    """
+    Aggregated progress bar of the files downloaded by
+    `BaseQuery._download_files`, updated from the download threads.
+    """
+
+    def __init__(self, total, nfiles):
+        self.total = total
+        self.nfiles = nfiles
+        self.bytes_read = 0
+        self.files_done = 0
+        self._lock = threading.Lock()
+        self._pb = None
+
+    def __enter__(self):
+        self._context = ProgressBarOrSpinner(
+            self.total, f'Downloading {self.nfiles} files ...',
+            file=_progress_stream())
+        self._pb = self._context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._context.__exit__(exc_type, exc_value, traceback)
+
+    def update(self, nbytes):
+        with self._lock:
+            self.bytes_read += nbytes
+            if self.total is not None:
+                self._pb.update(min(self.bytes_read, self.total))
+            else:
+                self._pb.update(self.bytes_read)
+
+    def file_done(self):
+        with self._lock:
+            self.files_done += 1
+            log.debug(f"Downloaded {self.files_done}/{self.nfiles} files")
 
 
 class suspend_cache:
@@ -457,6 +1263,85 @@ class suspend_cache:
         return False
 
 
+class QueryBatch:
+    """
+    Run `AstroQuery` requests concurrently in a bounded thread pool, using
+    the session and the cache store of a `BaseQuery` instance.  Use it
+    through `BaseQuery.batch`.
+    """
+
+    def __init__(self, query_instance, max_workers=None, max_per_host=None):
+        self.query_instance = query_instance
+        self.max_workers = max_workers or conf.max_workers
+        self.max_per_host = max_per_host or conf.max_per_host
+        self._host_semaphores = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+
+    def __enter__(self):
+        self.query_instance._size_connection_pool(self.max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            for future in self._futures:
+                future.cancel()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._futures = []
+        return False
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(
+                    self.max_per_host)
+            return self._host_semaphores[host]
+
+    def _run(self, query, **kwargs):
+        with self._host_semaphore(query.url):
+            return self.query_instance._request_query(query, **kwargs)
+
+    def submit(self, query, cache=True, **kwargs):
+        """
+        Schedule a request.
+
+        Parameters
+        ----------
+        query : `AstroQuery`
+        cache : bool
+        **kwargs
+            ``stream``, ``auth``, ``verify`` and ``allow_redirects``, see
+            `BaseQuery._request`.
+
+        Returns
+        -------
+        future : `concurrent.futures.Future`
+            Resolves to the `requests.Response`.
+        """
+        if self._executor is None:
+            raise RuntimeError("QueryBatch must be used as a context manager")
+        future = self._executor.submit(self._run, query, cache=cache, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def map(self, queries, cache=True, **kwargs):
+        """
+        Send all the ``queries`` and wait for their responses.
+
+        Returns
+        -------
+        responses : list of `requests.Response`
+            The responses, in the order of ``queries``.
+        """
+        futures = [self.submit(query, cache=cache, **kwargs)
+                   for query in queries]
+        return [future.result() for future in futures]
+
+
 class QueryWithLogin(BaseQuery):
     """
     This is the base class for all the query classes which are required to
@@ -20,6 +20,10 @@ class Conf(_config.ConfigNamespace):
         60,
         'Time limit for connecting to SDSS server.')
     default_release = _config.ConfigItem(14, 'Default SDSS data release.')
+    crossid_batch_size = _config.ConfigItem(
+        1000,
+        'Maximum number of positions uploaded in a single Cross-ID query; '
+        'larger queries are split into several concurrent requests.')
 
 
 conf = Conf()
@@ -6,13 +6,15 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 import io
 import warnings
+from operator import methodcaller
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from astropy import units as u
 import astropy.coordinates as coord
-from astropy.table import Table, Column
+from astropy.table import Table, Column, vstack
 
-from ..query import BaseQuery
+from ..query import BaseQuery, conf as query_conf
 from . import conf
 from ..utils import commons, async_to_sync, prepend_docstr_nosections
 from ..exceptions import RemoteServiceError, NoResultsWarning
@@ -26,6 +28,95 @@ __doctest_skip__ = ['SDSSClass.*']
 sdss_arcsec_per_pixel = 0.396 * u.arcsec / u.pixel
 
 
+def _format_crossid_upload(coordinates, obj_names):
+    """
+    Format the ``obj_id ra dec`` upload of a Cross-ID query. The RA and Dec
+    of coordinate arrays are taken once for all the positions, instead of
+    indexing the array for each of them.
+    """
+    if isinstance(coordinates, commons.CoordClasses):
+        ra = np.atleast_1d(coordinates.ra.deg).tolist()
+        dec = np.atleast_1d(coordinates.dec.deg).tolist()
+    else:
+        ra = [coordinate.ra.deg for coordinate in coordinates]
+        dec = [coordinate.dec.deg for coordinate in coordinates]
+
+    data = "obj_id ra dec \n"
+    data += " \n ".join(['{0} {1} {2}'.format(obj_name, obj_ra, obj_dec)
+                         for obj_name, obj_ra, obj_dec in zip(obj_names, ra, dec)])
+    return data
+
+
+def _parse_csv(content):
+    """
+    Read the CSV output of SkyServer into a structured array with the same
+    names and types as ``np.genfromtxt(..., names=True, dtype=None)``.
+
+    The fields are split and converted column by column with numpy, trying
+    the same bool, int and float types as `~numpy.genfromtxt` does, which
+    is much faster than its row by row conversion for large results. Any
+    content this can not reproduce exactly (comments, blank or ragged
+    lines, missing values, padded strings, complex numbers) is left to
+    `~numpy.genfromtxt`.
+    """
+    skip_header = 0
+    if content.startswith(b'#Table'):
+        skip_header = 1
+
+    def genfromtxt(content):
+        return np.atleast_1d(np.genfromtxt(io.BytesIO(content),
+                                           names=True, dtype=None,
+                                           delimiter=',', skip_header=skip_header,
+                                           comments='#'))
+
+    lines = content.split(b'\n')
+    if lines[-1] == b'':
+        lines.pop()
+    if skip_header:
+        lines.pop(0)
+    if (len(lines) < 2 or b'\r' in content
+            or b'#' in content[content.index(b'\n') + 1 if skip_header else 0:]):
+        return genfromtxt(content)
+
+    header, lines = lines[0], lines[1:]
+    n_fields = header.count(b',') + 1
+    if set(map(methodcaller('count', b','), lines)) != {n_fields - 1}:
+        return genfromtxt(content)
+    fields = b','.join(lines).split(b',')
+    if b'' in fields:
+        return genfromtxt(content)
+
+    # the names are validated the same way as genfromtxt does
+    names = np.genfromtxt(io.BytesIO(header + b'\n' + lines[0]), names=True,
+                          dtype=None, delimiter=',').dtype.names
+
+    columns = []
+    for index in range(n_fields):
+        column = np.array(fields[index::n_fields])
+        if column.dtype.itemsize <= 5 and column[0].upper() in (b'TRUE', b'FALSE'):
+            upper = np.char.upper(column)
+            if np.all((upper == b'TRUE') | (upper == b'FALSE')):
+                columns.append(upper == b'TRUE')
+                continue
+        for dtype in (np.int_, np.float64):
+            try:
+                columns.append(column.astype(dtype))
+                break
+            except (ValueError, OverflowError):
+                pass
+        else:
+            if (np.any(np.char.strip(column) != column)
+                    or np.any(np.char.endswith(np.char.upper(column), b'J'))):
+                return genfromtxt(content)
+            columns.append(column)
+
+    arr = np.empty(len(lines), dtype=[(name, column.dtype)
+                                      for name, column in zip(names, columns)])
+    for name, column in zip(names, columns):
+        arr[name] = column
+    return arr
+
+
 @async_to_sync
 class SDSSClass(BaseQuery):
     TIMEOUT = conf.timeout
@@ -100,19 +191,16 @@ class SDSSClass(BaseQuery):
             but does not actually do the query.
         data_release : int
             The data release of the SDSS to use.
-        """
 
-        if (not isinstance(coordinates, list) and
-                not isinstance(coordinates, Column) and
-                not (isinstance(coordinates, commons.CoordClasses) and
-                     not coordinates.isscalar)):
-            coordinates = [coordinates]
+        Returns
+        -------
+        response : `requests.Response`
+            The response of a single query uploading all the coordinates,
+            see `query_crossid` to upload them by batches of
+            ``conf.crossid_batch_size``.
+        """
 
-        if obj_names is None:
-            obj_names = ['obj_{0}'.format(i) for i in range(len(coordinates))]
-        elif len(obj_names) != len(coordinates):
-            raise ValueError("Number of coordinates and obj_names should "
-                             "be equal")
+        coordinates, obj_names = self._crossid_targets(coordinates, obj_names)
 
         if isinstance(radius, u.Quantity):
             radius = radius.to(u.arcmin).value
@@ -149,11 +237,7 @@ class SDSSClass(BaseQuery):
             sql_query += 'JOIN SpecObjAll s ON p.objID = s.bestObjID '
         sql_query += 'ORDER BY x.up_id'
 
-        data = "obj_id ra dec \n"
-        data += " \n ".join(['{0} {1} {2}'.format(obj_names[i],
-                                                  coordinates[i].ra.deg,
-                                                  coordinates[i].dec.deg)
-                             for i in range(len(coordinates))])
+        data = _format_crossid_upload(coordinates, obj_names)
 
         # firstcol is hardwired, as obj_names is always passed
         request_payload = dict(uquery=sql_query, paste=data,
@@ -172,6 +256,50 @@ class SDSSClass(BaseQuery):
                                  timeout=timeout, cache=cache)
         return response
 
+    @prepend_docstr_nosections(query_crossid_async.__doc__)
+    def query_crossid(self, coordinates, obj_names=None,
+                      photoobj_fields=None, specobj_fields=None,
+                      get_query_payload=False, timeout=TIMEOUT,
+                      radius=5. * u.arcsec,
+                      data_release=conf.default_release, cache=True,
+                      verbose=False):
+        """
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            The matches of the coordinates, uploaded by batches of
+            ``conf.crossid_batch_size`` in queries sent concurrently, in
+            their order, or `None` if no matches were found. The list of the
+            payloads of the batches if ``get_query_payload`` is True.
+        """
+        coordinates, obj_names = self._crossid_targets(coordinates, obj_names)
+
+        def query_batch(start):
+            return self.query_crossid_async(
+                coordinates[start:start + batch_size],
+                obj_names=obj_names[start:start + batch_size],
+                photoobj_fields=photoobj_fields, specobj_fields=specobj_fields,
+                get_query_payload=get_query_payload, timeout=timeout,
+                radius=radius, data_release=data_release, cache=cache)
+
+        # the positions are uploaded by batches within the Cross-ID limit
+        batch_size = conf.crossid_batch_size
+        starts = range(0, max(len(coordinates), 1), batch_size)
+        if get_query_payload:
+            return [query_batch(start) for start in starts]
+
+        max_workers = min(query_conf.max_per_host, len(starts))
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(query_batch, start) for start in starts]
+            try:
+                responses = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        return self._parse_result(responses, verbose=verbose)
+
     def query_region_async(self, coordinates, radius=2. * u.arcsec,
                            fields=None, spectro=False, timeout=TIMEOUT,
                            get_query_payload=False, photoobj_fields=None,
@@ -846,6 +974,24 @@ class SDSSClass(BaseQuery):
         if readable_objs is not None:
             return [obj.get_fits() for obj in readable_objs]
 
+    def _crossid_targets(self, coordinates, obj_names):
+        """
+        Return the coordinates of a Cross-ID query as a sequence, and their
+        names, named after their index by default.
+        """
+        if (not isinstance(coordinates, list) and
+                not isinstance(coordinates, Column) and
+                not (isinstance(coordinates, commons.CoordClasses) and
+                     not coordinates.isscalar)):
+            coordinates = [coordinates]
+
+        if obj_names is None:
+            obj_names = ['obj_{0}'.format(i) for i in range(len(coordinates))]
+        elif len(obj_names) != len(coordinates):
+            raise ValueError("Number of coordinates and obj_names should "
+                             "be equal")
+        return coordinates, obj_names
+
     def _parse_result(self, response, verbose=False):
         """
         Parses the result and return either a `~astropy.table.Table` or
@@ -853,8 +999,10 @@ class SDSSClass(BaseQuery):
 
         Parameters
         ----------
-        response : `requests.Response`
-            Result of requests -> np.atleast_1d.
+        response : `requests.Response` or list of `requests.Response`
+            Result of requests -> np.atleast_1d. The tables of a list of
+            responses, e.g. from a Cross-ID query uploaded by batches, are
+            stacked in order.
 
         Returns
         -------
@@ -862,15 +1010,17 @@ class SDSSClass(BaseQuery):
 
         """
 
+        if isinstance(response, list):
+            tables = [self._parse_result(batch_response, verbose=verbose)
+                      for batch_response in response]
+            tables = [table for table in tables if table is not None]
+            if not tables:
+                return None
+            return vstack(tables)
+
         if 'error_message' in io.BytesIO(response.content):
             raise RemoteServiceError(response.content)
-        skip_header = 0
-        if response.content.startswith(b'#Table'):
-            skip_header = 1
-        arr = np.atleast_1d(np.genfromtxt(io.BytesIO(response.content),
-                                          names=True, dtype=None,
-                                          delimiter=',', skip_header=skip_header,
-                                          comments='#'))
+        arr = _parse_csv(response.content)
 
         if len(arr) == 0:
             return None
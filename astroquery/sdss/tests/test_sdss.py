@@ -1,11 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 from contextlib import contextmanager
 from urllib.error import URLError
+import io
 import os
 import socket
 import numpy as np
 from numpy.testing import assert_allclose
 
+from astropy.coordinates import SkyCoord
+from astropy import units as u
 from astropy.io import fits
 from astropy.table import Column, Table
 import pytest
@@ -316,6 +319,73 @@ def test_query_crossid(patch_post, dr):
     url_tester_crossid(dr)
 
 
+def test_query_crossid_batches(patch_post):
+    coordinates = SkyCoord([2.02, 2.03, 2.04] * u.deg, [14.84, 14.85, 14.86] * u.deg)
+    with sdss.conf.set_temp('crossid_batch_size', 2):
+        payloads = sdss.SDSS.query_crossid(coordinates, get_query_payload=True)
+        payload = sdss.SDSS.query_crossid_async(coordinates, get_query_payload=True)
+        xid = sdss.SDSS.query_crossid(coordinates)
+        # a single query is sent by the asynchronous method
+        response = sdss.SDSS.query_crossid_async(coordinates)
+
+    assert [payload['paste'] for payload in payloads] == [
+        'obj_id ra dec \nobj_0 2.02 14.84 \n obj_1 2.03 14.85',
+        'obj_id ra dec \nobj_2 2.04 14.86']
+    assert payload['paste'] == 'obj_id ra dec \nobj_0 2.02 14.84 \n obj_1 2.03 14.85 \n obj_2 2.04 14.86'
+    # a list of payloads, even for a single batch
+    assert len(sdss.SDSS.query_crossid(coordinates[:1], get_query_payload=True)) == 1
+    assert isinstance(response, MockResponse)
+    data = Table.read(data_path(DATA_FILES['images_id']),
+                      format='ascii.csv', comment='#')
+    # each of the batches gets the same mock result
+    assert len(xid) == 2 * len(data)
+
+
+def test_format_crossid_upload():
+    # same upload from coordinate arrays and lists of coordinates
+    coordinates = SkyCoord([2.02, 2.03] * u.deg, [14.84, 14.85] * u.deg)
+    upload = sdss.core._format_crossid_upload(coordinates, ['a', 'b'])
+    assert upload == sdss.core._format_crossid_upload(list(coordinates), ['a', 'b'])
+    assert upload == 'obj_id ra dec \na 2.02 14.84 \n b 2.03 14.85'
+
+
+def _genfromtxt(content):
+    skip_header = 1 if content.startswith(b'#Table') else 0
+    return np.atleast_1d(np.genfromtxt(io.BytesIO(content), names=True, dtype=None,
+                                       delimiter=',', skip_header=skip_header,
+                                       comments='#'))
+
+
+@pytest.mark.filterwarnings('ignore::numpy.VisibleDeprecationWarning')
+@pytest.mark.parametrize('content', [
+    b'#Table1\nra,dec,objid\n2.5,14.8,1237652943176138868\n',
+    b'#Table1\nrun,z\n1,0.5\n2,nan\n3,99999999999999999999\n',
+    b'a-b,return,flag,name\n1,2,True,x y\n3,4,false,zz\n',
+    # these are left to genfromtxt
+    b'a,b\n x ,1\ny,2\n',
+    b'a,b\n,1\n2,3\n',
+    b'a,b\n1,2\n\n3,4 # comment\n',
+    b'a,b\n1+2j,1\n'])
+def test_parse_csv(content):
+    expected = _genfromtxt(content)
+    arr = sdss.core._parse_csv(content)
+    assert arr.dtype == expected.dtype
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(arr[name], expected[name])
+
+
+@pytest.mark.filterwarnings('ignore::numpy.VisibleDeprecationWarning')
+@pytest.mark.parametrize('filename', ['xid_sp.txt', 'xid_im.txt'])
+def test_parse_csv_data(filename):
+    with open(data_path(filename), 'rb') as f:
+        content = f.read()
+    expected = _genfromtxt(content)
+    arr = sdss.core._parse_csv(content)
+    assert arr.dtype == expected.dtype
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(arr[name], expected[name])
+
+
 # ===========
 # Payload tests
 
@@ -28,6 +28,25 @@ class Conf(_config.ConfigNamespace):
         0,
         'Maximum number of rows that will be fetched from the result.')
 
+    chunk_size = _config.ConfigItem(
+        10000,
+        'Maximum number of targets sent in a single script by the vector '
+        'queries; longer lists of targets are split into several scripts.')
+
+    max_workers = _config.ConfigItem(
+        3,
+        'Maximum number of scripts of a split vector query sent concurrently.')
+
+    max_queries_per_second = _config.ConfigItem(
+        5.0,
+        'Maximum rate of the scripts of a split vector query. SIMBAD may '
+        'blacklist clients sending more than ~6 queries per second.')
+
+    max_retries = _config.ConfigItem(
+        3,
+        'Number of times a script of a split vector query is sent again '
+        'after SIMBAD rejected it for exceeding its rate limits.')
+
 
 conf = Conf()
 
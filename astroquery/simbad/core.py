@@ -8,13 +8,16 @@ import re
 import requests
 import json
 import os
+import threading
+import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import warnings
 import astropy.units as u
 from astropy.utils.data import get_pkg_data_filename
 import astropy.coordinates as coord
-from astropy.table import Table
+from astropy.table import Table, vstack
 import astropy.io.votable as votable
 
 from astroquery.query import BaseQuery
@@ -254,13 +257,43 @@ class SimbadBaseQuery(BaseQuery):
             errmsg = ("Error 403: Forbidden.  You may get this error if you "
                       "exceed the SIMBAD server's rate limits.  Try again in "
                       "a few seconds or minutes.")
-            raise requests.exceptions.HTTPError(errmsg)
+            raise requests.exceptions.HTTPError(errmsg, response=response)
         else:
             response.raise_for_status()
 
         return response
 
 
+class _RateLimiter:
+    """
+    Spaces out the requests sent by several threads, so that no more than
+    ``rate`` requests are sent per second.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1. / rate
+        self._next = 0.
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request can be sent."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def slow_down(self, pause):
+        """
+        Halve the rate and hold the next requests for ``pause`` seconds, after
+        the server rejected a request for exceeding its rate limits.
+        """
+        with self._lock:
+            self.interval *= 2
+            self._next = max(self._next, time.monotonic() + pause)
+
+
 @async_to_sync
 class SimbadClass(SimbadBaseQuery):
     """
@@ -582,7 +615,8 @@ class SimbadClass(SimbadBaseQuery):
         return response
 
     def query_objects(self, object_names, wildcard=False, verbose=False,
-                      get_query_payload=False):
+                      get_query_payload=False, chunk_size=None,
+                      max_workers=None):
         """
         Queries Simbad for the specified list of objects and returns the
         results as a `~astropy.table.Table`. Object names may be specified
@@ -598,13 +632,33 @@ class SimbadClass(SimbadBaseQuery):
         get_query_payload : bool, optional
             When set to `True` the method returns the HTTP request parameters.
             Defaults to `False`.
+        chunk_size : int, optional
+            Maximum number of objects queried in a single script.  Longer
+            lists are split into several scripts, see `_query_chunks`.
+            Defaults to ``conf.chunk_size``.
+        max_workers : int, optional
+            Maximum number of scripts sent concurrently.  Defaults to
+            ``conf.max_workers``.
 
         Returns
         -------
         table : `~astropy.table.Table`
             Query results table
         """
+        object_names = list(object_names)
+        chunk_size = chunk_size or conf.chunk_size
+        if not get_query_payload and len(object_names) > chunk_size:
+            def query_chunk(start, stop):
+                return self.query_objects_async(object_names[start:stop],
+                                                wildcard=wildcard)
+
+            return self._query_chunks(query_chunk, len(object_names),
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers,
+                                      verbose=verbose)
+
         return self.query_object('\n'.join(object_names), wildcard=wildcard,
+                                 verbose=verbose,
                                  get_query_payload=get_query_payload)
 
     def query_objects_async(self, object_names, wildcard=False, cache=True,
@@ -633,6 +687,72 @@ class SimbadClass(SimbadBaseQuery):
                                        wildcard=wildcard, cache=cache,
                                        get_query_payload=get_query_payload)
 
+    def query_region(self, coordinates, radius=2*u.arcmin, equinox=2000.0,
+                     epoch='J2000', cache=True, get_query_payload=False,
+                     chunk_size=None, max_workers=None, verbose=False):
+        """
+        Queries around the given coordinates and returns the results as a
+        `~astropy.table.Table`.
+
+        Parameters
+        ----------
+        coordinates : str or `astropy.coordinates` object
+            the identifier or coordinates around which to query.
+        radius : str or `~astropy.units.Quantity`, optional
+            the radius of the region. If missing, set to default
+            value of 2 arcmin.
+        equinox : float, optional
+            the equinox of the coordinates. If missing set to
+            default 2000.0.
+        epoch : str, optional
+            the epoch of the input coordinates. Must be specified as
+            [J|B] <epoch>. If missing, set to default J2000.
+        get_query_payload : bool, optional
+            When set to `True` the method returns the HTTP request parameters.
+            Defaults to `False`.
+        chunk_size : int, optional
+            Maximum number of coordinates queried in a single script.  Longer
+            vectors of coordinates are split into several scripts, see
+            `_query_chunks`.  Defaults to ``conf.chunk_size``.
+        max_workers : int, optional
+            Maximum number of scripts sent concurrently.  Defaults to
+            ``conf.max_workers``.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Query results table
+        """
+        chunk_size = chunk_size or conf.chunk_size
+        if (not get_query_payload and not isinstance(coordinates, str)
+                and _has_length(coordinates) and len(coordinates) > chunk_size):
+            if _has_length(radius) and len(radius) != len(coordinates):
+                raise ValueError("Mismatch between radii and coordinates")
+
+            def query_chunk(start, stop):
+                chunk_radius = radius
+                if _has_length(radius):
+                    chunk_radius = radius[start:stop]
+                return self.query_region_async(coordinates[start:stop],
+                                               radius=chunk_radius,
+                                               equinox=equinox, epoch=epoch,
+                                               cache=cache)
+
+            return self._query_chunks(query_chunk, len(coordinates),
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers,
+                                      verbose=verbose)
+
+        response = self.query_region_async(coordinates, radius=radius,
+                                           equinox=equinox, epoch=epoch,
+                                           cache=cache,
+                                           get_query_payload=get_query_payload)
+        if get_query_payload:
+            return response
+
+        return self._parse_result(response, SimbadVOTableResult,
+                                  verbose=verbose)
+
     def query_region_async(self, coordinates, radius=2*u.arcmin,
                            equinox=2000.0, epoch='J2000', cache=True,
                            get_query_payload=False):
@@ -684,7 +804,8 @@ class SimbadClass(SimbadBaseQuery):
                 warnings.warn("For very large queries, you may receive a "
                               "timeout error.  SIMBAD suggests splitting "
                               "queries with >10000 entries into multiple "
-                              "threads", LargeQueryWarning)
+                              "threads, which `query_region` does "
+                              "automatically", LargeQueryWarning)
 
             if len(set(frame)) > 1:
                 raise ValueError("Coordinates have different frames")
@@ -955,6 +1076,84 @@ class SimbadClass(SimbadBaseQuery):
 
         return response
 
+    def _query_chunks(self, query_chunk, n_targets, chunk_size=None,
+                      max_workers=None, verbose=False):
+        """
+        Run a vector query as several scripts of at most ``chunk_size``
+        targets, and merge their results.
+
+        The scripts are sent concurrently by ``max_workers`` threads, but no
+        more than ``conf.max_queries_per_second`` per second.  When SIMBAD
+        rejects a script for exceeding its rate limits (error 403), the rate
+        is halved and the script sent again, up to ``conf.max_retries``
+        times.
+
+        Parameters
+        ----------
+        query_chunk : callable
+            ``query_chunk(start, stop)`` sends the query of the targets
+            ``start`` to ``stop`` and returns the `requests.Response`.
+        n_targets : int
+            Total number of targets.
+        chunk_size : int, optional
+            Defaults to ``conf.chunk_size``.
+        max_workers : int, optional
+            Defaults to ``conf.max_workers``.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            The results of all the scripts, in input order.  The script line
+            numbers of the ``errors`` attribute and the ``SCRIPT_NUMBER_ID``
+            column, when returned by SIMBAD, refer to the position of the
+            targets in the whole input, as for a single script.
+        """
+        chunk_size = chunk_size or conf.chunk_size
+        max_workers = max_workers or conf.max_workers
+        limiter = _RateLimiter(conf.max_queries_per_second)
+        bounds = [(start, min(start + chunk_size, n_targets))
+                  for start in range(0, n_targets, chunk_size)]
+
+        def run(bound):
+            for attempt in range(conf.max_retries + 1):
+                limiter.wait()
+                try:
+                    return query_chunk(*bound)
+                except requests.exceptions.HTTPError as ex:
+                    if (attempt == conf.max_retries or ex.response is None
+                            or ex.response.status_code != 403):
+                        raise
+                    limiter.slow_down(10 * 2 ** attempt)
+
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, bound) for bound in bounds]
+            try:
+                responses = [future.result() for future in futures]
+            except Exception:
+                # e.g. blacklisted: do not send the remaining scripts
+                for future in futures:
+                    future.cancel()
+                raise
+
+        tables = []
+        errors = []
+        for (start, stop), response in zip(bounds, responses):
+            table = self._parse_result(response, SimbadVOTableResult,
+                                       verbose=verbose)
+            errors += [SimbadError(error.line + start, error.msg)
+                       for error in self.last_parsed_result.errors]
+            if table is None:
+                continue
+            if 'SCRIPT_NUMBER_ID' in table.colnames:
+                table['SCRIPT_NUMBER_ID'] += start
+            tables.append(table)
+        if not tables:
+            return None
+        result = vstack(tables, metadata_conflicts='silent')
+        result.errors = errors
+        return result
+
     def _get_query_header(self, get_raw=False):
         votable_fields = ','.join(self.get_votable_fields())
         # if get_raw is set then don't fetch as votable
@@ -1055,7 +1254,9 @@ class SimbadClass(SimbadBaseQuery):
         except Exception as ex:
             self.last_table_parse_error = ex
             try:
-                self._last_query.remove_cache_file(self.cache_location)
+                # a response failing to parse removes its own entry from the
+                # cache, not the one of the last query of the instance
+                self._remove_last_query_from_cache(result)
             except OSError:
                 # this is allowed: if `cache` was set to False, this
                 # won't be needed
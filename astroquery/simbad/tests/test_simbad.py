@@ -1,8 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import os
+import pickle
 import re
+import time
 
 import pytest
+import requests
 import astropy.units as u
 from astropy.table import Table
 import numpy as np
@@ -438,3 +441,139 @@ def test_regression_issue388():
     truth = b'M   1' if commons.ASTROPY_LT_4_1 else 'M   1'
     assert parsed_table['MAIN_ID'][0] == truth
     assert len(parsed_table) == 1
+
+
+CHUNK_VOTABLE = """<?xml version="1.0" encoding="UTF-8"?>
+<VOTABLE xmlns="http://www.ivoa.net/xml/VOTable/v1.2" version="1.2">
+<RESOURCE name="Simbad query" type="results">
+<TABLE ID="SimbadScript" name="default">
+<FIELD ID="MAIN_ID" name="MAIN_ID" datatype="char" arraysize="*"/>
+<FIELD ID="SCRIPT_NUMBER_ID" name="SCRIPT_NUMBER_ID" datatype="int"/>
+<DATA>
+<TABLEDATA>
+{rows}
+</TABLEDATA>
+</DATA>
+</TABLE>
+</RESOURCE>
+</VOTABLE>
+"""
+
+
+class ChunkServer:
+    """Answer the `query id` scripts with one row per known object"""
+
+    def __init__(self, rejected=0):
+        self.scripts = []
+        self.rejected = rejected
+
+    def request(self, method, url, data, timeout, **kwargs):
+        if self.rejected:
+            self.rejected -= 1
+            raise requests.exceptions.HTTPError(
+                "Error 403", response=MockResponse(status_code=403))
+        script = data['script']
+        self.scripts.append(script)
+        lines = script.split('\n')
+        first = [i for i, line in enumerate(lines)
+                 if line.startswith('query id')][0]
+        names = [line.replace('query id', '').strip()
+                 for line in lines[first:-1]]
+        rows, errors = [], []
+        for number, name in enumerate(names, 1):
+            if name.startswith('unknown'):
+                errors.append("[{}] '{}': No known catalog could be found"
+                              .format(first + number, name))
+            else:
+                rows.append("<TR><TD>{}</TD><TD>{}</TD></TR>".format(name, number))
+        content = "::script::\n\n{}\n\n".format(script)
+        if errors:
+            content += "::error::\n\n{}\n\n".format("\n".join(errors))
+        content += "::data::\n\n" + CHUNK_VOTABLE.format(rows="\n".join(rows))
+        return MockResponse(content.encode('utf-8'))
+
+
+def test_query_objects_chunks(monkeypatch):
+    server = ChunkServer(rejected=1)
+    monkeypatch.setattr(simbad.SimbadClass, '_request',
+                        lambda self, *args, **kwargs: server.request(*args, **kwargs))
+    monkeypatch.setattr(simbad.core.time, 'sleep', lambda delay: None)
+    names = ['obj{}'.format(i) for i in range(10)]
+    names[4] = 'unknown4'
+    sb = simbad.SimbadClass()
+    with pytest.warns(UserWarning, match='unknown4'):
+        result = sb.query_objects(names, chunk_size=3, max_workers=2)
+
+    # 4 scripts, the rejected one being sent again
+    assert len(server.scripts) == 4
+    assert list(result['MAIN_ID']) == [name for name in names
+                                       if name != 'unknown4']
+    # the numbering refers to the whole list of objects
+    assert list(result['SCRIPT_NUMBER_ID']) == [1, 2, 3, 4, 6, 7, 8, 9, 10]
+    assert [(error.line, error.msg) for error in result.errors] == \
+        [(8, "'unknown4': No known catalog could be found")]
+
+
+def test_query_objects_chunks_parse_error(monkeypatch, tmp_path):
+    server = ChunkServer()
+
+    def request(query, session, cache_location=None, **kwargs):
+        if 'obj0' in query.data['script']:
+            return MockResponse(b"::data::\n\n<VOTABLE>broken")
+        # the chunks parsed successfully are the last ones to be received
+        time.sleep(0.1)
+        return server.request(query.method, query.url, query.data, query.timeout)
+
+    monkeypatch.setattr(AstroQuery, 'request', request)
+    sb = simbad.SimbadClass()
+    sb.cache_location = str(tmp_path)
+    with pytest.raises(TableParseError):
+        sb.query_objects(['obj{}'.format(i) for i in range(9)],
+                         chunk_size=3, max_workers=3)
+    # only the cached response of the chunk failing to parse is removed
+    cached = []
+    for filename in os.listdir(tmp_path):
+        with open(os.path.join(tmp_path, filename), 'rb') as f:
+            cached.append(pickle.load(f).content)
+    assert len(cached) == 2
+    assert not [content for content in cached if b'broken' in content]
+    assert len(server.scripts) == 2
+
+
+def test_query_objects_chunks_rejected(monkeypatch):
+    server = ChunkServer(rejected=10)
+    monkeypatch.setattr(simbad.SimbadClass, '_request',
+                        lambda self, *args, **kwargs: server.request(*args, **kwargs))
+    monkeypatch.setattr(simbad.core.time, 'sleep', lambda delay: None)
+    with pytest.raises(requests.exceptions.HTTPError):
+        simbad.SimbadClass().query_objects(['obj1', 'obj2', 'obj3'],
+                                           chunk_size=2, max_workers=1)
+    assert not server.scripts
+
+
+def test_query_region_chunks(patch_post):
+    coordinates = commons.ICRSCoordGenerator(ra=[10, 11, 12], dec=[10, 11, 12],
+                                             unit=(u.deg, u.deg))
+    single = simbad.Simbad.query_region(coordinates[:1], radius=5 * u.deg)
+    result = simbad.Simbad.query_region(coordinates, radius=[5, 5, 5] * u.deg,
+                                        chunk_size=2)
+    # query_coo.data is returned for each of the two scripts
+    assert len(result) == 2 * len(single)
+    with pytest.raises(ValueError):
+        simbad.Simbad.query_region(coordinates, radius=[5, 5] * u.deg,
+                                   chunk_size=2)
+
+
+def test_rate_limiter(monkeypatch):
+    delays = []
+    now = [100.]
+    monkeypatch.setattr(simbad.core.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(simbad.core.time, 'sleep', delays.append)
+    limiter = simbad.core._RateLimiter(4)
+    for _ in range(3):
+        limiter.wait()
+    assert delays == [0.25, 0.5]
+    limiter.slow_down(10)
+    limiter.wait()
+    assert delays[-1] == 10
+    assert limiter.interval == 0.5
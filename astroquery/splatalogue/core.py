@@ -478,11 +478,13 @@ class SplatalogueClass(BaseQuery):
 
         return result
 
-    def get_fixed_table(self, columns=None):
+    def get_fixed_table(self, columns=None, table=None):
         """
         Convenience function to get the table with html column names made human
         readable.  It returns only the columns identified with the ``columns``
-        keyword.  See the source for the defaults.
+        keyword.  See the source for the defaults.  The table of the last
+        query is used unless another ``table`` returned by `query_lines` is
+        given, as needed when the instance is queried from several threads.
         """
         if columns is None:
             columns = ('Species', 'Chemical Name', 'Resolved QNs',
@@ -490,7 +492,9 @@ class SplatalogueClass(BaseQuery):
                        'Meas Freq-GHz(rest frame,redshifted)',
                        'Log<sub>10</sub> (A<sub>ij</sub>)',
                        'E_U (K)')
-        table = clean_column_headings(self.table[columns])
+        if table is None:
+            table = self.table
+        table = clean_column_headings(table[columns])
         return table
 
 
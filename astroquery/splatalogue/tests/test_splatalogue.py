@@ -39,6 +39,16 @@ def test_simple(patch_post):
                                         chemical_name=' CO ')
 
 
+def test_get_fixed_table(patch_post):
+    S = splatalogue.Splatalogue()
+    table = S.query_lines(114 * u.GHz, 116 * u.GHz, chemical_name=' CO ')
+    S.query_lines(114 * u.GHz, 116 * u.GHz, chemical_name=' CO ')
+    fixed = S.get_fixed_table(table=table)
+    assert 'FreqGHz' in fixed.colnames
+    assert len(fixed) == len(table)
+    assert S.get_fixed_table().colnames == fixed.colnames
+
+
 @pytest.mark.remote_data
 def test_init(patch_post):
     x = splatalogue.Splatalogue.query_lines(114 * u.GHz, 116 * u.GHz,
@@ -0,0 +1,86 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import threading
+import time
+
+import pytest
+import requests
+
+from ..query import AstroQuery, BaseQuery
+
+
+class BatchQuery(BaseQuery):
+
+    def __init__(self, cache_location):
+        super().__init__()
+        self.cache_location = cache_location
+        self.calls = 0
+        self.active = {}
+        self.max_active = {}
+        self._lock = threading.Lock()
+
+
+def _fake_request(qu, delay=0.01):
+    def request(method, url, **kwargs):
+        host = url.split('/')[2]
+        with qu._lock:
+            qu.calls += 1
+            qu.active[host] = qu.active.get(host, 0) + 1
+            qu.max_active[host] = max(qu.max_active.get(host, 0),
+                                      qu.active[host])
+        time.sleep(delay)
+        with qu._lock:
+            qu.active[host] -= 1
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response._content = url.encode('ascii')
+        return response
+    return request
+
+
+@pytest.fixture
+def batch_query(tmp_path, monkeypatch):
+    qu = BatchQuery(str(tmp_path))
+    monkeypatch.setattr(qu._session, 'request', _fake_request(qu))
+    return qu
+
+
+def test_request_many_order_and_cache(batch_query):
+    qu = batch_query
+    urls = ['http://host{0}.edu/{1}'.format(i % 3, i) for i in range(20)]
+    queries = [AstroQuery('GET', url) for url in urls]
+
+    responses = qu._request_many(queries, max_workers=6)
+    assert [r.content.decode('ascii') for r in responses] == urls
+    assert qu.calls == 20
+
+    # everything is now cached
+    responses = qu._request_many([AstroQuery('GET', url) for url in urls])
+    assert [r.content.decode('ascii') for r in responses] == urls
+    assert qu.calls == 20
+
+    qu._request_many(queries, cache=False)
+    assert qu.calls == 40
+
+
+def test_batch_per_host_limit(batch_query):
+    qu = batch_query
+    queries = [AstroQuery('GET', 'http://host.edu/{0}'.format(i))
+               for i in range(12)]
+    with qu.batch(max_workers=8, max_per_host=2) as batch:
+        futures = [batch.submit(query, cache=False) for query in queries]
+    assert all(future.done() for future in futures)
+    assert qu.max_active['host.edu'] <= 2
+
+
+def test_batch_sizes_connection_pool(batch_query):
+    qu = batch_query
+    with qu.batch(max_workers=32):
+        pass
+    assert qu._session.get_adapter('https://host.edu')._pool_maxsize == 32
+
+
+def test_batch_outside_context(batch_query):
+    batch = batch_query.batch()
+    with pytest.raises(RuntimeError):
+        batch.submit(AstroQuery('GET', 'http://host.edu'))
@@ -0,0 +1,125 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pickle
+import time
+
+import pytest
+import requests
+
+from ..query import (AstroQuery, BaseQuery, CacheStore, PickleCacheStore,
+                     SQLiteCacheStore)
+
+URL = 'http://fakeurl.edu'
+
+
+def _make_response(url, content=b'data'):
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.reason = 'OK'
+    response.encoding = 'utf-8'
+    response.headers['Content-Type'] = 'text/plain'
+    response._content = content
+    return response
+
+
+class CountingQuery(BaseQuery):
+
+    def __init__(self, cache_location):
+        super().__init__()
+        self.cache_location = cache_location
+        self.calls = 0
+
+    def query(self, url, **kwargs):
+        return self._request('GET', url, **kwargs)
+
+
+@pytest.fixture
+def counting_query(tmp_path, monkeypatch):
+    qu = CountingQuery(str(tmp_path))
+
+    def fake_request(method, url, **kwargs):
+        qu.calls += 1
+        return _make_response(url, content=url.encode('ascii'))
+
+    monkeypatch.setattr(qu._session, 'request', fake_request)
+    return qu
+
+
+def test_incomplete_store():
+    class GetOnlyStore(CacheStore):
+
+        def get(self, query):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyStore()
+
+
+def test_default_pickle_store(counting_query):
+    qu = counting_query
+    assert isinstance(qu._get_cache_store(), PickleCacheStore)
+
+    first = qu.query(URL)
+    second = qu.query(URL)
+    assert qu.calls == 1
+    assert first.content == second.content == URL.encode('ascii')
+
+    qu._remove_last_query_from_cache()
+    qu.query(URL)
+    assert qu.calls == 2
+
+
+def test_sqlite_store_roundtrip(counting_query, tmp_path):
+    qu = counting_query
+    qu.cache_store = SQLiteCacheStore(str(tmp_path))
+
+    first = qu.query(URL)
+    second = qu.query(URL)
+    assert qu.calls == 1
+    assert second.content == first.content
+    assert second.status_code == 200
+    assert second.headers['content-type'] == 'text/plain'
+    assert second.text == URL
+    assert len(qu.cache_store) == 1
+
+    qu._remove_last_query_from_cache()
+    assert len(qu.cache_store) == 0
+    with pytest.raises(OSError):
+        qu._remove_last_query_from_cache()
+
+    qu.query(URL, cache=False)
+    assert qu.calls == 2
+    assert len(qu.cache_store) == 0
+
+
+def test_sqlite_store_ttl(tmp_path, monkeypatch):
+    store = SQLiteCacheStore(str(tmp_path), ttl=10)
+    query = AstroQuery('GET', URL)
+    store.set(query, _make_response(URL))
+    assert store.get(query) is not None
+
+    # the store can be pickled along with the query instances
+    assert pickle.loads(pickle.dumps(store)).ttl == 10
+
+    real_time = time.time()
+    monkeypatch.setattr(time, 'time', lambda: real_time + 11)
+    assert store.get(query) is None
+    assert len(store) == 0
+
+
+def test_sqlite_store_lru_eviction(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path), max_size=25)
+    queries = [AstroQuery('GET', URL, params={'n': n}) for n in range(3)]
+
+    store.set(queries[0], _make_response(URL, b'x' * 10))
+    store.set(queries[1], _make_response(URL, b'x' * 10))
+    # touch the first entry so that the second is the least recently used
+    assert store.get(queries[0]) is not None
+    store.set(queries[2], _make_response(URL, b'x' * 10))
+
+    assert store.get(queries[0]) is not None
+    assert store.get(queries[1]) is None
+    assert store.get(queries[2]) is not None
+
+    store.clear()
+    assert len(store) == 0
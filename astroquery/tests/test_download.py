@@ -0,0 +1,183 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import base64
+import gzip
+import hashlib
+import io
+import os
+import threading
+
+import pytest
+import requests
+import urllib3
+
+from ..exceptions import DownloadError
+from ..query import BaseQuery
+
+DATA = {'http://fakeurl.edu/small': b'small file content',
+        'http://fakeurl.edu/large': bytes(range(256)) * 40,
+        'http://fakeurl.edu/noranges': b'x' * 3000,
+        'http://fakeurl.edu/gzipped': b'gzipped content ' * 200}
+
+
+class FakeServer:
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, **kwargs):
+        with self._lock:
+            self.requests.append((method, url, dict(headers or {})))
+        data = DATA[url]
+        if 'gzipped' in url:
+            # the length and the checksum are those of the encoded body
+            data = gzip.compress(data)
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.headers['Content-Length'] = str(len(data))
+        response.headers['Content-MD5'] = base64.b64encode(
+            hashlib.md5(data).digest()).decode('ascii')
+        if 'noranges' not in url:
+            response.headers['Accept-Ranges'] = 'bytes'
+        if headers and 'Range' in headers:
+            start, end = headers['Range'].split('=')[1].split('-')
+            end = int(end) if end else len(data) - 1
+            data = data[int(start):end + 1]
+            response.status_code = 206
+            response.headers['Content-Length'] = str(len(data))
+        body = io.BytesIO(b'' if method == 'HEAD' else data)
+        if 'gzipped' in url:
+            response.headers['Content-Encoding'] = 'gzip'
+        if 'gzipped' in url and method != 'HEAD':
+            body = urllib3.HTTPResponse(body=body, headers=response.headers,
+                                        preload_content=False)
+        response.raw = body
+        return response
+
+
+@pytest.fixture
+def server_query(tmp_path, monkeypatch):
+    qu = BaseQuery()
+    qu.cache_location = str(tmp_path)
+    server = FakeServer()
+    monkeypatch.setattr(qu._session, 'request', server.request)
+    return qu, server
+
+
+def test_download_files(server_query, tmp_path):
+    qu, server = server_query
+    downloads = [(url, str(tmp_path / url.split('/')[-1])) for url in DATA]
+
+    result = qu._download_files(downloads, max_workers=4, segment_size=1000)
+    assert result == [local_path for _, local_path in downloads]
+    for url, local_path in downloads:
+        with open(local_path, 'rb') as f:
+            assert f.read() == DATA[url]
+
+    # the large file supporting ranges is downloaded in segments
+    ranges = [headers['Range'] for method, url, headers in server.requests
+              if url.endswith('large') and method == 'GET']
+    assert len(ranges) == 11
+    assert 'bytes=0-999' in ranges
+    assert 'bytes=10000-10239' in ranges
+    assert not [headers for method, url, headers in server.requests
+                if url.endswith('noranges') and 'Range' in headers]
+    # the encoded file is downloaded at once, and checked against neither
+    # the length nor the checksum of its encoded body
+    assert not [headers for method, url, headers in server.requests
+                if url.endswith('gzipped') and 'Range' in headers]
+    # no header leaks into the shared session
+    assert 'Range' not in qu._session.headers
+    # nor the probes into the last query of the instance
+    assert not hasattr(qu, '_last_query')
+
+
+def test_download_files_checksum(server_query, tmp_path):
+    qu, server = server_query
+    local_path = str(tmp_path / 'small')
+    url = 'http://fakeurl.edu/small'
+
+    with pytest.raises(DownloadError):
+        qu._download_files([(url, local_path)],
+                           checksums={local_path: 'sha256:0123'})
+
+    result = qu._download_files([(url, local_path)], return_exceptions=True,
+                                checksums={local_path: 'sha256:0123'})
+    assert isinstance(result[0], DownloadError)
+
+    sha256 = hashlib.sha256(DATA[url]).hexdigest()
+    assert qu._download_files([(url, local_path)],
+                              checksums={local_path: 'sha256:' + sha256}) == [local_path]
+
+
+def test_download_files_encoded_get(server_query, tmp_path, monkeypatch):
+    qu, server = server_query
+    url = 'http://fakeurl.edu/gzipped'
+    local_path = str(tmp_path / 'gzipped')
+
+    def request(method, url, **kwargs):
+        response = server.request(method, url, **kwargs)
+        if method == 'HEAD':
+            # only the GET response is encoded
+            del response.headers['Content-Encoding']
+        return response
+
+    monkeypatch.setattr(qu._session, 'request', request)
+    assert qu._download_files([(url, local_path)], segment_size=100000) == [local_path]
+    with open(local_path, 'rb') as f:
+        assert f.read() == DATA[url]
+
+
+def test_download_files_segments_resume(server_query, tmp_path, monkeypatch):
+    qu, server = server_query
+    url = 'http://fakeurl.edu/large'
+    local_path = str(tmp_path / 'large')
+    request = server.request
+
+    def failing_request(method, url, headers=None, **kwargs):
+        if headers and headers.get('Range') == 'bytes=5000-5999':
+            raise requests.exceptions.ConnectionError('connection lost')
+        return request(method, url, headers=headers, **kwargs)
+
+    monkeypatch.setattr(qu._session, 'request', failing_request)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        qu._download_files([(url, local_path)], max_workers=2, segment_size=1000)
+    # the incomplete file is not mistaken for a complete one
+    assert not os.path.exists(local_path)
+    assert os.path.exists(local_path + '.part')
+
+    monkeypatch.setattr(qu._session, 'request', request)
+    del server.requests[:]
+    assert qu._download_files([(url, local_path)], segment_size=1000) == [local_path]
+    with open(local_path, 'rb') as f:
+        assert f.read() == DATA[url]
+    # only the missing segment is downloaded again
+    assert [headers['Range'] for method, _, headers in server.requests
+            if method == 'GET'] == ['bytes=5000-5999']
+    assert os.listdir(tmp_path) == ['large']
+
+
+def test_download_files_segments_corrupted(server_query, tmp_path):
+    qu, server = server_query
+    url = 'http://fakeurl.edu/large'
+    local_path = str(tmp_path / 'large')
+
+    with pytest.raises(DownloadError):
+        qu._download_files([(url, local_path)], segment_size=1000,
+                           checksums={local_path: 'md5:0123'})
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_file_resume(server_query, tmp_path):
+    qu, server = server_query
+    url = 'http://fakeurl.edu/large'
+    local_path = str(tmp_path / 'large')
+    with open(local_path, 'wb') as f:
+        f.write(DATA[url][:1000])
+
+    qu._download_file(url, local_path, continuation=True)
+    with open(local_path, 'rb') as f:
+        assert f.read() == DATA[url]
+    assert server.requests[-1][2]['Range'] == 'bytes=1000-10239'
+    assert 'Range' not in qu._session.headers
@@ -0,0 +1,223 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Extraction of the members of tar and zip archives, such as the data products
+of the archives, while they are read.
+"""
+import io
+import itertools
+import os
+import re
+import tarfile
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from astropy.utils.data import conf as data_conf
+
+__all__ = ['iter_extract', 'extract']
+
+
+_ZIP_MAGIC = (b'PK\x03\x04', b'PK\x05\x06')
+
+# the members which would be written outside of the destination directory
+# are refused, where the Python version supports it
+_TAR_FILTER = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+
+class _BlockStream(io.RawIOBase):
+    """
+    Readable stream of an iterable of blocks of bytes.
+    """
+
+    def __init__(self, blocks):
+        self._blocks = blocks
+        self._block = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not len(self._block):
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._block = memoryview(block)
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+
+def _iter_blocks(source):
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(data_conf.download_block_size), b'')
+    return iter(source)
+
+
+def _save_blocks(blocks, save_file):
+    for block in blocks:
+        save_file.write(block)
+        yield block
+
+
+def _selector(select):
+    if select is None:
+        return lambda name: True
+    if callable(select):
+        return select
+    return re.compile(select).match
+
+
+def _iter_extract_tar(blocks, path, select):
+    with tarfile.open(fileobj=io.BufferedReader(_BlockStream(blocks)), mode='r|*') as tar:
+        # the members are read in turn, those not selected are skipped
+        # without being written
+        for member in tar:
+            if member.isfile() and select(member.name):
+                tar.extract(member, path, **_TAR_FILTER)
+                yield member.name, os.path.join(path, member.name)
+
+
+def _iter_extract_zip(archive, path, select, max_workers, ordered):
+    with zipfile.ZipFile(archive) as zip_ref:
+        names = [info.filename for info in zip_ref.infolist()
+                 if not info.is_dir() and select(info.filename)]
+    if not names:
+        return
+
+    # the members are decompressed concurrently, each thread reading the
+    # archive with its own handle
+    local = threading.local()
+    handles = []
+    lock = threading.Lock()
+
+    def extract_member(name):
+        zip_ref = getattr(local, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(archive)
+            with lock:
+                handles.append(zip_ref)
+        zip_ref.extract(name, path)
+        return name, os.path.join(path, name)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = []
+    try:
+        futures = [executor.submit(extract_member, name) for name in names]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for zip_ref in handles:
+            zip_ref.close()
+
+
+def _iter_extract(source, path, select, max_workers, save_to, ordered):
+    select = _selector(select)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as archive:
+            # zipfile.is_zipfile looks for the index at the end of the file,
+            # which is also found in tar archives ending with a zip archive
+            if archive.read(4) not in _ZIP_MAGIC:
+                archive.seek(0)
+                yield from _iter_extract_tar(_iter_blocks(archive), path, select)
+                return
+        yield from _iter_extract_zip(source, path, select, max_workers, ordered)
+        return
+
+    blocks = _iter_blocks(source)
+    head = b''
+    for block in blocks:
+        head += block
+        if len(head) >= 4:
+            break
+    blocks = itertools.chain([head], blocks)
+
+    if head[:4] in _ZIP_MAGIC:
+        temporary = not save_to
+        if temporary:
+            fd, save_to = tempfile.mkstemp(suffix='.zip')
+            save_file = os.fdopen(fd, 'wb')
+        else:
+            save_file = open(save_to, 'wb')
+        try:
+            with save_file:
+                for block in blocks:
+                    save_file.write(block)
+            yield from _iter_extract_zip(save_to, path, select, max_workers, ordered)
+        finally:
+            if temporary:
+                os.remove(save_to)
+    elif save_to:
+        with open(save_to, 'wb') as save_file:
+            blocks = _save_blocks(blocks, save_file)
+            yield from _iter_extract_tar(blocks, path, select)
+            # the end of the stream, after the end of the archive, is saved
+            # as well
+            for block in blocks:
+                pass
+    else:
+        yield from _iter_extract_tar(blocks, path, select)
+
+
+def iter_extract(source, path, select=None, max_workers=None, save_to=None, ordered=False):
+    """
+    Extract the files of a tar or zip archive, and yield them as they are
+    written.
+
+    The tar archives, compressed or not, are read in a single pass, so that
+    their members are extracted while the archive is downloaded. The zip
+    archives are indexed at their end: they are read entirely before their
+    members are decompressed concurrently.
+
+    Parameters
+    ----------
+    source : str, file-like or iterable of bytes
+        The path of the archive, a readable binary file (e.g. the ``raw``
+        stream of an HTTP response), or the blocks of its content (e.g.
+        ``response.iter_content(block_size)``).
+    path : str
+        The directory where the files are extracted, keeping their
+        subdirectories in the archive.
+    select : str, regular expression or callable, optional
+        The regular expression matching the beginning of the names of the
+        members to extract, or a function of their name returning whether
+        they are extracted. By default all the files are extracted.
+    max_workers : int, optional
+        Maximum number of members of a zip archive decompressed at the same
+        time. Defaults to the default of
+        `~concurrent.futures.ThreadPoolExecutor`.
+    save_to : str, optional
+        Path where the archive read from a file object or from blocks is
+        saved, as it is read.
+    ordered : bool, optional
+        Whether the members of zip archives are yielded in their order in the
+        archive rather than as soon as they are decompressed.
+
+    Yields
+    ------
+    name, local_path : str
+        The name of the extracted members in the archive and their path. The
+        members of tar archives are yielded in their order in the archive,
+        those of zip archives as soon as they are decompressed unless
+        ``ordered`` is set.
+    """
+    return _iter_extract(source, path, select, max_workers, save_to, ordered)
+
+
+def extract(source, path, select=None, max_workers=None, save_to=None):
+    """
+    Extract the files of a tar or zip archive.
+
+    See `iter_extract` for the description of the parameters.
+
+    Returns
+    -------
+    local_paths : list of str
+        The paths of the extracted files, in their order in the archive.
+    """
+    return [local_path for _, local_path in
+            _iter_extract(source, path, select, max_workers, save_to, ordered=True)]
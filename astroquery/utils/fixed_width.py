@@ -0,0 +1,219 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Vectorized reader of fixed-width tables, such as the line catalogs of
+JPLSpec, CDMS and HITRAN.
+"""
+import re
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+from astropy.table import Table
+from astropy.utils.exceptions import AstropyWarning
+
+__all__ = ['read_fixed_width']
+
+
+# characters stripped by str.strip that bytes.strip keeps, or that end a
+# line for str.splitlines but not for bytes.splitlines
+_NOT_BYTES_SAFE = re.compile(rb'[\x0b\x0c\x1c-\x1f\x80-\xff]')
+
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[[0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x20]] = True
+
+# Fortran exponents written with D, or without their letter, e.g. 1.5-10
+_FORTRAN_SIGNED_EXPONENT = re.compile(r'(?<=[0-9.])[dD]?([+-][0-9]+)$')
+_FORTRAN_D_EXPONENT = re.compile(r'(?<=[0-9.])[dD]([0-9]+)$')
+
+
+def _split_records(content):
+    """
+    Split the ``content`` into an array of lines, without the blank lines.
+
+    ASCII content is kept as bytes, one byte per character, and is read
+    directly from the buffer when all its records have the same length.
+    """
+    if isinstance(content, str):
+        try:
+            content = content.encode('ascii')
+        except UnicodeEncodeError:
+            lines = [line for line in content.splitlines() if line.strip()]
+            return np.array(lines) if lines else np.zeros(0, dtype='U1')
+    if _NOT_BYTES_SAFE.search(content):
+        return _split_records(content.decode('latin-1'))
+
+    first_end = content.find(b'\n')
+    if first_end > 0:
+        separator = b'\r\n' if content[first_end - 1:first_end] == b'\r' else b'\n'
+        width = first_end + 1 - len(separator)
+        record = width + len(separator)
+        buffer = content if content.endswith(separator) else content + separator
+        if len(buffer) % record == 0:
+            records = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, record)
+            # all the separators are at the end of the records, and there
+            # is none within them
+            if ((records[:, width:] == np.frombuffer(separator, dtype=np.uint8)).all()
+                    and not (records[:, :width] == 0x0a).any()
+                    and not (records[:, :width] == 0x0d).any()):
+                records = records[:, :width]
+                records = records[~_WHITESPACE[records].all(axis=1)]
+                return np.ascontiguousarray(records).view('S{0}'.format(width)).ravel()
+
+    lines = [line for line in content.splitlines() if line.strip()]
+    return np.array(lines) if lines else np.zeros(0, dtype='S1')
+
+
+def _slice_column(lines, start, end):
+    """
+    Zero-copy view of the characters ``start:end`` of all the ``lines``.
+    """
+    char_size = 4 if lines.dtype.kind == 'U' else 1
+    width = lines.dtype.itemsize // char_size
+    end = width if end is None else min(end, width)
+    if end <= start:
+        return np.zeros(len(lines), dtype=lines.dtype.kind + '1')
+    return np.ndarray(len(lines), dtype='{0}{1}'.format(lines.dtype.kind, end - start),
+                      buffer=lines, offset=start * char_size,
+                      strides=lines.strides)
+
+
+def _as_str(values):
+    """
+    Convert ``values`` to a unicode array as wide as its longest value, as
+    ``np.array(list_of_str)`` does.
+    """
+    width = max(1, int(np.char.str_len(values).max())) if len(values) else 1
+    return values.astype('U{0}'.format(width))
+
+
+def _guess_column(name, values):
+    """
+    Convert the stripped ``values`` the way `astropy.io.ascii` does: empty
+    values are masked, and the column is read as int, float or str, in this
+    order.
+    """
+    values = np.char.strip(values)
+    mask = values == values.dtype.type()
+    if mask.any():
+        values = np.where(mask, values.dtype.type('0'), values)
+
+    data = None
+    for dtype in (np.int_, np.float64):
+        try:
+            data = values.astype(dtype)
+            break
+        except OverflowError:
+            warnings.warn("OverflowError converting to {0} in column {1}, "
+                          "reverting to String.".format(
+                              'IntType' if dtype is np.int_ else 'FloatType', name),
+                          AstropyWarning)
+            break
+        except ValueError:
+            pass
+    if data is None:
+        data = _as_str(values)
+
+    if mask.any():
+        return np.ma.MaskedArray(data, mask=mask)
+    return data
+
+
+def _fortran_number(value):
+    value = value.strip()
+    value = _FORTRAN_SIGNED_EXPONENT.sub(r'E\1', value)
+    return _FORTRAN_D_EXPONENT.sub(r'E\1', value)
+
+
+def _typed_column(values, dtype):
+    """
+    Convert ``values`` to ``dtype``. The strings are kept as they are, and
+    the numbers may use Fortran exponents (``1.5D-10`` or ``1.5-10``);
+    blank numbers are masked.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'SU':
+        return values.astype(dtype)
+
+    values = np.char.strip(values)
+    mask = values == values.dtype.type()
+    if mask.any():
+        values = np.where(mask, values.dtype.type('0'), values)
+    parse_type = np.float64 if dtype.kind in 'fc' else np.int64
+    try:
+        data = values.astype(parse_type)
+    except ValueError:
+        if dtype.kind != 'f':
+            raise
+        data = np.array([_fortran_number(value) for value in _as_str(values).tolist()],
+                        dtype=parse_type)
+    data = data.astype(dtype)
+
+    if mask.any():
+        return np.ma.MaskedArray(data, mask=mask)
+    return data
+
+
+def read_fixed_width(content, names, col_starts, col_ends=None, dtypes=None,
+                     comment=None):
+    """
+    Read a fixed-width table into a `~astropy.table.Table`.
+
+    The lines are stored in a single array, and each column is converted at
+    once from a view of its characters. Without ``dtypes``, the result is
+    the same as
+    ``ascii.read(content, format='fixed_width', header_start=None,
+    data_start=0, names=names, col_starts=col_starts, comment=comment)``.
+
+    Parameters
+    ----------
+    content : str or bytes
+        The table.
+    names : list of str
+        The column names.
+    col_starts : list of int
+        The first character of each column.
+    col_ends : list of int, optional
+        The character after the end of each column, ``None`` for the end of
+        the line. Defaults to the start of the next column.
+    dtypes : list, optional
+        The type of each column, ``None`` to guess it like
+        `astropy.io.ascii` does. The columns with a numeric type are parsed
+        as Fortran numbers, and their blank values are masked. The columns
+        with a string type are kept unstripped.
+    comment : str, optional
+        Regular expression matching the comment lines, which are skipped and
+        stored in the ``comments`` of the table meta.
+
+    Returns
+    -------
+    table : `~astropy.table.Table`
+    """
+    if col_ends is None:
+        col_ends = list(col_starts[1:]) + [None]
+    if dtypes is None:
+        dtypes = [None] * len(names)
+
+    meta = OrderedDict()
+    if comment:
+        if isinstance(content, bytes):
+            content = content.decode('latin-1')
+        lines = content.splitlines()
+        re_comment = re.compile(comment)
+        comments = [re.sub('^' + comment, '', line).strip()
+                    for line in lines if re_comment.match(line)]
+        if comments:
+            meta['comments'] = comments
+        content = '\n'.join(line for line in lines
+                            if line.strip() and not re_comment.match(line))
+
+    lines = _split_records(content)
+
+    columns = []
+    for name, start, end, dtype in zip(names, col_starts, col_ends, dtypes):
+        values = _slice_column(lines, start, end)
+        if dtype is None:
+            columns.append(_guess_column(name, values))
+        else:
+            columns.append(_typed_column(values, dtype))
+
+    return Table(columns, names=names, meta=meta)
@@ -2,15 +2,59 @@
 """
 Process all "async" methods into direct methods.
 """
+import asyncio
 import textwrap
 import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .class_or_instance import class_or_instance
 from .docstr_chompers import remove_sections
+from ..instrumentation import Instrumentation
+
+
+def _parse_result(self, response, verbose=False):
+    """
+    Parse ``response`` with ``self._parse_result``, measuring the parsing
+    when ``self`` is an instrumented instance.
+    """
+    instrumentation = getattr(self, 'instrumentation', None)
+    if not isinstance(instrumentation, Instrumentation):
+        return self._parse_result(response, verbose=verbose)
+    with instrumentation.measure('parse', url=getattr(response, 'url', None)):
+        return self._parse_result(response, verbose=verbose)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _coroutine_executor(query):
+    """
+    Return the executor running the requests and the parsing of the
+    coroutines, with ``astroquery.query.conf.max_workers`` threads, and make
+    sure the connection pool of ``query`` can keep as many connections open.
+    """
+    global _executor
+    from ..query import conf
+
+    max_workers = conf.max_workers
+    with _executor_lock:
+        if _executor is None or _executor[0] != max_workers:
+            if _executor is not None:
+                # the running requests complete in the former threads
+                _executor[1].shutdown(wait=False)
+            _executor = (max_workers, ThreadPoolExecutor(max_workers=max_workers))
+        executor = _executor[1]
+    if (not isinstance(query, type) and hasattr(query, '_session')
+            and hasattr(query, '_size_connection_pool')):
+        query._size_connection_pool(max_workers)
+    return executor
 
 
 def async_to_sync(cls):
     """
-    Convert all query_x_async methods to query_x methods
+    Convert all query_x_async methods to query_x methods, and to aquery_x
+    coroutines that can be awaited in an asyncio event loop
 
     (see
     http://stackoverflow.com/questions/18048341/add-methods-to-a-class-generated-from-other-methods
@@ -26,17 +70,50 @@ def async_to_sync(cls):
             response = getattr(self, async_method_name)(*args, **kwargs)
             if kwargs.get('get_query_payload') or kwargs.get('field_help'):
                 return response
-            result = self._parse_result(response, verbose=verbose)
+            result = _parse_result(self, response, verbose=verbose)
+            # the table of the last query, kept for the methods reading it
+            # such as Splatalogue.get_fixed_table. It is not used to return
+            # the result, each call returning the table it parsed.
             self.table = result
             return result
 
         return newmethod
 
+    def create_coroutine(async_method_name, sync_method_name=None):
+
+        @class_or_instance
+        async def newcoroutine(self, *args, **kwargs):
+            # The blocking requests and the parsing run in the executor
+            # shared by the coroutines, so that many queries can be awaited
+            # together without blocking the event loop.
+            loop = asyncio.get_running_loop()
+            executor = _coroutine_executor(self)
+            if sync_method_name is not None:
+                # the class implements its own synchronous method
+                return await loop.run_in_executor(
+                    executor, functools.partial(getattr(self, sync_method_name),
+                                                *args, **kwargs))
+
+            verbose = kwargs.pop('verbose', False)
+            response = await loop.run_in_executor(
+                executor, functools.partial(getattr(self, async_method_name),
+                                            *args, **kwargs))
+            if kwargs.get('get_query_payload') or kwargs.get('field_help'):
+                return response
+            return await loop.run_in_executor(
+                executor, functools.partial(_parse_result, self, response,
+                                            verbose=verbose))
+
+        return newcoroutine
+
     methods = list(cls.__dict__.keys())
 
     for k in list(methods):
         newmethodname = k.replace("_async", "")
-        if 'async' in k and newmethodname not in methods:
+        if 'async' not in k:
+            continue
+
+        if newmethodname not in methods:
 
             newmethod = create_method(k)
 
@@ -50,21 +127,41 @@ def async_to_sync(cls):
 
             setattr(cls, newmethodname, newmethod)
 
+            newcoroutine = create_coroutine(k)
+            coroutinedoc = async_to_sync_docstr(getattr(cls, k).__doc__,
+                                                coroutine=True)
+        else:
+            newcoroutine = create_coroutine(k, newmethodname)
+            coroutinedoc = coroutine_docstr(getattr(cls, newmethodname).__doc__)
+
+        coroutinename = 'a' + newmethodname
+        if not newmethodname.startswith('_') and coroutinename not in methods:
+            newcoroutine.fn.__doc__ = coroutinedoc
+            newcoroutine.fn.__name__ = coroutinename
+            newcoroutine.__name__ = coroutinename
+            functools.update_wrapper(newcoroutine, newcoroutine.fn)
+            setattr(cls, coroutinename, newcoroutine)
+
     return cls
 
 
-def async_to_sync_docstr(doc, returntype='table'):
+def async_to_sync_docstr(doc, returntype='table', coroutine=False):
     """
     Strip of the "Returns" component of a docstr and replace it with "Returns a
-    table" code
+    table" code.  If ``coroutine``, the docstring describes the coroutine
+    variant of the method.
     """
 
     object_dict = {'table': '~astropy.table.Table',
                    'fits': '~astropy.io.fits.PrimaryHDU',
                    'dict': 'dict'}
 
-    firstline = ("Queries the service and returns a {rt} object.\n"
-                 .format(rt=returntype))
+    if coroutine:
+        firstline = ("Coroutine querying the service and returning a {rt} "
+                     "object.\n".format(rt=returntype))
+    else:
+        firstline = ("Queries the service and returns a {rt} object.\n"
+                     .format(rt=returntype))
 
     vowels = 'aeiou'
     vowels += vowels.upper()
@@ -86,3 +183,13 @@ def async_to_sync_docstr(doc, returntype='table'):
         ['', firstline] + outlines + [textwrap.dedent(returnstr)])
 
     return newdoc
+
+
+def coroutine_docstr(doc):
+    """
+    Prepend the docstr of a synchronous method with a line describing its
+    coroutine variant
+    """
+    doc = textwrap.dedent((doc or '').lstrip('\n'))
+    return "\n".join(['', "Coroutine variant of the synchronous method.", '',
+                      doc])
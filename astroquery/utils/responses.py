@@ -0,0 +1,101 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Reading of the bodies of HTTP responses, such as the VOTables returned by
+the services, without decoding them to text.
+"""
+import io
+
+import astropy.io.votable as votable
+
+__all__ = ['ResponseReader']
+
+
+# size of the beginning and of the end of the bodies searched for the error
+# messages of the services
+SNIFF_SIZE = 16384
+
+
+class ResponseReader:
+    """
+    Reader of the body of an HTTP response, never decoded to text.
+
+    The body is read from the content of the response without copy, and
+    only its beginning and its end are searched for the error messages of
+    the services.
+
+    Parameters
+    ----------
+    response : `requests.Response`
+        The HTTP response.
+    sniff_size : int, optional
+        Size of the beginning and of the end of the body searched by `find`.
+
+    Attributes
+    ----------
+    head : bytes
+        The beginning of the body, of at most ``sniff_size`` bytes.
+    content : bytes
+        The whole body.
+    """
+
+    def __init__(self, response, sniff_size=SNIFF_SIZE):
+        self.response = response
+        self.content = response.content
+        self.head = self.content[:sniff_size]
+        if len(self.content) <= 2 * sniff_size:
+            self._sniffed = (self.content,)
+        else:
+            self._sniffed = (self.head, self.content[-sniff_size:])
+
+    @property
+    def is_empty(self):
+        return not self.content
+
+    def find(self, *markers):
+        """
+        Look for the error messages of a service in the body.
+
+        Only the beginning and the end of the body are searched.
+
+        Parameters
+        ----------
+        *markers : str or bytes
+            The messages to look for, str being encoded in UTF-8.
+
+        Returns
+        -------
+        marker : str, bytes or None
+            The first of the ``markers`` found, `None` if none was found.
+        """
+        for marker in markers:
+            encoded = marker.encode('utf-8') if isinstance(marker, str) else marker
+            if any(encoded in sniffed for sniffed in self._sniffed):
+                return marker
+        return None
+
+    def open(self):
+        """
+        Return a binary file object reading the body from its beginning.
+        """
+        # the BytesIO shares the buffer of the bytes as long as it is not
+        # written to
+        return io.BytesIO(self.content)
+
+    def parse_votable(self, **kwargs):
+        """
+        Parse the body as a VOTable.
+
+        All the serializations of the VOTable data, including ``BINARY2``,
+        are read directly from the body.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed to `astropy.io.votable.parse`.
+
+        Returns
+        -------
+        votable : `~astropy.io.votable.tree.VOTableFile`
+        """
+        with self.open() as body:
+            return votable.parse(body, **kwargs)
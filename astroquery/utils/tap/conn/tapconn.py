@@ -22,12 +22,14 @@ except ImportError:
     # python 2
     import httplib
 import mimetypes
+import threading
 import time
 
 from urllib.parse import urlencode
 
 from astroquery.utils.tap.xmlparser import utils
 from astroquery.utils.tap import taputils
+from astroquery.instrumentation import Instrumentation, record_connect, take_connect
 
 import requests
 
@@ -35,6 +37,17 @@ __all__ = ['TapConn']
 
 CONTENT_TYPE_POST_DEFAULT = "application/x-www-form-urlencoded"
 
+# Maximum number of idle keep-alive connections kept by ConnectionHandler
+DEFAULT_POOL_SIZE = 10
+
+# Errors raised when a kept-alive connection has been closed by the server
+STALE_CONNECTION_ERRORS = (httplib.RemoteDisconnected, httplib.BadStatusLine,
+                           ConnectionResetError, BrokenPipeError)
+
+# Methods whose requests can be sent again when their response could not be
+# read, as they have no side effect on the server
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
 
 class TapConn:
     """TAP plus connection class
@@ -104,6 +117,8 @@ class TapConn:
                                                          self.__connPortSsl)
         else:
             self.__connectionHandler = connhandler
+        # the measurements of the requests, see stats
+        self.instrumentation = Instrumentation(self.__class__.__name__)
 
     def __create_context(self, context):
         if (context is not None and context != ""):
@@ -240,8 +255,8 @@ class TapConn:
         if verbose:
             print(f"host = {conn.host}:{conn.port}")
             print(f"context = {context}")
-        conn.request("GET", context, None, self.__getHeaders)
-        response = conn.getresponse()
+        response = self.__send(conn, "GET", context, None, self.__getHeaders,
+                               self.__isHttps or self.__cookie is not None)
         self.__currentReason = response.reason
         self.__currentStatus = response.status
         return response
@@ -399,9 +414,11 @@ class TapConn:
             print(f"host = {conn.host}:{conn.port}")
             print(f"context = {context}")
             print(f"Content-type = {content_type}")
-        self.__postHeaders["Content-type"] = content_type
-        conn.request("POST", context, data, self.__postHeaders)
-        response = conn.getresponse()
+        # the headers are copied as the connection may be used by several
+        # threads (e.g. concurrent jobs)
+        headers = dict(self.__postHeaders, **{"Content-type": content_type})
+        response = self.__send(conn, "POST", context, data, headers,
+                               self.__isHttps or self.__cookie is not None)
         self.__currentReason = response.reason
         self.__currentStatus = response.status
         return response
@@ -425,13 +442,58 @@ class TapConn:
         """
         conn = self.__get_connection_secure(verbose)
         context = self.__get_server_context(subcontext)
-        self.__postHeaders["Content-type"] = CONTENT_TYPE_POST_DEFAULT
-        conn.request("POST", context, data, self.__postHeaders)
-        response = conn.getresponse()
+        headers = dict(self.__postHeaders,
+                       **{"Content-type": CONTENT_TYPE_POST_DEFAULT})
+        response = self.__send(conn, "POST", context, data, headers, True)
         self.__currentReason = response.reason
         self.__currentStatus = response.status
         return response
 
+    def __send(self, conn, method, context, body, headers, secure):
+        if secure:
+            url = f"https://{self.__connHost}:{self.__connPortSsl}{context}"
+        else:
+            url = f"http://{self.__connHost}:{self.__connPort}{context}"
+        event = self.instrumentation.start_event('request', method, url)
+        try:
+            conn.request(method, context, body, headers)
+            response = conn.getresponse()
+        except BaseException as ex:
+            event.connect = take_connect()
+            self.instrumentation.finish_event(event, ex)
+            raise
+        event.ttfb = event.elapsed()
+        event.connect = take_connect()
+        event.status = response.status
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        if isinstance(body, bytes):
+            event.bytes_sent = len(body)
+
+        def done(bytes_received):
+            # the event is emitted once the body has been read
+            event.bytes_received = bytes_received
+            self.instrumentation.finish_event(event)
+
+        if hasattr(response, 'add_done_callback'):
+            response.add_done_callback(done)
+        else:
+            self.instrumentation.finish_event(event)
+        return response
+
+    def stats(self):
+        """Returns the summary of the requests sent by this connection
+
+        The requests are summarized by method and URL template, see
+        astroquery.instrumentation.Instrumentation.stats. A request is
+        counted once its response has been read or closed.
+
+        Returns
+        -------
+        An astropy.table.Table
+        """
+        return self.instrumentation.stats()
+
     def get_response_status(self):
         """Returns the latest connection status
 
@@ -714,10 +776,32 @@ class TapConn:
 
 
 class ConnectionHandler:
-    def __init__(self, host, port, sslport):
+    """Creates the HTTP(s) connections of a TapConn
+    The connections are kept alive and reused once their response has been
+    fully read, so that consecutive requests (e.g. job phase polling) do not
+    pay a new TCP and TLS handshake. It can be used by several threads.
+    """
+
+    def __init__(self, host, port, sslport, pool_size=DEFAULT_POOL_SIZE):
+        """Constructor
+
+        Parameters
+        ----------
+        host : str, mandatory
+            host name
+        port : int, mandatory
+            HTTP port
+        sslport : int, mandatory
+            HTTPS port
+        pool_size : int, optional, default DEFAULT_POOL_SIZE
+            maximum number of idle connections kept alive, per protocol
+        """
         self.__connHost = host
         self.__connPort = port
         self.__connPortSsl = sslport
+        self.pool_size = pool_size
+        self.__pools = {False: [], True: []}
+        self.__lock = threading.Lock()
 
     def get_connection(self, ishttps=False, cookie=None, verbose=False):
         if (ishttps) or (cookie is not None):
@@ -727,7 +811,223 @@ class ConnectionHandler:
         else:
             if verbose:
                 print("------>http")
-            return httplib.HTTPConnection(self.__connHost, self.__connPort)
+            return self.__get_pooled_connection(False)
 
     def get_connection_secure(self, verbose):
-        return httplib.HTTPSConnection(self.__connHost, self.__connPortSsl)
+        return self.__get_pooled_connection(True)
+
+    def create_connection(self, secure):
+        """Creates a new HTTP(s) connection
+
+        Parameters
+        ----------
+        secure : bool, mandatory
+            'True' for an HTTPS connection
+
+        Returns
+        -------
+        An http.client connection object
+        """
+        if secure:
+            return httplib.HTTPSConnection(self.__connHost, self.__connPortSsl)
+        else:
+            return httplib.HTTPConnection(self.__connHost, self.__connPort)
+
+    def __get_pooled_connection(self, secure):
+        with self.__lock:
+            pool = self.__pools[secure]
+            conn = pool.pop() if pool else None
+        reused = conn is not None
+        if conn is None:
+            conn = self.create_connection(secure)
+        return _PooledConnection(self, conn, secure, reused)
+
+    def release_connection(self, conn, secure):
+        """Gives back an idle connection to the pool
+
+        Parameters
+        ----------
+        conn : http.client connection object, mandatory
+            connection whose last response has been fully read
+        secure : bool, mandatory
+            'True' for an HTTPS connection
+        """
+        with self.__lock:
+            pool = self.__pools[secure]
+            if len(pool) < self.pool_size:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def get_pool_size(self, secure=False):
+        """Returns the number of idle connections
+
+        Parameters
+        ----------
+        secure : bool, optional, default 'False'
+            'True' for the HTTPS connections
+        """
+        with self.__lock:
+            return len(self.__pools[secure])
+
+    def close(self):
+        """Closes the idle connections"""
+        with self.__lock:
+            conns = self.__pools[False] + self.__pools[True]
+            self.__pools = {False: [], True: []}
+        for conn in conns:
+            conn.close()
+
+
+class _PooledConnection:
+    """Connection of a ConnectionHandler pool, with the http.client
+    connection interface
+    The connection goes back to the pool once its response has been read.
+    """
+
+    def __init__(self, handler, conn, secure, reused):
+        self.__handler = handler
+        self.__conn = conn
+        self.__secure = secure
+        self.__reused = reused
+        self.__request = None
+
+    def __getattr__(self, name):
+        return getattr(self.__conn, name)
+
+    def request(self, method, url, body=None, headers={}):
+        self.__request = (method, url, body, headers)
+        try:
+            self.__connect()
+            self.__conn.request(method, url, body, headers)
+        except STALE_CONNECTION_ERRORS:
+            if not self.__reused:
+                raise
+            self.__reconnect()
+
+    def getresponse(self):
+        try:
+            response = self.__conn.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            # the server closed the kept-alive connection, possibly after
+            # having processed the request: only the requests without side
+            # effects are sent again on a new connection, a job must not be
+            # created twice
+            if not self.__reused or self.__request[0] not in IDEMPOTENT_METHODS:
+                raise
+            self.__reconnect()
+            response = self.__conn.getresponse()
+        self.__reused = False
+        return _PooledResponse(response, self.__release, self.__discard)
+
+    def __reconnect(self):
+        self.__conn.close()
+        self.__conn = self.__handler.create_connection(self.__secure)
+        self.__reused = False
+        self.__connect()
+        self.__conn.request(*self.__request)
+
+    def __connect(self):
+        # new connections are opened here rather than by request, so that
+        # the time spent opening them is measured
+        if getattr(self.__conn, 'sock', False) is None:
+            start = time.perf_counter()
+            try:
+                self.__conn.connect()
+            finally:
+                record_connect(time.perf_counter() - start)
+
+    def __release(self):
+        self.__handler.release_connection(self.__conn, self.__secure)
+
+    def __discard(self):
+        self.__conn.close()
+
+
+class _PooledResponse:
+    """http.client response giving back its connection to the pool once it
+    has been read"""
+
+    def __init__(self, response, release, discard):
+        self.__response = response
+        self.__release = release
+        self.__discard = discard
+        self.__done = False
+        self.__bytes_read = 0
+        self.__callbacks = []
+        self.__check_consumed()
+
+    def __getattr__(self, name):
+        return getattr(self.__response, name)
+
+    def add_done_callback(self, fn):
+        """Calls fn with the number of bytes read once the response has
+        been read or closed, or immediately if it already has been"""
+        if self.__done:
+            fn(self.__bytes_read)
+        else:
+            self.__callbacks.append(fn)
+
+    def __set_done(self):
+        self.__done = True
+        callbacks, self.__callbacks = self.__callbacks, []
+        for fn in callbacks:
+            fn(self.__bytes_read)
+
+    def __check_consumed(self):
+        if not self.__done and self.__response.isclosed():
+            self.__release()
+            self.__set_done()
+
+    def read(self, *args, **kwargs):
+        data = self.__response.read(*args, **kwargs)
+        self.__bytes_read += len(data)
+        self.__check_consumed()
+        return data
+
+    def readinto(self, b):
+        n = self.__response.readinto(b)
+        self.__bytes_read += n or 0
+        self.__check_consumed()
+        return n
+
+    def readline(self, limit=-1):
+        line = self.__response.readline(limit)
+        if not line and limit:
+            # http.client does not close the responses of known length at
+            # the end of their body when they are read by lines
+            self.__response.read()
+        self.__bytes_read += len(line)
+        self.__check_consumed()
+        return line
+
+    def readlines(self, hint=-1):
+        lines = []
+        size = 0
+        for line in self:
+            lines.append(line)
+            size += len(line)
+            if 0 < hint <= size:
+                break
+        return lines
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def close(self):
+        if not self.__done:
+            if self.__response.isclosed():
+                self.__release()
+            else:
+                # unread data left in the socket: the connection is dropped
+                self.__response.close()
+                self.__discard()
+            self.__set_done()
+        else:
+            self.__response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -14,9 +14,13 @@ Created on 30 jun. 2016
 
 
 """
+import http.client
+import io
 import os
 
-from astroquery.utils.tap.conn.tapconn import TapConn
+import pytest
+
+from astroquery.utils.tap.conn.tapconn import ConnectionHandler, TapConn, _PooledResponse
 from astroquery.utils.tap.conn.tests.DummyConn import DummyConn
 
 
@@ -115,3 +119,168 @@ def test_login():
     assert r.get_method() == 'POST'
     assert r.get_context() == context
     assert r.get_body() == data
+
+
+class FakeHttpResponse:
+
+    def __init__(self, body):
+        self.status = 200
+        self.reason = 'OK'
+        self.fp = io.BytesIO(body)
+
+    def read(self, amt=None):
+        data = self.fp.read(amt)
+        if amt is None or not data:
+            self.fp.close()
+        return data
+
+    def isclosed(self):
+        return self.fp.closed
+
+    def close(self):
+        self.fp.close()
+
+
+class FakeHttpConnection:
+    """http.client connection double, optionally closed by the server
+    after its first request"""
+
+    def __init__(self, drop_after_first=False):
+        self.host = 'testHost'
+        self.port = 90
+        self.requests = []
+        self.closed = False
+        self.drop_after_first = drop_after_first
+
+    def request(self, method, url, body=None, headers={}):
+        self.requests.append((method, url, body, dict(headers)))
+
+    def getresponse(self):
+        if self.drop_after_first and len(self.requests) > 1:
+            raise http.client.RemoteDisconnected('closed by server')
+        return FakeHttpResponse(b'response body')
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = ConnectionHandler('testHost', 90, 943)
+    handler.created = []
+
+    def create_connection(secure):
+        conn = FakeHttpConnection(drop_after_first=not handler.created)
+        handler.created.append(conn)
+        return conn
+
+    monkeypatch.setattr(handler, 'create_connection', create_connection)
+    return handler
+
+
+def test_connection_pool(handler):
+    tap = TapConn(ishttps=False, host='testHost', server_context='server',
+                  tap_context='tap', port=90, sslport=943,
+                  connhandler=handler)
+    r = tap.execute_tapget(subcontext='sync')
+    assert r.status == 200
+    # the connection is kept until the response has been read
+    assert handler.get_pool_size() == 0
+    assert r.read(4) == b'resp'
+    assert r.read() == b'onse body'
+    assert handler.get_pool_size() == 1
+
+    # the idle connection is reused
+    r = tap.execute_tapget(subcontext='async?PHASE=1')
+    assert r.read() == b'response body'
+    assert handler.get_pool_size() == 1
+
+    # the connection has been closed by the server: the request is sent
+    # again on a new connection
+    assert len(handler.created) == 2
+    first, second = handler.created
+    assert first.closed
+    assert [req[0] for req in first.requests] == ['GET', 'GET']
+    assert second.requests == [first.requests[-1]]
+
+    # a response closed before being read drops its connection
+    r = tap.execute_tapget(subcontext='sync')
+    r.close()
+    assert handler.get_pool_size() == 0
+    assert second.closed
+
+
+def test_connection_pool_post_not_resent(handler):
+    tap = TapConn(ishttps=False, host='testHost', server_context='server',
+                  tap_context='tap', port=90, sslport=943,
+                  connhandler=handler)
+    tap.execute_tapget(subcontext='sync').read()
+    # the server may have created the job before closing the connection
+    with pytest.raises(http.client.RemoteDisconnected):
+        tap.execute_tappost(subcontext='async', data='a=b')
+    assert len(handler.created) == 1
+
+
+def test_pooled_response_iteration():
+    body = b'line 1\nline 2\nline 3\n'
+    raw = (b'HTTP/1.1 200 OK\r\nContent-Length: ' + str(len(body)).encode()
+           + b'\r\n\r\n' + body)
+
+    class FakeSocket:
+
+        def makefile(self, mode):
+            return io.BytesIO(raw)
+
+    released = []
+    for read_lines in (list, lambda response: response.readlines()):
+        response = http.client.HTTPResponse(FakeSocket())
+        response.begin()
+        pooled = _PooledResponse(response, lambda: released.append(True), None)
+        sizes = []
+        pooled.add_done_callback(sizes.append)
+        assert read_lines(pooled) == [b'line 1\n', b'line 2\n', b'line 3\n']
+        # the connection is released at the end of the body
+        assert sizes == [len(body)]
+    assert released == [True, True]
+
+
+def test_instrumentation(handler):
+    tap = TapConn(ishttps=False, host='testHost', server_context='server',
+                  tap_context='tap', port=90, sslport=943,
+                  connhandler=handler)
+    events = []
+    tap.instrumentation.add_exporter(events.append)
+    r = tap.execute_tappost(subcontext='async', data='a=b')
+    r.close()
+    r = tap.execute_tapget(subcontext='sync?QUERY=1')
+    # the request is measured until its response has been read
+    assert len(events) == 1
+    r.read()
+
+    post, get = events
+    assert get.url == 'http://testHost:90/server/tap/sync'
+    assert get.status == 200
+    assert get.bytes_received == len(b'response body')
+    assert 0 < get.ttfb <= get.total
+    assert post.method == 'POST'
+    assert post.bytes_sent == 3
+    assert post.bytes_received == 0
+    stats = tap.stats()
+    assert list(stats['count']) == [1, 1]
+
+
+def test_connection_pool_size(handler):
+    handler.pool_size = 1
+    conns = [handler.get_connection() for _ in range(2)]
+    responses = []
+    for conn in conns:
+        conn.request('GET', '/tap/sync')
+        responses.append(conn.getresponse())
+    for response in responses:
+        response.read()
+    assert handler.get_pool_size() == 1
+    assert handler.get_pool_size(secure=True) == 0
+    assert [conn.closed for conn in handler.created] == [False, True]
+    handler.close()
+    assert handler.get_pool_size() == 0
+    assert handler.created[0].closed
@@ -135,6 +135,9 @@ class Tap:
         # if connectionHandler is set, use it (useful for testing)
         if connhandler is not None:
             self.__connHandler = connhandler
+        if isinstance(self.__connHandler, TapConn):
+            # the requests are reported under the name of the service class
+            self.__connHandler.instrumentation.service = self.__class__.__name__
         if verbose:
             print(f"Created TAP+ (v{VERSION}) - Connection:\n{self.__connHandler}")
 
@@ -351,7 +354,7 @@ class Tap:
                          output_format="votable", verbose=False,
                          dump_to_file=False, background=False,
                          upload_resource=None, upload_table_name=None,
-                         autorun=True):
+                         autorun=True, stream=False):
         """Launches an asynchronous job
 
         Parameters
@@ -378,6 +381,9 @@ class Tap:
         autorun : boolean, optional, default True
             if 'True', sets 'phase' parameter to 'RUN',
             so the framework can start the job.
+        stream : bool, optional, default 'False'
+            if True, the results are not loaded in memory: they can be read
+            by chunks, while they are downloaded, with Job.iter_results
 
         Returns
         -------
@@ -441,7 +447,7 @@ class Tap:
             job.remoteLocation = location
             if autorun is True:
                 job.set_phase('EXECUTING')
-                if not background:
+                if not background and not stream:
                     if verbose:
                         print("Retrieving async. results...")
                     # saveResults or getResults will block (not background)
@@ -705,6 +711,24 @@ class Tap:
             print(f"tap context: '{tapContext}'")
         return protocol, host, port, serverContext, tapContext
 
+    @property
+    def instrumentation(self):
+        """The astroquery.instrumentation.Instrumentation of the requests
+        sent by the connection handler, to which exporters can be added"""
+        return self.__connHandler.instrumentation
+
+    def stats(self):
+        """Returns the summary of the requests sent to the service
+
+        The requests are summarized by method and URL template, see
+        astroquery.instrumentation.Instrumentation.stats.
+
+        Returns
+        -------
+        An astropy.table.Table
+        """
+        return self.__connHandler.stats()
+
     def __str__(self):
         return (f"Created TAP+ (v{VERSION}) - Connection:\n{self.__connHandler}")
 
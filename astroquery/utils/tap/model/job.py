@@ -15,7 +15,13 @@ Created on 30 jun. 2016
 
 """
 
+import collections
+import concurrent.futures
+import queue
+import random
+import threading
 import time
+from xml.etree import ElementTree
 
 from astroquery.utils.tap.model import modelutils
 from astroquery.utils.tap.xmlparser import utils
@@ -23,7 +29,17 @@ from astroquery.utils.tap import taputils
 import requests
 import sys
 
-__all__ = ['Job']
+__all__ = ['Job', 'wait_for_jobs']
+
+# Phases of a job that is not finished yet
+ACTIVE_PHASES = ('PENDING', 'QUEUED', 'EXECUTING')
+
+# Default maximum duration (s) of a UWS 1.1 blocking phase request
+DEFAULT_WAIT = 30
+
+# Delays (s) between two phase requests, when they are not blocking
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 30
 
 
 class Job:
@@ -246,6 +262,42 @@ class Job:
             self.__load_async_job_results()
             return self.results
 
+    def iter_results(self, chunk_size=None, verbose=False):
+        """Iterates over the job results, as tables of at most chunk_size
+        rows. The results of asynchronous jobs are parsed while they are
+        downloaded, without loading them in memory.
+        This method will block if the job is asynchronous and the job has not
+        finished yet.
+
+        Parameters
+        ----------
+        chunk_size : int, optional, default utils.DEFAULT_CHUNK_SIZE
+            maximum number of rows of each table
+        verbose : bool, optional, default 'False'
+            flag to display information about the process
+
+        Returns
+        -------
+        A generator of astropy.table.Table objects
+        """
+        outputFormat = self.parameters['format']
+        if self.results is None:
+            self.results = modelutils.read_results_table_from_file(
+                self.outputFile, outputFormat)
+        if self.results is not None or not self.async_:
+            if self.results is not None:
+                chunk_size = chunk_size or utils.DEFAULT_CHUNK_SIZE
+                for start in range(0, max(len(self.results), 1), chunk_size):
+                    yield self.results[start:start + chunk_size]
+            return
+        resultsResponse = self.__get_async_results_response(verbose)
+        try:
+            yield from utils.read_http_response_chunks(resultsResponse,
+                                                       outputFormat,
+                                                       chunk_size=chunk_size)
+        finally:
+            resultsResponse.close()
+
     def set_results(self, results):
         """Sets the job results
 
@@ -302,17 +354,36 @@ class Job:
                 print(f"Saving results to: {output}")
                 self.connHandler.dump_to_file(output, response)
 
-    def wait_for_job_end(self, verbose=False):
+    def wait_for_job_end(self, verbose=False, timeout=None,
+                         wait=DEFAULT_WAIT):
         """Waits until a job is finished
+        The server is asked to hold each phase request until the job phase
+        changes (UWS 1.1 blocking WAIT). Servers that do not block are polled
+        with exponentially growing delays.
 
         Parameters
         ----------
         verbose : bool, optional, default 'False'
             flag to display information about the process
+        timeout : float, optional, default None
+            maximum waiting time, in seconds. A TimeoutError is raised when
+            the job is not finished in time. No limit by default
+        wait : int, optional, default DEFAULT_WAIT
+            maximum duration of a blocking phase request, in seconds.
+            0 or None to poll the job phase without blocking
+
+        Returns
+        -------
+        A tuple with the HTTP status of the last phase request and the job
+        phase
         """
-        currentResponse = None
-        responseData = None
-        lphase = None
+        return self._wait_for_job_end(verbose=verbose, timeout=timeout,
+                                      wait=wait)
+
+    def _wait_for_job_end(self, verbose=False, timeout=None,
+                          wait=DEFAULT_WAIT):
+        start = time.monotonic()
+        delays = _backoff_delays()
         # execute job if not running
         if self._phase == 'PENDING':
             print("Job in PENDING phase, sending phase=RUN request.")
@@ -322,22 +393,105 @@ class Job:
                 # ignore
                 if verbose:
                     print("Exception when trying to start job", ex)
-        while True:
-            responseData = self.get_phase(update=True)
-            currentResponse = self.__last_phase_response_status
-
-            lphase = responseData.upper().strip()
+        lphase = self.get_phase(update=True).upper().strip()
+        currentResponse = self.__last_phase_response_status
+        # PENDING, QUEUED, EXECUTING, COMPLETED, ERROR, ABORTED, UNKNOWN,
+        # HELD, SUSPENDED, ARCHIVED:
+        while lphase in ACTIVE_PHASES:
             if verbose:
                 print(f"Job {self.jobid} status: {lphase}")
-            if ("PENDING" != lphase and "QUEUED" != lphase and
-                    "EXECUTING" != lphase):
-                break
-            # PENDING, QUEUED, EXECUTING, COMPLETED, ERROR, ABORTED, UNKNOWN,
-            # HELD, SUSPENDED, ARCHIVED:
-            time.sleep(0.5)
+            remaining = None
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"Job {self.jobid} not finished after "
+                                       f"{timeout} s (phase: {lphase})")
+            blocked = False
+            if wait:
+                waitTime = wait
+                if remaining is not None:
+                    waitTime = max(1, min(wait, int(remaining)))
+                requestStart = time.monotonic()
+                waitResult = self.__wait_phase_change(lphase, waitTime,
+                                                      verbose)
+                if waitResult is None:
+                    # the server does not support blocking requests
+                    wait = None
+                else:
+                    currentResponse, newPhase = waitResult
+                    # the request was held by the server or the phase
+                    # changed: no need to wait before the next one
+                    blocked = (newPhase != lphase or
+                               time.monotonic() - requestStart >= waitTime)
+                    lphase = newPhase
+                    if lphase not in ACTIVE_PHASES:
+                        break
+            if not blocked:
+                delay = next(delays)
+                if remaining is not None:
+                    delay = min(delay, remaining)
+                time.sleep(delay)
+                if not wait:
+                    lphase = self.get_phase(update=True).upper().strip()
+                    currentResponse = self.__last_phase_response_status
+        if verbose:
+            print(f"Job {self.jobid} status: {lphase}")
         return currentResponse, lphase
 
+    def _poll_phase(self, wait=None, verbose=False):
+        # a single phase request, held by the server at most 'wait' seconds
+        # when the job phase is known. Returns the phase, and whether the
+        # request was held (None if the server does not hold requests)
+        if self._phase is None or self._phase == 'PENDING':
+            if self._phase == 'PENDING':
+                try:
+                    self.start(verbose)
+                except Exception as ex:
+                    if verbose:
+                        print("Exception when trying to start job", ex)
+            return self.get_phase(update=True).upper().strip(), False
+        phase = self._phase.upper().strip()
+        if wait and phase in ACTIVE_PHASES:
+            requestStart = time.monotonic()
+            waitResult = self.__wait_phase_change(phase, wait, verbose)
+            if waitResult is not None:
+                newPhase = waitResult[1]
+                return newPhase, (newPhase != phase or
+                                  time.monotonic() - requestStart >= wait)
+            return self.get_phase(update=True).upper().strip(), None
+        return self.get_phase(update=True).upper().strip(), False
+
+    def __wait_phase_change(self, phase, wait, verbose=False):
+        # UWS 1.1 blocking request: the job description is returned when the
+        # phase changes or after 'wait' seconds
+        context = f"async/{self.jobid}?WAIT={wait}&PHASE={phase}"
+        response = self.connHandler.execute_tapget(context, verbose=verbose)
+        data = response.read()
+        if response.status != 200:
+            if verbose:
+                print(f"Blocking phase request failed: {response.status} "
+                      f"{response.reason}")
+            return None
+        try:
+            root = ElementTree.fromstring(data)
+        except ElementTree.ParseError:
+            return None
+        for element in root.iter():
+            if (element.tag == 'phase' or element.tag.endswith('}phase')) \
+                    and element.text:
+                self._phase = element.text.strip()
+                self.__last_phase_response_status = response.status
+                return response.status, self._phase.upper()
+        return None
+
     def __load_async_job_results(self, debug=False):
+        resultsResponse = self.__get_async_results_response(debug)
+        outputFormat = self.parameters['format']
+        results = utils.read_http_response(resultsResponse,
+                                           outputFormat)
+        self.set_results(results)
+
+    def __get_async_results_response(self, debug=False):
         wjResponse, phase = self.wait_for_job_end()
         subContext = f"async/{self.jobid}/results/result"
         resultsResponse = self.connHandler.execute_tapget(subContext)
@@ -362,10 +516,7 @@ class Job:
                 print(resultsResponse.status, errMsg)
                 raise requests.exceptions.HTTPError(errMsg)
             else:
-                outputFormat = self.parameters['format']
-                results = utils.read_http_response(resultsResponse,
-                                                   outputFormat)
-                self.set_results(results)
+                return resultsResponse
 
     def __handle_redirect_if_required(self, resultsResponse, verbose=False):
         # Thanks @emeraldTree24
@@ -479,3 +630,123 @@ class Job:
             f"\nOwner: {self.ownerid}" \
             f"\nOutput file: {self.outputFile}" \
             f"\nResults: {result}"
+
+
+def wait_for_jobs(jobs, timeout=None, wait=DEFAULT_WAIT, max_workers=None,
+                  verbose=False):
+    """Waits until several jobs are finished
+    The jobs not finished are monitored in turn by a few threads, with short
+    blocking phase requests (see `Job.wait_for_job_end`), and returned as
+    they finish. The duration of the blocking requests is shortened as the
+    number of jobs grows, so that each job is checked about every 'wait'
+    seconds while at most 'max_workers' requests are sent at the same time.
+
+    Parameters
+    ----------
+    jobs : list of Job, mandatory
+        asynchronous jobs
+    timeout : float, optional, default None
+        maximum waiting time for all the jobs, in seconds. A TimeoutError is
+        raised when a job is not finished in time. No limit by default
+    wait : int, optional, default DEFAULT_WAIT
+        maximum duration of a blocking phase request, in seconds.
+        0 or None to poll the job phases without blocking
+    max_workers : int, optional, default None
+        maximum number of phase requests sent at the same time, by default
+        astroquery.query.conf.max_per_host
+    verbose : bool, optional, default 'False'
+        flag to display information about the process
+
+    Returns
+    -------
+    A generator of the finished jobs, in their order of completion
+    """
+    from astroquery.query import conf as query_conf
+
+    jobs = list(jobs)
+    if not jobs:
+        return
+    start = time.monotonic()
+    max_workers = min(max_workers or query_conf.max_per_host, len(jobs))
+    pending = collections.deque(jobs)
+    finished = queue.Queue()
+    lock = threading.Lock()
+    stop = threading.Event()
+    state = {'unfinished': len(jobs), 'wait': wait}
+    # the delays of the jobs whose phase requests are not held, and the time
+    # of their next request
+    delays = {id(job): _backoff_delays() for job in jobs}
+    due = {id(job): start for job in jobs}
+    done = []
+
+    def monitor():
+        while not stop.is_set():
+            with lock:
+                if not pending:
+                    return
+                job = pending.popleft()
+                jobDue = due[id(job)]
+                # the longer the round, the shorter the blocking requests
+                stepWait = state['wait']
+                if stepWait:
+                    stepWait = max(1, min(stepWait, int(
+                        stepWait * max_workers / state['unfinished'])))
+            if stop.wait(max(0, jobDue - time.monotonic())):
+                return
+            if stepWait and timeout is not None:
+                stepWait = max(1, min(stepWait, int(
+                    timeout - (time.monotonic() - start))))
+            try:
+                phase, blocked = job._poll_phase(stepWait, verbose)
+            except Exception as ex:
+                finished.put((job, ex))
+                continue
+            if verbose:
+                print(f"Job {job.jobid} status: {phase}")
+            if phase not in ACTIVE_PHASES:
+                with lock:
+                    state['unfinished'] -= 1
+                finished.put((job, None))
+                continue
+            with lock:
+                if blocked is None:
+                    # the server does not support blocking requests
+                    state['wait'] = None
+                if blocked:
+                    delays[id(job)] = _backoff_delays()
+                    due[id(job)] = time.monotonic()
+                else:
+                    due[id(job)] = time.monotonic() + next(delays[id(job)])
+                pending.append(job)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for _ in range(max_workers):
+            executor.submit(monitor)
+        for _ in range(len(jobs)):
+            remaining = None
+            if timeout is not None:
+                remaining = max(0, timeout - (time.monotonic() - start))
+            try:
+                job, error = finished.get(timeout=remaining)
+            except queue.Empty:
+                jobids = [job.jobid for job in jobs if job not in done]
+                raise TimeoutError(f"Jobs {jobids} not finished after "
+                                   f"{timeout} s")
+            if error is not None:
+                raise error
+            done.append(job)
+            yield job
+    finally:
+        # the threads stop after their current phase request
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+def _backoff_delays(initial=POLL_INITIAL_DELAY, maximum=POLL_MAX_DELAY):
+    # exponentially growing delays, with jitter so that the requests of
+    # concurrent jobs are spread
+    delay = initial
+    while True:
+        yield random.uniform(delay / 2, delay)
+        delay = min(delay * 2, maximum)
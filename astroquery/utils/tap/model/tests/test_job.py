@@ -15,9 +15,14 @@ Created on 30 jun. 2016
 
 """
 import os
+import threading
+import time
+
 import pytest
 
-from astroquery.utils.tap.model.job import Job
+from astroquery.query import conf
+from astroquery.utils.tap.model import job as jobmodule
+from astroquery.utils.tap.model.job import Job, wait_for_jobs
 from astroquery.utils.tap.conn.tests.DummyConnHandler import DummyConnHandler
 from astroquery.utils.tap.conn.tests.DummyResponse import DummyResponse
 from astroquery.utils.tap.xmlparser import utils
@@ -111,3 +116,166 @@ def test_job_phase():
     except ValueError:
         # ok
         pass
+
+
+def test_job_iter_results():
+    job = Job(async_job=True)
+    jobid = "12345"
+    job.jobid = jobid
+    job.parameters['format'] = "votable"
+    responseCheckPhase = DummyResponse()
+    responseCheckPhase.set_status_code(200)
+    responseCheckPhase.set_message("OK")
+    responseCheckPhase.set_data(method='GET',
+                                context=None,
+                                body='COMPLETED',
+                                headers=None)
+    responseGetData = DummyResponse()
+    responseGetData.set_status_code(200)
+    responseGetData.set_message("OK")
+    jobContent = utils.read_file_content(data_path('result_1.vot'))
+    responseGetData.set_data(method='GET',
+                             context=None,
+                             body=jobContent,
+                             headers=None)
+    connHandler = DummyConnHandler()
+    connHandler.set_response(f"async/{jobid}/phase", responseCheckPhase)
+    connHandler.set_response(f"async/{jobid}/results/result", responseGetData)
+    job.connHandler = connHandler
+
+    chunks = list(job.iter_results(chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0].colnames == ['alpha', 'delta', 'source_id', 'table1_oid']
+    # the results are not kept in memory
+    assert job.results is None
+
+    res = job.get_results()
+    assert len(res) == 3
+    assert [len(chunk) for chunk in job.iter_results(chunk_size=2)] == [2, 1]
+
+
+JOB_DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<uws:job xmlns:uws="http://www.ivoa.net/xml/UWS/v1.0">
+  <uws:jobId>{jobid}</uws:jobId>
+  <uws:phase>{phase}</uws:phase>
+</uws:job>
+"""
+
+
+def _make_job(jobid, phase, blocking_phase=None, blocking_status=200):
+    job = Job(async_job=True)
+    job.jobid = jobid
+    connHandler = DummyConnHandler()
+    responsePhase = DummyResponse()
+    responsePhase.set_status_code(200)
+    responsePhase.set_message("OK")
+    responsePhase.set_data(method='GET', context=None, body=phase,
+                           headers=None)
+    connHandler.set_response(f"async/{jobid}/phase", responsePhase)
+    responseWait = DummyResponse()
+    responseWait.set_status_code(blocking_status)
+    responseWait.set_data(method='GET', context=None,
+                          body=JOB_DOCUMENT.format(jobid=jobid,
+                                                   phase=blocking_phase),
+                          headers=None)
+    connHandler.set_response(f"async/{jobid}?WAIT=30&PHASE={phase}",
+                             responseWait)
+    job.connHandler = connHandler
+    return job, responsePhase
+
+
+def test_job_wait_for_job_end_blocking(monkeypatch):
+    job, _ = _make_job("12345", "EXECUTING", blocking_phase="COMPLETED")
+    monkeypatch.setattr(jobmodule.time, 'sleep', pytest.fail)
+    assert job.wait_for_job_end() == (200, 'COMPLETED')
+    assert job.get_phase() == 'COMPLETED'
+    assert job.connHandler.get_last_request() == \
+        "async/12345?WAIT=30&PHASE=EXECUTING"
+
+
+def test_job_wait_for_job_end_polling(monkeypatch):
+    # the server does not support blocking phase requests
+    job, responsePhase = _make_job("12345", "QUEUED", blocking_status=400)
+    delays = []
+
+    def sleep(delay):
+        delays.append(delay)
+        if len(delays) == 4:
+            responsePhase.set_data(method='GET', context=None,
+                                   body='COMPLETED', headers=None)
+
+    monkeypatch.setattr(jobmodule.time, 'sleep', sleep)
+    assert job.wait_for_job_end() == (200, 'COMPLETED')
+    assert len(delays) == 4
+    for n, delay in enumerate(delays):
+        assert 0.25 * 2 ** n <= delay <= 0.5 * 2 ** n
+
+    responsePhase.set_data(method='GET', context=None, body='EXECUTING',
+                           headers=None)
+    with pytest.raises(TimeoutError):
+        job.wait_for_job_end(timeout=0.1, wait=None)
+
+
+def test_wait_for_jobs():
+    jobs = [_make_job("1", "EXECUTING", blocking_phase="COMPLETED")[0],
+            _make_job("2", "COMPLETED")[0],
+            _make_job("3", "QUEUED", blocking_phase="ERROR")[0]]
+    finished = list(wait_for_jobs(jobs))
+    assert sorted(job.jobid for job in finished) == ["1", "2", "3"]
+    assert [job.get_phase() for job in jobs] == ['COMPLETED', 'COMPLETED',
+                                                 'ERROR']
+    assert list(wait_for_jobs([])) == []
+
+    stalled, _ = _make_job("4", "EXECUTING", blocking_phase="EXECUTING")
+    with pytest.raises(TimeoutError):
+        list(wait_for_jobs(jobs + [stalled], timeout=0.5, wait=None))
+
+
+class CountingConnHandler:
+    """Answers the phase requests of many jobs, counting the requests sent
+    at the same time"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.contexts = []
+
+    def execute_tapget(self, context, verbose=False):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.contexts.append(context)
+        time.sleep(0.01)
+        response = DummyResponse()
+        response.set_status_code(200)
+        if 'WAIT' in context:
+            jobid = context.split('/')[1].split('?')[0]
+            body = JOB_DOCUMENT.format(jobid=jobid, phase='COMPLETED')
+        else:
+            body = 'EXECUTING'
+        response.set_data(method='GET', context=None, body=body, headers=None)
+        with self.lock:
+            self.active -= 1
+        return response
+
+
+def test_wait_for_jobs_bounded(monkeypatch):
+    monkeypatch.setattr(conf, 'max_per_host', 3)
+    connHandler = CountingConnHandler()
+    jobs = []
+    for jobid in range(50):
+        job = Job(async_job=True, connhandler=connHandler)
+        job.jobid = str(jobid)
+        jobs.append(job)
+    threads = threading.active_count()
+
+    finished = wait_for_jobs(jobs, wait=30)
+    assert next(finished).get_phase() == 'COMPLETED'
+    # a few threads monitor all the jobs
+    assert threading.active_count() <= threads + 3
+    assert len(list(finished)) == 49
+    assert connHandler.max_active <= 3
+    # a phase request and a short blocking request per job
+    assert len(connHandler.contexts) == 100
+    assert 'async/0?WAIT=1&PHASE=EXECUTING' in connHandler.contexts
@@ -15,7 +15,15 @@ Created on 30 jun. 2016
 
 """
 
+import gzip
+import io
 import os
+
+import numpy as np
+import pytest
+from astropy.io import votable
+from astropy.table import Table, vstack
+
 from astroquery.utils.tap.xmlparser.tableSaxParser import TableSaxParser
 from astroquery.utils.tap.xmlparser.jobListSaxParser import JobListSaxParser
 from astroquery.utils.tap.xmlparser.jobSaxParser import JobSaxParser
@@ -74,6 +82,74 @@ def test_job_results_parser():
     file.close()
 
 
+class SlowResponse:
+    """Response returning a few bytes at each read"""
+
+    def __init__(self, data, block_size=37):
+        self.file = io.BytesIO(data)
+        self.block_size = block_size
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.file.read()
+        return self.file.read(min(size, self.block_size))
+
+
+def test_job_results_parser_chunks():
+    with open(data_path('test_job_results.xml'), 'rb') as file:
+        data = file.read()
+    expected = utils.read_http_response(io.BytesIO(data), 'votable')
+    chunks = list(utils.read_http_response_chunks(SlowResponse(data),
+                                                  'votable', chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    result = vstack(chunks)
+    assert result.colnames == expected.colnames
+    for cn in expected.colnames:
+        assert result[cn].unit == expected[cn].unit
+        assert repr(result[cn].tolist()) == repr(expected[cn].tolist())
+
+    # gzipped results
+    chunks = list(utils.read_http_response_chunks(
+        SlowResponse(gzip.compress(data)), 'votable', chunk_size=10))
+    assert len(chunks) == 1
+    assert len(chunks[0]) == 5
+
+
+@pytest.mark.parametrize('output_format, serialization',
+                         [('votable', 'tabledata'), ('votable', 'binary'),
+                          ('votable', 'binary2'), ('csv', None),
+                          ('fits', None)])
+@pytest.mark.parametrize('nrows, chunk_lengths', [(25, [10, 10, 5]), (0, [0])])
+def test_read_http_response_chunks(output_format, serialization, nrows,
+                                   chunk_lengths):
+    table = Table({'a': np.arange(25),
+                   'b': np.array(['x', 'y, "z"', 'w\nv', 'u', 'tt'] * 5),
+                   'c': np.linspace(0, 1, 25)})[:nrows]
+    table['c'].unit = 'deg'
+    if output_format == 'votable':
+        out = io.BytesIO()
+        votable.from_table(table).to_xml(out, tabledata_format=serialization)
+    elif output_format == 'csv':
+        out = io.StringIO()
+        table.write(out, format='ascii.csv')
+        out = io.BytesIO(out.getvalue().encode('utf-8'))
+    else:
+        out = io.BytesIO()
+        table.write(out, format='fits')
+    data = out.getvalue()
+
+    expected = utils.read_http_response(io.BytesIO(data), output_format)
+    chunks = list(utils.read_http_response_chunks(SlowResponse(data),
+                                                  output_format,
+                                                  chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == chunk_lengths
+    for i, chunk in enumerate(chunks):
+        assert chunk.colnames == expected.colnames
+        assert chunk['c'].unit == expected['c'].unit
+        for cn in expected.colnames:
+            assert np.all(chunk[cn] == expected[cn][i * 10:(i + 1) * 10])
+
+
 def __check_table(table, baseName, numColumns, columnsData):
     qualifiedName = f"public.{baseName}"
     assert str(table.get_qualified_name()) == str(qualifiedName)
@@ -15,10 +15,21 @@ Created on 30 jun. 2016
 
 """
 
+import base64
+import binascii
+import gzip
 import io
+import re
+
 from astropy import units as u
+from astropy.io import fits
+from astropy.io import votable
+from astropy.io.votable import converters
 from astropy.table import Table as APTable
 
+# Default number of rows of the tables yielded by read_http_response_chunks
+DEFAULT_CHUNK_SIZE = 100000
+
 
 def util_create_string_from_buffer(buffer):
     return ''.join(map(str, buffer))
@@ -31,19 +42,416 @@ def read_http_response(response, outputFormat, correct_units=True):
     result = APTable.read(data, format=astropyFormat)
 
     if correct_units:
-        for cn in result.colnames:
-            col = result[cn]
-            if isinstance(col.unit, u.UnrecognizedUnit):
-                try:
-                    col.unit = u.Unit(col.unit.name.replace(".", " ").replace("'", ""))
-                except Exception as ex:
-                    pass
-            elif isinstance(col.unit, str):
-                col.unit = col.unit.replace(".", " ").replace("'", "")
+        correct_table_units(result)
 
     return result
 
 
+def correct_table_units(result):
+    for cn in result.colnames:
+        col = result[cn]
+        if isinstance(col.unit, u.UnrecognizedUnit):
+            try:
+                col.unit = u.Unit(col.unit.name.replace(".", " ").replace("'", ""))
+            except Exception as ex:
+                pass
+        elif isinstance(col.unit, str):
+            col.unit = col.unit.replace(".", " ").replace("'", "")
+
+
+def read_http_response_chunks(response, outputFormat, chunk_size=None,
+                              correct_units=True):
+    """Reads a results response as it arrives, yielding tables of at most
+    chunk_size rows. Only one chunk of the response is kept in memory.
+
+    VOTables (TABLEDATA, BINARY and BINARY2 serializations), CSV and FITS
+    binary tables are streamed; the other formats are read at once and then
+    split. The column types of CSV chunks are guessed on each chunk.
+
+    Parameters
+    ----------
+    response : file-like object, mandatory
+        response to read, only its read(size) method is used
+    outputFormat : str, mandatory
+        response format
+    chunk_size : int, optional, default DEFAULT_CHUNK_SIZE
+        maximum number of rows of the yielded tables
+    correct_units : bool, optional, default True
+        fix the units written with '.' and quotes
+
+    Returns
+    -------
+    A generator of astropy.table.Table objects
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    reader = _StreamReader(_decompressed(response))
+    if outputFormat.startswith('votable'):
+        chunks = _iter_votable_chunks(reader, chunk_size)
+    elif outputFormat == 'csv':
+        chunks = _iter_csv_chunks(reader, chunk_size)
+    elif outputFormat == 'fits':
+        chunks = _iter_fits_chunks(reader, chunk_size)
+    else:
+        chunks = _iter_table_chunks(
+            _read_table(reader.read(), get_suitable_astropy_format(outputFormat)),
+            chunk_size)
+    for chunk in chunks:
+        if correct_units:
+            correct_table_units(chunk)
+        yield chunk
+
+
+class _PrefixedResponse:
+    """Response whose first bytes have already been read"""
+
+    def __init__(self, prefix, response):
+        self._prefix = prefix
+        self._response = response
+
+    def read(self, size=-1):
+        if self._prefix:
+            data = self._prefix if size < 0 else self._prefix[:size]
+            self._prefix = self._prefix[len(data):]
+            return data
+        data = self._response.read(size)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return data or b''
+
+
+def _decompressed(response):
+    """Returns the response, decompressed on the fly if it is gzipped (as
+    the votable and fits results of some services)"""
+    prefix = b''
+    while len(prefix) < 2:
+        data = response.read(2 - len(prefix))
+        if not data:
+            break
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        prefix += data
+    response = _PrefixedResponse(prefix, response)
+    if prefix == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=response, mode='rb')
+    return response
+
+
+class _StreamReader:
+    """Buffered reader on top of a response which is read block by block"""
+
+    def __init__(self, response, block_size=2**16):
+        self._response = response
+        self._block_size = block_size
+        self._buffer = b''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        if self._eof:
+            return False
+        block = self._response.read(self._block_size)
+        if not block:
+            self._eof = True
+            return False
+        if isinstance(block, str):
+            block = block.encode('utf-8')
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
+    def read(self, size=-1):
+        """Reads size bytes (less at the end of the response), all the
+        remaining bytes if size is negative"""
+        while size < 0 or len(self._buffer) - self._pos < size:
+            if not self._fill():
+                break
+        end = len(self._buffer) if size < 0 else self._pos + size
+        data = self._buffer[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def read_until(self, token):
+        """Reads up to and including token. Returns the remaining bytes if
+        the token is not found"""
+        start = self._pos
+        while True:
+            index = self._buffer.find(token, start)
+            if index >= 0:
+                end = index + len(token)
+                data = self._buffer[self._pos:end]
+                self._pos = end
+                return data
+            start = max(self._pos, len(self._buffer) - len(token) + 1)
+            offset = self._pos
+            if not self._fill():
+                return self.read()
+            start -= offset
+
+    def read_some_until(self, byte):
+        """Reads the available bytes up to (excluding) byte. Returns
+        (data, found)"""
+        if self._pos >= len(self._buffer) and not self._fill():
+            return b'', False
+        index = self._buffer.find(byte, self._pos)
+        if index >= 0:
+            data = self._buffer[self._pos:index]
+            self._pos = index
+            return data, True
+        data = self._buffer[self._pos:]
+        self._pos = len(self._buffer)
+        return data, False
+
+
+def _read_table(data, astropyFormat):
+    return APTable.read(io.BytesIO(data), format=astropyFormat)
+
+
+def _iter_table_chunks(table, chunk_size):
+    if len(table) == 0:
+        yield table
+    for start in range(0, len(table), chunk_size):
+        yield table[start:start + chunk_size]
+
+
+_XML_IGNORED = re.compile(rb'<!--.*?-->|<!\[CDATA\[.*?\]\]>|<[?!][^>]*>', re.DOTALL)
+_XML_TAG = re.compile(rb'<(/?)([^\s/>]+)[^>]*?(/?)>')
+
+
+def _xml_closing_tags(prefix):
+    """Returns the closing tags of the elements left open in prefix"""
+    stack = []
+    for closing, name, empty in _XML_TAG.findall(_XML_IGNORED.sub(b'', prefix)):
+        if closing:
+            if stack and stack[-1] == name:
+                stack.pop()
+        elif not empty:
+            stack.append(name)
+    return b''.join(b'</' + name + b'>' for name in reversed(stack))
+
+
+def _iter_votable_chunks(reader, chunk_size):
+    head = reader.read_until(b'<DATA')
+    if not head.endswith(b'<DATA'):
+        # no data (empty result, or error document)
+        yield _read_table(head, 'votable')
+        return
+    prefix = head[:-len(b'<DATA')]
+    suffix = b'</DATA>' + _xml_closing_tags(prefix)
+    reader.read_until(b'>')
+    data_tag = reader.read_until(b'>').strip()
+
+    if data_tag.startswith(b'<TABLEDATA'):
+        def parse(rows):
+            return _read_table(prefix + b'<DATA><TABLEDATA>' + b''.join(rows) +
+                               b'</TABLEDATA>' + suffix, 'votable')
+
+        rows = []
+        yielded = False
+        while True:
+            row = reader.read_until(b'</TR>')
+            if not row.endswith(b'</TR>'):
+                break
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield parse(rows)
+                rows = []
+                yielded = True
+        if rows or not yielded:
+            yield parse(rows)
+    elif data_tag.startswith(b'<BINARY'):
+        # BINARY or BINARY2 stream element
+        mode = 2 if data_tag.startswith(b'<BINARY2') else 1
+        reader.read_until(b'>')
+        empty = prefix + b'<DATA><TABLEDATA></TABLEDATA>' + suffix
+        table = votable.parse(io.BytesIO(empty)).get_first_table()
+        yield from _iter_binary_chunks(table, _Base64Reader(reader), mode,
+                                       chunk_size)
+    else:
+        # FITS serialization, not streamed
+        table = _read_table(prefix + b'<DATA' + data_tag + reader.read(),
+                            'votable')
+        yield from _iter_table_chunks(table, chunk_size)
+
+
+class _Base64Reader:
+    """Decodes the base64 content of a VOTable STREAM element"""
+
+    def __init__(self, reader):
+        self._reader = reader
+        self._pending = b''
+        self._decoded = b''
+        self._pos = 0
+        self._done = False
+
+    def _fill(self):
+        if self._done:
+            return False
+        text, found = self._reader.read_some_until(b'<')
+        if found or not text:
+            self._done = True
+        text = self._pending + b''.join(text.split())
+        usable = len(text) - len(text) % 4
+        self._pending = text[usable:]
+        try:
+            decoded = base64.b64decode(text[:usable])
+        except binascii.Error as ex:
+            raise ValueError(f"Invalid base64 stream: {ex}")
+        self._decoded = self._decoded[self._pos:] + decoded
+        self._pos = 0
+        return True
+
+    def read(self, size):
+        while len(self._decoded) - self._pos < size:
+            if not self._fill():
+                raise EOFError()
+        data = self._decoded[self._pos:self._pos + size]
+        self._pos += size
+        return data
+
+    def at_end(self):
+        while self._pos >= len(self._decoded):
+            if not self._fill():
+                return True
+        return False
+
+
+def _iter_binary_chunks(table, stream, mode, chunk_size):
+    """Decodes the rows of a BINARY (mode 1) or BINARY2 (mode 2) stream,
+    in the same way as astropy.io.votable"""
+    fields = table.fields
+    binparsers = [field.converter.binparse for field in fields]
+    # the masks of string columns are ignored, as in astropy.io.votable
+    string_columns = [field.datatype in ('char', 'unicodeChar')
+                      for field in fields]
+    nmask = (len(fields) + 7) // 8
+
+    def to_table(rows, masks):
+        table.create_arrays(nrows=len(rows))
+        for i, (row, mask) in enumerate(zip(rows, masks)):
+            table.array[i] = row
+            table.array.mask[i] = mask
+        return table.to_table()
+
+    rows = []
+    masks = []
+    yielded = False
+    while not stream.at_end():
+        if mode == 2:
+            nulls = list(converters.bitarray_to_bool(stream.read(nmask),
+                                                     len(fields)))
+        row = []
+        mask = []
+        for i, binparse in enumerate(binparsers):
+            value, value_mask = binparse(stream.read)
+            row.append(value)
+            if mode == 2:
+                value_mask = value_mask or (nulls[i] and not string_columns[i])
+            mask.append(value_mask)
+        rows.append(tuple(row))
+        masks.append(tuple(mask))
+        if len(rows) == chunk_size:
+            yield to_table(rows, masks)
+            rows = []
+            masks = []
+            yielded = True
+    if rows or not yielded:
+        yield to_table(rows, masks)
+
+
+def _iter_csv_chunks(reader, chunk_size):
+    header = reader.read_until(b'\n')
+
+    def parse(lines):
+        return _read_table(header + b''.join(lines), 'ascii.csv')
+
+    lines = []
+    record = b''
+    yielded = False
+    while True:
+        line = reader.read_until(b'\n')
+        if not line:
+            break
+        record += line
+        if record.count(b'"') % 2:
+            # new line within a quoted value
+            continue
+        if record.strip():
+            lines.append(record)
+        record = b''
+        if len(lines) == chunk_size:
+            yield parse(lines)
+            lines = []
+            yielded = True
+    if lines or not yielded:
+        yield parse(lines)
+
+
+def _read_fits_header(reader):
+    data = b''
+    while True:
+        block = reader.read(fits.Card.length * 36)
+        if len(block) < fits.Card.length * 36:
+            raise ValueError("Truncated FITS header")
+        data += block
+        cards = [block[i:i + fits.Card.length]
+                 for i in range(0, len(block), fits.Card.length)]
+        if any(card.rstrip() == b'END' for card in cards):
+            return data, fits.Header.fromstring(data.decode('ascii'))
+
+
+def _fits_data_size(header):
+    size = 0
+    if header.get('NAXIS', 0) > 0:
+        size = abs(header['BITPIX']) // 8
+        for i in range(1, header['NAXIS'] + 1):
+            size *= header[f'NAXIS{i}']
+    size += header.get('PCOUNT', 0)
+    return size
+
+
+def _fits_padding(size):
+    block = fits.Card.length * 36
+    return -size % block
+
+
+def _iter_fits_chunks(reader, chunk_size):
+    primary_bytes, primary = _read_fits_header(reader)
+    primary_size = _fits_data_size(primary)
+    primary_bytes += reader.read(primary_size + _fits_padding(primary_size))
+    _, header = _read_fits_header(reader)
+
+    variable_length = any('P' in str(value).upper() or 'Q' in str(value).upper()
+                          for key, value in header.items()
+                          if key.startswith('TFORM'))
+    if (header.get('XTENSION') != 'BINTABLE' or variable_length
+            or header.get('PCOUNT', 0)):
+        # not a table with fixed size rows: read everything
+        rest = reader.read()
+        table = _read_table(primary_bytes + header.tostring().encode('ascii') +
+                            rest, 'fits')
+        yield from _iter_table_chunks(table, chunk_size)
+        return
+
+    row_size = header['NAXIS1']
+    nrows = header['NAXIS2']
+
+    def parse(data, n):
+        chunk_header = header.copy()
+        chunk_header['NAXIS2'] = n
+        return _read_table(primary_bytes +
+                           chunk_header.tostring().encode('ascii') +
+                           data + b'\0' * _fits_padding(len(data)), 'fits')
+
+    if nrows == 0:
+        yield parse(b'', 0)
+    for start in range(0, nrows, chunk_size):
+        n = min(chunk_size, nrows - start)
+        data = reader.read(n * row_size)
+        if len(data) < n * row_size:
+            raise ValueError("Truncated FITS table")
+        yield parse(data, n)
+
+
 def get_suitable_astropy_format(outputFormat):
     if "csv" == outputFormat:
         return "ascii.csv"
@@ -0,0 +1,96 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Comparison of the tables parsed by the services with the tables given by
+reference implementations, shared by their tests and benchmarks.
+"""
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from astropy.io import ascii
+
+from ..timer import timefunc
+
+__all__ = ['reference_read_fixed_width', 'assert_columns_equal',
+           'assert_tables_equal', 'check_reference']
+
+
+def reference_read_fixed_width(content, **kwargs):
+    """
+    `~astroquery.utils.fixed_width.read_fixed_width` implemented with the
+    generic fixed-width reader of astropy.
+    """
+    return ascii.read(content, header_start=None, data_start=0,
+                      format='fixed_width', fast_reader=False, **kwargs)
+
+
+def assert_columns_equal(column, reference):
+    """
+    Check that ``column`` has the type, unit, mask and values of
+    ``reference``, including the values under the mask.
+    """
+    assert column.dtype == reference.dtype
+    assert getattr(column, 'unit', None) == getattr(reference, 'unit', None)
+    assert_array_equal(np.ma.getmaskarray(column), np.ma.getmaskarray(reference))
+    assert_array_equal(np.ma.getdata(column), np.ma.getdata(reference))
+
+
+def assert_tables_equal(table, reference):
+    """
+    Check that the columns of ``table`` are equal to those of ``reference``,
+    see `assert_columns_equal`, and that their meta are equal.
+    """
+    assert table.colnames == reference.colnames
+    assert table.meta == reference.meta
+    for name in table.colnames:
+        assert_columns_equal(table[name], reference[name])
+
+
+def check_reference(parse, monkeypatch, target, name, reference, num_tries=None):
+    """
+    Check that ``parse()`` gives the same tables as when the attribute
+    ``name`` of ``target`` is replaced by the ``reference`` implementation.
+
+    Parameters
+    ----------
+    parse : callable
+        Returns a table, or a list of tables.
+    monkeypatch : `~_pytest.monkeypatch.MonkeyPatch`
+        The fixture replacing the attribute.
+    target : object
+        The module or class whose attribute is replaced.
+    name : str
+        The name of the attribute.
+    reference : object
+        The reference implementation.
+    num_tries : int, optional
+        When given, both implementations are timed over ``num_tries`` calls
+        with `~astroquery.utils.timer.timefunc`, which logs their average
+        run time, as done by the benchmarks.
+
+    Returns
+    -------
+    result : `~astropy.table.Table` or list
+        The result of ``parse()``.
+    """
+    def parse_result():
+        return parse()
+
+    def parse_reference():
+        with monkeypatch.context() as mp:
+            mp.setattr(target, name, reference)
+            return parse()
+
+    if num_tries:
+        result = timefunc(num_tries=num_tries)(parse_result)()[1]
+        expected = timefunc(num_tries=num_tries)(parse_reference)()[1]
+    else:
+        result = parse_result()
+        expected = parse_reference()
+
+    if isinstance(result, list):
+        assert len(result) == len(expected)
+        for table, reference_table in zip(result, expected):
+            assert_tables_equal(table, reference_table)
+    else:
+        assert_tables_equal(result, expected)
+    return result
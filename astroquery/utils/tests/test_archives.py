@@ -0,0 +1,95 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from ..archives import iter_extract, extract
+
+MEMBERS = {'products/a.fits': b'a' * 3000,
+           'products/b.txt': b'b' * 10,
+           'products/sub/c.fits': b'c' * 5000}
+
+
+def _make_tar(members, mode='w'):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode=mode) as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return archive.getvalue()
+
+
+def _make_zip(members):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, content in members.items():
+            zip_ref.writestr(name, content)
+    return archive.getvalue()
+
+
+ARCHIVES = {'tar': _make_tar(MEMBERS),
+            'tar.gz': _make_tar(MEMBERS, mode='w:gz'),
+            'zip': _make_zip(MEMBERS)}
+
+
+def _source(kind, content, tmp_path):
+    if kind == 'path':
+        path = str(tmp_path / 'archive')
+        with open(path, 'wb') as archive:
+            archive.write(content)
+        return path
+    if kind == 'file':
+        return io.BufferedReader(io.BytesIO(content))
+    # blocks of various sizes, as returned by iter_content
+    return iter([content[:3], content[3:1000], content[1000:]])
+
+
+@pytest.mark.parametrize('archive', ARCHIVES)
+@pytest.mark.parametrize('kind', ['path', 'file', 'blocks'])
+def test_extract(archive, kind, tmp_path):
+    source = _source(kind, ARCHIVES[archive], tmp_path)
+    path = str(tmp_path / 'out')
+
+    paths = extract(source, path)
+
+    assert paths == [os.path.join(path, name) for name in MEMBERS]
+    for name, content in MEMBERS.items():
+        with open(os.path.join(path, name), 'rb') as extracted:
+            assert extracted.read() == content
+    # the archives read as streams are not left behind
+    assert sorted(os.listdir(tmp_path)) == (['archive', 'out'] if kind == 'path' else ['out'])
+
+
+@pytest.mark.parametrize('archive', ARCHIVES)
+@pytest.mark.parametrize('select', [r'.*\.fits$', lambda name: name.endswith('.fits')])
+def test_iter_extract_select(archive, select, tmp_path):
+    path = str(tmp_path)
+    extracted = sorted(iter_extract(io.BytesIO(ARCHIVES[archive]), path, select=select))
+
+    assert extracted == [('products/a.fits', os.path.join(path, 'products/a.fits')),
+                         ('products/sub/c.fits', os.path.join(path, 'products/sub/c.fits'))]
+    assert not os.path.exists(os.path.join(path, 'products/b.txt'))
+
+
+@pytest.mark.parametrize('archive', ARCHIVES)
+def test_iter_extract_save_to(archive, tmp_path):
+    save_to = str(tmp_path / 'archive')
+    blocks = iter([ARCHIVES[archive][:100], ARCHIVES[archive][100:]])
+
+    assert len(list(iter_extract(blocks, str(tmp_path / 'out'), select='products/b', save_to=save_to))) == 1
+    with open(save_to, 'rb') as saved:
+        assert saved.read() == ARCHIVES[archive]
+
+
+def test_extract_tar_ending_with_zip(tmp_path):
+    # zipfile.is_zipfile finds the index of the last member of such a tar archive
+    members = {'a.fits': b'a' * 100, 'b.zip': ARCHIVES['zip']}
+    path = str(tmp_path / 'archive.tar')
+    with open(path, 'wb') as archive:
+        archive.write(_make_tar(members))
+
+    assert extract(path, str(tmp_path)) == [os.path.join(str(tmp_path), name) for name in members]
@@ -0,0 +1,84 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from astropy.io import ascii
+from astropy.table import MaskedColumn
+
+from ..fixed_width import read_fixed_width
+
+NAMES = ('a', 'b', 'c')
+COL_STARTS = (0, 6, 14)
+
+TABLES = [
+    # integers, floats and strings
+    "   12  1.5e10  AB CD\n   -3 -2.25    EF\n",
+    # blank values are masked
+    "   12  1.5     x\n          2.\n    4          y\n",
+    # comments, blank lines and CRLF line endings
+    "THIS IS A COMMENT\r\n    1  2.0     a\r\n\r\n    2  3.0     b\r\nTHIS ONE TOO\r\n",
+    # records of different lengths
+    "    1  2.0     a long string\n    2\n",
+    # non-ASCII strings
+    "    1  2.0     ångström\n    2  3.0     ok\n",
+    # integers overflowing int64 are read as strings
+    "99999999999999999999  1\n    1                 2\n",
+]
+
+
+def _assert_tables_equal(table, reference):
+    assert table.colnames == reference.colnames
+    assert table.meta == reference.meta
+    for name in table.colnames:
+        assert isinstance(table[name], MaskedColumn) == isinstance(reference[name], MaskedColumn)
+        assert table[name].dtype == reference[name].dtype
+        assert_array_equal(table[name], reference[name])
+        if isinstance(reference[name], MaskedColumn):
+            assert_array_equal(table[name].mask, reference[name].mask)
+
+
+@pytest.mark.parametrize('content', TABLES)
+@pytest.mark.parametrize('as_bytes', [False, True])
+def test_read_fixed_width(content, as_bytes):
+    if as_bytes and not content.isascii():
+        pytest.skip("bytes are decoded as latin-1")
+    with warnings.catch_warnings(record=True) as reference_warnings:
+        warnings.simplefilter('always')
+        reference = ascii.read(content, format='fixed_width', header_start=None, data_start=0,
+                               names=NAMES, col_starts=COL_STARTS, comment='THIS',
+                               fast_reader=False)
+    if as_bytes:
+        content = content.encode('ascii')
+    with warnings.catch_warnings(record=True) as table_warnings:
+        warnings.simplefilter('always')
+        table = read_fixed_width(content, names=NAMES, col_starts=COL_STARTS, comment='THIS')
+
+    assert ([str(w.message) for w in table_warnings]
+            == [str(w.message) for w in reference_warnings])
+    _assert_tables_equal(table, reference)
+
+
+def test_read_fixed_width_dtypes():
+    content = ("  1.5D-03 7  AB \n"
+               "   2.5-10    CD \n"
+               " -3.0E+02 9     \n")
+    table = read_fixed_width(content, names=NAMES, col_starts=(0, 9, 11),
+                             col_ends=(9, 11, 16), dtypes=('f8', 'i4', 'S5'))
+
+    assert_array_equal(table['a'], [1.5e-3, 2.5e-10, -3e2])
+    assert table['b'].dtype == np.int32
+    assert_array_equal(table['b'].mask, [False, True, False])
+    assert_array_equal(table['b'].data.data[[0, 2]], [7, 9])
+    # strings are kept unstripped
+    assert_array_equal(table['c'], [b'  AB ', b'  CD ', b'     '])
+
+
+def test_read_fixed_width_empty():
+    table = read_fixed_width("THIS IS ONLY A COMMENT\n", names=NAMES, col_starts=COL_STARTS,
+                             comment='THIS')
+    assert len(table) == 0
+    assert table.colnames == list(NAMES)
+    assert table.meta['comments'] == ['IS ONLY A COMMENT']
@@ -0,0 +1,41 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import io
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from astropy.table import Table
+
+from ..mocks import MockResponse
+from ..responses import ResponseReader
+
+
+def _votable(nrows, tabledata_format):
+    table = Table({'a': np.arange(nrows), 'b': np.arange(nrows) / 2})
+    votable = io.BytesIO()
+    table.write(votable, format='votable', tabledata_format=tabledata_format)
+    return table, votable.getvalue()
+
+
+def test_find():
+    content = b'ERROR: head' + b' ' * 100 + b'MIDDLE' + b' ' * 100 + b'tail: ERROR'
+    reader = ResponseReader(MockResponse(content), sniff_size=20)
+
+    assert reader.find('MIDDLE', 'ERROR: head') == 'ERROR: head'
+    assert reader.find(b'tail: ERROR') == b'tail: ERROR'
+    # the middle of the body is not searched
+    assert reader.find('MIDDLE') is None
+    assert not reader.is_empty
+    assert ResponseReader(MockResponse(b'')).is_empty
+
+
+@pytest.mark.parametrize('tabledata_format', ['tabledata', 'binary', 'binary2'])
+def test_parse_votable_content(tabledata_format):
+    table, content = _votable(10, tabledata_format)
+    reader = ResponseReader(MockResponse(content))
+
+    assert reader.content is content
+    assert_array_equal(reader.parse_votable().get_first_table().to_table()['a'], table['a'])
+    # the body in memory can be read again
+    assert reader.open().read() == content
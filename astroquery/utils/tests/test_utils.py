@@ -1,11 +1,13 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import asyncio
 from collections import OrderedDict
 import os
 import requests
 import pytest
 import tempfile
 import textwrap
+import threading
 import urllib
 
 import astropy.coordinates as coord
@@ -16,6 +18,7 @@ from astropy.table import Table
 import astropy.utils.data as aud
 from astropy.utils.exceptions import AstropyDeprecationWarning
 
+from ...query import BaseQuery, conf
 from ...utils import chunk_read, chunk_report, class_or_instance, commons
 from ...utils.process_asyncs import async_to_sync_docstr, async_to_sync
 from ...utils.docstr_chompers import remove_sections, prepend_docstr_nosections
@@ -406,6 +409,46 @@ def test_payload_return(cls=DummyQuery):
     assert isinstance(result, str)
 
 
+def test_coroutine(cls=DummyQuery):
+    assert asyncio.iscoroutinefunction(DummyQuery.aquery.__wrapped__)
+    assert DummyQuery.aquery.__doc__.lstrip().startswith('Coroutine')
+
+    async def gather():
+        return await asyncio.gather(DummyQuery.aquery(get_query_payload=True),
+                                    DummyQuery().aquery(get_query_payload=False))
+
+    payload, result = asyncio.run(gather())
+    assert payload == dict(msg='payload returned')
+    assert result == 'needs to be parsed'
+
+
+def test_coroutine_concurrency():
+    # more concurrent queries than the threads of the default executor
+    # of the event loop
+    n_queries = 40
+    barrier = threading.Barrier(n_queries, timeout=10)
+
+    @async_to_sync
+    class BarrierQuery(BaseQuery):
+
+        def query_async(self):
+            """ docstr"""
+            return barrier.wait()
+
+        def _parse_result(self, response, verbose=False):
+            return response
+
+    query = BarrierQuery()
+
+    async def gather():
+        return await asyncio.gather(*[query.aquery() for _ in range(n_queries)])
+
+    with conf.set_temp('max_workers', n_queries):
+        results = asyncio.run(gather())
+    assert sorted(results) == list(range(n_queries))
+    assert query._session.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'] == n_queries
+
+
 fitsfilepath = os.path.join(os.path.dirname(__file__),
                             '../../sdss/tests/data/emptyfile.fits')
 
@@ -0,0 +1,6 @@
+version = '0.4.6.dev'
+githash = ''
+astropy_helpers_version = ''
+major, minor, bugfix = 0, 4, 6
+release = False
+debug = False
@@ -9,6 +9,7 @@ import re
 
 from io import BytesIO
 
+import numpy as np
 import astropy.units as u
 import astropy.coordinates as coord
 import astropy.table as tbl
@@ -380,44 +381,18 @@ class VizierClass(BaseQuery):
             target = commons.parse_coordinates(coordinates).transform_to(frame)
 
             if not target.isscalar:
-                center["-c"] = []
-                for pos in target:
-                    if frame == 'galactic':
-                        glon_deg = pos.l.to_string(unit="deg", decimal=True, precision=8)
-                        glat_deg = pos.b.to_string(unit="deg", decimal=True, precision=8,
-                                                   alwayssign=True)
-                        center["-c"] += ["G{}{}".format(glon_deg, glat_deg)]
-                    else:
-                        ra_deg = pos.ra.to_string(unit="deg", decimal=True, precision=8)
-                        dec_deg = pos.dec.to_string(unit="deg", decimal=True,
-                                                    precision=8, alwayssign=True)
-                        center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = _format_positions(target, frame)
                 columns += ["_q"]  # Always request reference to input table
             else:
-                if frame == 'galactic':
-                    glon = target.l.to_string(unit='deg', decimal=True, precision=8)
-                    glat = target.b.to_string(unit="deg", decimal=True, precision=8,
-                                              alwayssign=True)
-                    center["-c"] = "G{glon}{glat}".format(glon=glon, glat=glat)
-                else:
-                    ra = target.ra.to_string(unit='deg', decimal=True, precision=8)
-                    dec = target.dec.to_string(unit="deg", decimal=True, precision=8,
-                                               alwayssign=True)
-                    center["-c"] = "{ra}{dec}".format(ra=ra, dec=dec)
+                center["-c"] = _format_positions(target, frame)[0]
         elif isinstance(coordinates, tbl.Table):
             if (("_RAJ2000" in coordinates.keys()) and ("_DEJ2000" in
                                                         coordinates.keys())):
-                center["-c"] = []
                 sky_coord = coord.SkyCoord(coordinates["_RAJ2000"],
                                            coordinates["_DEJ2000"],
                                            unit=(coordinates["_RAJ2000"].unit,
                                                  coordinates["_DEJ2000"].unit))
-                for (ra, dec) in zip(sky_coord.ra, sky_coord.dec):
-                    ra_deg = ra.to_string(unit="deg", decimal=True,
-                                          precision=8)
-                    dec_deg = dec.to_string(unit="deg", decimal=True,
-                                            precision=8, alwayssign=True)
-                    center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = _format_positions(sky_coord, 'fk5')
                 columns += ["_q"]  # Always request reference to input table
             else:
                 raise ValueError("Table must contain '_RAJ2000' and "
@@ -795,6 +770,39 @@ def parse_vizier_votable(data, verbose=False, invalid='warn',
         return commons.TableList(table_dict)
 
 
+def _format_positions(coordinates, frame):
+    """
+    Returns the Vizier-formatted positions of coordinates, in decimal
+    degrees with 8 digits, e.g. ``299.59000000+35.20100000`` or
+    ``G71.33498700+3.06681100`` in the galactic frame.
+
+    The angles are converted to degrees as whole arrays and formatted in a
+    single pass, which is much faster than formatting each
+    `~astropy.coordinates.Angle` for long lists of targets.
+
+    Parameters
+    ----------
+    coordinates : `~astropy.coordinates.SkyCoord`
+        Scalar or array coordinates, already in ``frame``.
+    frame : str
+        'fk5', 'icrs' or 'galactic'
+
+    Returns
+    -------
+    positions : list of str
+    """
+    if frame == 'galactic':
+        prefix = 'G'
+        lon, lat = coordinates.l, coordinates.b
+    else:
+        prefix = ''
+        lon, lat = coordinates.ra, coordinates.dec
+    lon = np.atleast_1d(lon.to_value(u.deg)).tolist()
+    lat = np.atleast_1d(lat.to_value(u.deg)).tolist()
+    template = prefix + '%.8f%+.8f'
+    return [template % position for position in zip(lon, lat)]
+
+
 def _parse_angle(angle):
     """
     Returns the Vizier-formatted units and values for box/radius
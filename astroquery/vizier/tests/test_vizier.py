@@ -149,6 +149,35 @@ def test_query_regions(patch_post):
                                     catalog=["HIP", "NOMAD", "UCAC"])
 
 
+@pytest.mark.parametrize('frame', ['fk5', 'galactic'])
+def test_format_positions(frame):
+    targets = commons.ICRSCoordGenerator(ra=[299.590, 0.0001, 359.99999999],
+                                         dec=[35.201, -0.00000001, -89.5],
+                                         unit=(u.deg, u.deg)).transform_to(frame)
+    positions = vizier.core._format_positions(targets, frame)
+    lon, lat, prefix = ((targets.l, targets.b, 'G') if frame == 'galactic'
+                        else (targets.ra, targets.dec, ''))
+    # same formatting as Angle.to_string
+    expected = [prefix + lon_.to_string(unit='deg', decimal=True, precision=8)
+                + lat_.to_string(unit='deg', decimal=True, precision=8,
+                                 alwayssign=True)
+                for lon_, lat_ in zip(lon, lat)]
+    assert positions == expected
+    assert vizier.core._format_positions(targets[0], frame) == expected[:1]
+
+
+def test_query_regions_table_payload():
+    targets = Table({'_RAJ2000': [299.590, 299.90] * u.deg,
+                     '_DEJ2000': [35.201, -35.201] * u.deg})
+    payload = vizier.core.Vizier.query_region_async(
+        targets, radius=5 * u.arcsec, catalog="HIP", get_query_payload=True)
+    assert payload.endswith("-c=<<====AstroqueryList\n"
+                            "299.59000000+35.20100000\n"
+                            "299.90000000-35.20100000\n"
+                            "====AstroqueryList")
+    assert "-out.add=_q" in payload
+
+
 def test_query_object_async(patch_post):
     response = vizier.core.Vizier.query_object_async(
         "HD 226868", catalog=["NOMAD", "UCAC"])
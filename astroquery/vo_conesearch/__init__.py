@@ -25,6 +25,10 @@ class Conf(_config.ConfigNamespace):
         False,
         'If True, raise an error when the result violates the spec, '
         'otherwise issue warning(s).')
+    hedge = _config.ConfigItem(
+        1,
+        'Number of services queried concurrently when looking for the first '
+        'successful result; 1 queries them one after the other.')
 
 
 conf = Conf()
@@ -3,6 +3,7 @@
 
 # STDLIB
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # THIRD-PARTY
 import numpy as np
@@ -18,16 +19,18 @@ from .vo_async import AsyncBase
 from .core import ConeSearch, _validate_sr
 from .exceptions import ConeSearchError
 from ..exceptions import NoResultsWarning
+from ..query import conf as query_conf
 from ..utils.timer import timefunc, RunTimePredictor
 
 # Import configurable items declared in __init__.py
 from . import conf
 
 __all__ = ['AsyncConeSearch', 'conesearch', 'AsyncSearchAll', 'search_all',
-           'list_catalogs', 'predict_search', 'conesearch_timer']
+           'iter_search_all', 'list_catalogs', 'predict_search',
+           'conesearch_timer']
 
 # Skip these doctests
-__doctest_skip__ = ['AsyncConeSearch', 'AsyncSearchAll']
+__doctest_skip__ = ['AsyncConeSearch', 'AsyncSearchAll', 'iter_search_all']
 
 
 class AsyncConeSearch(AsyncBase):
@@ -81,7 +84,8 @@ class AsyncConeSearch(AsyncBase):
 
 def conesearch(center, radius, *, verb=1, catalog_db=None,
                verbose=True, cache=True, query_all=False,
-               return_astropy_table=True, use_names_over_ids=False):
+               return_astropy_table=True, use_names_over_ids=False,
+               hedge=None, timeout=None, max_workers=None):
     """
     Perform Cone Search and returns the result of the
     first successful query.
@@ -184,6 +188,22 @@ def conesearch(center, radius, *, verb=1, catalog_db=None,
         to be renamed by appending numbers to the end.  Otherwise
         (default), use the ID attributes as the column names.
 
+    hedge : int or `None`
+        Number of catalogs queried concurrently. When larger than 1,
+        the catalogs are tried in the order of the latency and health
+        recorded for their services during the session, and the first
+        successful result is returned. When not provided, uses
+        ``astroquery.vo_conesearch.conf.hedge``, which defaults to 1
+        (catalogs tried one after the other). Ignored with ``query_all``.
+
+    timeout : float or `None`
+        Time limit in seconds for each service to respond. When not
+        provided, uses ``astroquery.vo_conesearch.conf.timeout``.
+
+    max_workers : int or `None`
+        Number of services queried concurrently with ``query_all``.
+        When not provided, uses ``astroquery.query.conf.max_workers``.
+
     Returns
     -------
     obj : `astropy.table.Table` or `astropy.io.votable.tree.Table`
@@ -197,46 +217,29 @@ def conesearch(center, radius, *, verb=1, catalog_db=None,
 
     """
     n_timed_out = 0
-    service_type = conf.conesearch_dbname
-    catalogs = vos_catalog._get_catalogs(
-        service_type, catalog_db, cache=cache, verbose=verbose)
+    urls = _get_conesearch_urls(catalog_db, cache=cache, verbose=verbose)
+    if hedge is None:
+        hedge = conf.hedge
+
+    def request(url):
+        return _query_service(
+            url, center, radius, verb=verb, cache=cache, verbose=verbose,
+            return_astropy_table=return_astropy_table,
+            use_names_over_ids=use_names_over_ids, timeout=timeout)
+
     if query_all:
-        result = {}
+        results = dict(_iter_results(urls, request, max_workers=max_workers))
+        # keeping the order of the services
+        result = {results[url].url: results[url]
+                  for url in urls if url in results}
     else:
-        result = None
-
-    for name, catalog in catalogs:
-        if isinstance(catalog, str):
-            if catalog.startswith('http'):
-                url = catalog
-            else:
-                remote_db = vos_catalog.get_remote_catalog_db(
-                    service_type, cache=cache, verbose=verbose)
-                catalog = remote_db.get_catalog(catalog)
-                url = catalog['url']
-        else:
-            url = catalog['url']
-
-        if verbose:  # pragma: no cover
-            color_print('Trying {0}'.format(url), 'green')
-
-        try:
-            r = ConeSearch.query_region(
-                center, radius, verb=verb, cache=cache, verbose=verbose,
-                service_url=url, return_astropy_table=return_astropy_table,
-                use_names_over_ids=use_names_over_ids)
-        except Exception as e:
+        (_, result), errors = vos_catalog._first_valid_result(
+            urls, request, hedge=hedge)
+        for failed_url, e in errors:
             err_msg = str(e)
-            vo_warn(W25, (url, err_msg))
-            if not query_all and 'ConnectTimeoutError' in err_msg:
+            vo_warn(W25, (failed_url, err_msg))
+            if 'ConnectTimeoutError' in err_msg:
                 n_timed_out += 1
-        else:
-            if r is not None:
-                if query_all:
-                    result[r.url] = r
-                else:
-                    result = r
-                    break
 
     if result is None and n_timed_out > 0:
         err_msg = ('None of the available catalogs returned valid results.'
@@ -246,6 +249,51 @@ def conesearch(center, radius, *, verb=1, catalog_db=None,
     return result
 
 
+def _get_conesearch_urls(catalog_db, cache=True, verbose=True):
+    """Access URLs of the Cone Search services of ``catalog_db``."""
+    service_type = conf.conesearch_dbname
+    catalogs = vos_catalog._get_catalogs(
+        service_type, catalog_db, cache=cache, verbose=verbose)
+    return vos_catalog._get_catalog_urls(
+        service_type, catalogs, cache=cache, verbose=verbose)
+
+
+def _query_service(url, center, radius, *, verbose=True, **kwargs):
+    """Cone Search on the service at ``url``."""
+    if verbose:  # pragma: no cover
+        color_print('Trying {0}'.format(url), 'green')
+    return ConeSearch.query_region(center, radius, verbose=verbose,
+                                   service_url=url, **kwargs)
+
+
+def _iter_results(urls, request, max_workers=None):
+    """
+    Call ``request(url)`` for all the ``urls`` from a pool of
+    ``max_workers`` threads, and yield the ``(url, result)`` pairs of
+    the successful requests as they complete. The requests not started
+    yet are cancelled when the generator is closed.
+
+    """
+    if max_workers is None:
+        max_workers = query_conf.max_workers
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))))
+    futures = {executor.submit(request, url): url for url in urls}
+    try:
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                r = future.result()
+            except Exception as e:
+                vo_warn(W25, (url, str(e)))
+            else:
+                if r is not None:
+                    yield url, r
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 class AsyncSearchAll(AsyncBase):
     """
     Perform a Cone Search asynchronously, storing all results
@@ -300,6 +348,10 @@ def search_all(*args, **kwargs):
     Perform Cone Search and returns the results of
     all successful queries.
 
+    The services are queried concurrently, up to ``max_workers``
+    at a time. Use :func:`iter_search_all` to obtain the results
+    as they complete.
+
     .. warning::
 
         Could potentially take up significant run time and
@@ -327,6 +379,60 @@ def search_all(*args, **kwargs):
     return conesearch(*args, **kwargs)
 
 
+def iter_search_all(center, radius, *, verb=1, catalog_db=None,
+                    verbose=True, cache=True, return_astropy_table=True,
+                    use_names_over_ids=False, timeout=None, max_workers=None):
+    """
+    Perform Cone Search on all the services concurrently, and yield
+    the results of the successful queries as they complete.
+
+    The results can be used while the slower services are still being
+    queried. The queries not started yet are cancelled when the
+    iteration stops early.
+
+    Parameters
+    ----------
+    center, radius, verb, catalog_db, verbose, cache
+        See :func:`conesearch`.
+
+    return_astropy_table, use_names_over_ids, timeout, max_workers
+        See :func:`conesearch`.
+
+    Yields
+    ------
+    url : str
+        Access URL of the service.
+
+    result : `astropy.table.Table` or `astropy.io.votable.tree.Table`
+        Table from the service.
+
+    Raises
+    ------
+    ConeSearchError
+        When invalid inputs are passed into Cone Search.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> from astropy.coordinates import SkyCoord
+    >>> from astroquery.vo_conesearch import conesearch
+    >>> c = SkyCoord(6.0223 * u.degree, -72.0814 * u.degree)
+    >>> for url, tab in conesearch.iter_search_all(c, 0.05 * u.degree):
+    ...     print('{} has {} results'.format(url, len(tab)))
+
+    """
+    urls = _get_conesearch_urls(catalog_db, cache=cache, verbose=verbose)
+
+    def request(url):
+        return _query_service(
+            url, center, radius, verb=verb, cache=cache, verbose=verbose,
+            return_astropy_table=return_astropy_table,
+            use_names_over_ids=use_names_over_ids, timeout=timeout)
+
+    for url, r in _iter_results(urls, request, max_workers=max_workers):
+        yield r.url, r
+
+
 def list_catalogs(**kwargs):
     """
     Return the available Cone Search catalogs as a list of strings.
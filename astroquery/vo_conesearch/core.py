@@ -62,7 +62,7 @@ class ConeSearchClass(BaseQuery):
     def query_region(self, coordinates, radius, *, verb=1,
                      get_query_payload=False, cache=True, verbose=False,
                      service_url=None, return_astropy_table=True,
-                     use_names_over_ids=False):
+                     use_names_over_ids=False, timeout=None):
         """
         Perform Cone Search and returns the result of the
         first successful query.
@@ -130,6 +130,10 @@ class ConeSearchClass(BaseQuery):
             to be renamed by appending numbers to the end.  Otherwise
             (default), use the ID attributes as the column names.
 
+        timeout : float or `None`
+            Time limit in seconds for the service to respond. When not
+            provided, uses ``astroquery.vo_conesearch.conf.timeout``.
+
         Returns
         -------
         result : `astropy.table.Table` or `astropy.io.votable.tree.Table`
@@ -142,9 +146,12 @@ class ConeSearchClass(BaseQuery):
         if get_query_payload:
             return request_payload
 
+        if timeout is None:
+            timeout = conf.timeout
+
         url = _validate_url(service_url)
         response = self._request('GET', url, params=request_payload,
-                                 timeout=conf.timeout, cache=cache)
+                                 timeout=timeout, cache=cache)
         result = self._parse_result(response, url, pars=request_payload,
                                     verbose=verbose)
 
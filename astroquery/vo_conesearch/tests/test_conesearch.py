@@ -275,3 +275,47 @@ def test_validate_coord(c, ans):
     """Valid coordinates should not raise an error."""
     result = _validate_coord(c)
     np.testing.assert_allclose(result, ans)
+
+
+class TestSearchAllConcurrent:
+    """Test concurrent search of all services, with imitated services."""
+    delays = {'http://slow.edu/cs?': 0.3, 'http://fast.edu/cs?': 0,
+              'http://empty.edu/cs?': 0, 'http://dead.edu/cs?': None}
+
+    def query_region(self, center, radius, verbose=False, service_url=None,
+                     timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        delay = self.delays[service_url]
+        if delay is None:
+            raise OSError('service is down')
+        time.sleep(delay)
+        if 'empty' in service_url:
+            return None
+        result = Table({'ra': [0.]})
+        result.url = service_url
+        return result
+
+    @pytest.fixture(autouse=True)
+    def patch_query_region(self, monkeypatch):
+        self.timeouts = []
+        monkeypatch.setattr(ConeSearch, 'query_region', self.query_region)
+
+    def test_iter_search_all(self):
+        with pytest.warns(W25, match='service is down'):
+            results = list(conesearch.iter_search_all(
+                SCS_CENTER, SCS_RADIUS, catalog_db=list(self.delays),
+                verbose=False, timeout=5, max_workers=4))
+        # the results are yielded as they complete
+        assert [url for url, tab in results] == ['http://fast.edu/cs?',
+                                                 'http://slow.edu/cs?']
+        assert self.timeouts == [5] * 4
+
+    def test_search_all(self):
+        start = time.time()
+        with pytest.warns(W25):
+            results = conesearch.search_all(
+                SCS_CENTER, SCS_RADIUS, catalog_db=list(self.delays) * 2,
+                verbose=False, max_workers=8)
+        assert time.time() - start < 1
+        # in the order of the services
+        assert list(results) == ['http://slow.edu/cs?', 'http://fast.edu/cs?']
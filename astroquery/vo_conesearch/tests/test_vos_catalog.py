@@ -10,6 +10,8 @@ Tests for VO Service Catalog.
 """
 # STDLIB
 import os
+import threading
+import time
 
 # THIRD-PARTY
 import pytest
@@ -21,6 +23,7 @@ from astropy.utils.data import get_pkg_data_filename
 from ..exceptions import (VOSError, MissingCatalog, DuplicateCatalogName,
                           DuplicateCatalogURL)
 from ..validator import conf as validator_conf
+from .. import vos_catalog
 from ..vos_catalog import VOSCatalog, VOSDatabase
 
 __doctest_skip__ = ['*']
@@ -204,3 +207,82 @@ def test_db_from_registry():
 
     # Should have over 9k catalogs; Update test if this changes.
     assert len(db) > 9000
+
+
+class FakeServices:
+    """Services which fail, hang or answer after a delay."""
+    def __init__(self, delays):
+        self.delays = delays
+        self.requested = []
+        self.release = threading.Event()
+
+    def __call__(self, url):
+        self.requested.append(url)
+        delay = self.delays[url]
+        if delay is None:
+            raise OSError('{0} is down'.format(url))
+        if delay == 'hang':
+            self.release.wait(5)
+            raise OSError('{0} timed out'.format(url))
+        time.sleep(delay)
+        return 'table from {0}'.format(url)
+
+
+@pytest.fixture
+def service_health(monkeypatch):
+    health = vos_catalog._ServiceHealth()
+    monkeypatch.setattr(vos_catalog, '_service_health', health)
+    return health
+
+
+def test_first_valid_result_sequential(service_health):
+    services = FakeServices({'dead?': None, 'slow?': 0.05, 'fast?': 0})
+    (url, result), errors = vos_catalog._first_valid_result(
+        ['dead?', 'slow?', 'fast?'], services)
+    assert (url, result) == ('slow?', 'table from slow?')
+    assert [failed_url for failed_url, e in errors] == ['dead?']
+    assert services.requested == ['dead?', 'slow?']
+
+
+def test_first_valid_result_hedged(service_health):
+    services = FakeServices({'hung?': 'hang', 'dead?': None, 'slow?': 0.2, 'fast?': 0.01})
+    urls = ['hung?', 'dead?', 'slow?', 'fast?']
+
+    start = time.time()
+    (url, result), errors = vos_catalog._first_valid_result(urls, services, hedge=2)
+    # the dead service is replaced by the next ones, without waiting for the hung one
+    assert url == 'slow?'
+    assert time.time() - start < 2
+    assert [failed_url for failed_url, e in errors] == ['dead?']
+    assert 'fast?' not in services.requested
+
+    # the abandoned request is still recorded once it fails
+    services.release.set()
+    for _ in range(100):
+        if service_health.score('hung?')[0]:
+            break
+        time.sleep(0.01)
+
+    # the failed and slow services are tried last
+    assert service_health.sort(urls) == ['fast?', 'slow?', 'dead?', 'hung?']
+    (url, result), errors = vos_catalog._first_valid_result(urls, services, hedge=2)
+    assert url == 'fast?'
+
+
+def test_call_vo_service_hedged(service_health, monkeypatch):
+    services = FakeServices({'http://dead?': None, 'http://fast?': 0})
+    monkeypatch.setattr(vos_catalog, '_vo_service_request',
+                        lambda url, *args, **kwargs: services(url))
+
+    with pytest.warns(Warning, match='dead'):
+        result = vos_catalog.call_vo_service(
+            'conesearch_good', catalog_db=['http://dead?', 'http://fast?'],
+            verbose=False, hedge=2)
+    assert result == 'table from http://fast?'
+
+    services.delays['http://fast?'] = None
+    with pytest.raises(VOSError):
+        with pytest.warns(Warning):
+            vos_catalog.call_vo_service(
+                'conesearch_good', catalog_db=['http://dead?', 'http://fast?'],
+                verbose=False, hedge=2)
@@ -13,9 +13,12 @@ import json
 import os
 import re
 import socket
+import threading
+import time
 import urllib
 import warnings
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import deepcopy
 
 from astropy.io.votable import parse_single_table, table, tree
@@ -707,6 +710,169 @@ def _get_catalogs(service_type, catalog_db, **kwargs):
     return catalogs
 
 
+def _get_catalog_urls(service_type, catalogs, cache=True, verbose=True):
+    """
+    Access URLs of the ``(key, catalog)`` pairs returned by
+    :func:`_get_catalogs`, the catalog names being looked up in the
+    remote database of ``service_type`` catalogs.
+
+    """
+    urls = []
+    for name, catalog in catalogs:
+        if isinstance(catalog, str):
+            if catalog.startswith('http'):
+                url = catalog
+            else:
+                remote_db = get_remote_catalog_db(service_type, cache=cache,
+                                                  verbose=verbose)
+                catalog = remote_db.get_catalog(catalog)
+                url = catalog['url']
+        else:
+            url = catalog['url']
+        urls.append(url)
+    return urls
+
+
+class _ServiceHealth:
+    """
+    Latency and health of the services queried during the session.
+
+    The latency of each access URL is an exponential moving average of
+    the duration of its requests, and its health the number of its
+    consecutive failures. :meth:`sort` orders the URLs by health, then
+    by latency, to try the most responsive services first.
+
+    Parameters
+    ----------
+    smoothing : float
+        Weight of the latest duration in the moving average.
+
+    """
+    def __init__(self, smoothing=0.3):
+        self.smoothing = smoothing
+        self._latencies = {}
+        self._failures = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, url, duration, success):
+        """Record the ``duration`` of a request to ``url``."""
+        with self._lock:
+            latency = self._latencies.get(url, duration)
+            self._latencies[url] = (self.smoothing * duration
+                                    + (1 - self.smoothing) * latency)
+            if success:
+                self._failures.pop(url, None)
+            else:
+                self._failures[url] += 1
+
+    def score(self, url):
+        """
+        ``(consecutive failures, latency)`` of ``url``, the URLs not
+        queried yet scoring ``(0, 0)``.
+
+        """
+        with self._lock:
+            return self._failures.get(url, 0), self._latencies.get(url, 0)
+
+    def sort(self, urls):
+        """Order ``urls`` by score, keeping the order of equal scores."""
+        return sorted(urls, key=self.score)
+
+    def clear(self):
+        """Forget all the recorded requests."""
+        with self._lock:
+            self._latencies.clear()
+            self._failures.clear()
+
+
+_service_health = _ServiceHealth()
+
+
+def _first_valid_result(urls, request, hedge=1):
+    """
+    Call ``request(url)`` for each of the ``urls`` until one returns a
+    result other than `None`.
+
+    With ``hedge`` larger than 1, up to ``hedge`` requests are sent
+    concurrently, the URLs being tried in the order of their recorded
+    latency and health: the next URL is tried as soon as a request
+    fails, and the requests still pending are abandoned once a result
+    is found.
+
+    Parameters
+    ----------
+    urls : list of str
+
+    request : callable
+        Called with each URL, returns the result or raises an exception.
+
+    hedge : int
+        Number of concurrent requests.
+
+    Returns
+    -------
+    url, result
+        The first URL to give a result, and its result; `None` and `None`
+        if no URL did.
+
+    errors : list of tuple
+        ``(url, exception)`` for each failed request.
+
+    """
+    def timed_request(url):
+        start = time.time()
+        try:
+            result = request(url)
+        except Exception:
+            _service_health.record(url, time.time() - start, False)
+            raise
+        _service_health.record(url, time.time() - start, result is not None)
+        return result
+
+    errors = []
+    if hedge <= 1 or len(urls) <= 1:
+        for url in urls:
+            try:
+                result = timed_request(url)
+            except Exception as e:
+                errors.append((url, e))
+            else:
+                if result is not None:
+                    return (url, result), errors
+        return (None, None), errors
+
+    candidates = iter(_service_health.sort(urls))
+    executor = ThreadPoolExecutor(max_workers=min(hedge, len(urls)))
+    pending = {}
+    try:
+        for url in candidates:
+            pending[executor.submit(timed_request, url)] = url
+            if len(pending) == hedge:
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append((url, e))
+                else:
+                    if result is not None:
+                        return (url, result), errors
+                # replacing the failed request with the next candidate
+                for url in candidates:
+                    pending[executor.submit(timed_request, url)] = url
+                    break
+        return (None, None), errors
+    finally:
+        # the requests still running finish in the background
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 def _vo_service_request(url, pedantic, kwargs, cache=True, verbose=False):
     """
     This is called by :func:`call_vo_service`.
@@ -807,7 +973,7 @@ def vo_tab_parse(tab, url, kwargs):
 
 
 def call_vo_service(service_type, catalog_db=None, pedantic=None,
-                    verbose=True, cache=True, kwargs={}):
+                    verbose=True, cache=True, kwargs={}, hedge=None):
     """
     Makes a generic VO service call.
 
@@ -862,6 +1028,14 @@ def call_vo_service(service_type, catalog_db=None, pedantic=None,
         No checking is done that the arguments are accepted by
         the service, etc.
 
+    hedge : int or `None`
+        Number of catalogs queried concurrently. When larger than 1,
+        the catalogs are tried in the order of the latency and health
+        recorded for their services during the session, and the first
+        table returned is used. When not provided, uses the
+        configuration setting ``astroquery.vo_conesearch.conf.hedge``,
+        which defaults to 1 (catalogs tried one after the other).
+
     Returns
     -------
     obj : `astropy.io.votable.tree.Table`
@@ -876,32 +1050,27 @@ def call_vo_service(service_type, catalog_db=None, pedantic=None,
     n_timed_out = 0
     catalogs = _get_catalogs(service_type, catalog_db, cache=cache,
                              verbose=verbose)
+    urls = _get_catalog_urls(service_type, catalogs, cache=cache,
+                             verbose=verbose)
 
     if pedantic is None:  # pragma: no cover
         pedantic = conf.pedantic
+    if hedge is None:
+        hedge = conf.hedge
 
-    for name, catalog in catalogs:
-        if isinstance(catalog, str):
-            if catalog.startswith('http'):
-                url = catalog
-            else:
-                remote_db = get_remote_catalog_db(service_type, cache=cache,
-                                                  verbose=verbose)
-                catalog = remote_db.get_catalog(catalog)
-                url = catalog['url']
-        else:
-            url = catalog['url']
-
+    def request(url):
         if verbose:  # pragma: no cover
             color_print('Trying {0}'.format(url), 'green')
-
-        try:
-            return _vo_service_request(url, pedantic, kwargs, cache=cache,
-                                       verbose=verbose)
-        except Exception as e:
-            vo_warn(W25, (url, str(e)))
-            if hasattr(e, 'reason') and isinstance(e.reason, socket.timeout):
-                n_timed_out += 1
+        return _vo_service_request(url, pedantic, kwargs, cache=cache,
+                                   verbose=verbose)
+
+    (url, result), errors = _first_valid_result(urls, request, hedge=hedge)
+    for failed_url, e in errors:
+        vo_warn(W25, (failed_url, str(e)))
+        if hasattr(e, 'reason') and isinstance(e.reason, socket.timeout):
+            n_timed_out += 1
+    if result is not None:
+        return result
 
     err_msg = 'None of the available catalogs returned valid results.'
     if n_timed_out > 0: